@@ -73,6 +73,7 @@ def run_migrations_online():
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
+        # Migrations need a single connection; don't size a pool like the app engine.
         poolclass=pool.NullPool,
     )
 
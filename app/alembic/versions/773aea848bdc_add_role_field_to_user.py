@@ -20,6 +20,9 @@ depends_on = None
 # Create enum type for PostgreSQL
 role_enum = sa.Enum('ADMIN', 'MODERATOR', 'USER', 'GUEST', name='role')
 
+# Rows promoted per statement; keeps each UPDATE's WAL and lock footprint small.
+ROLE_BACKFILL_BATCH_SIZE = 5000
+
 
 def upgrade():
     # Create the enum type first
@@ -28,12 +31,38 @@ def upgrade():
     # Add the column with a default value for existing rows
     op.add_column('user', sa.Column('role', role_enum, nullable=False, server_default='USER'))
     
-    # Update superusers to have ADMIN role
-    op.execute("UPDATE \"user\" SET role = 'ADMIN' WHERE is_superuser = true")
-    
     # Remove the server default after migration (optional - keeps it cleaner)
     op.alter_column('user', 'role', server_default=None)
 
+    # Update superusers to have ADMIN role
+    if op.get_context().as_sql:
+        op.execute("UPDATE \"user\" SET role = 'ADMIN' WHERE is_superuser = true")
+        return
+
+    # Backfill in ctid batches, each committed on its own, so a large user
+    # table is not rewritten inside one long transaction.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            result = bind.execute(
+                sa.text(
+                    """
+                    WITH batch AS (
+                        SELECT ctid FROM "user"
+                        WHERE is_superuser = true AND role <> 'ADMIN'
+                        LIMIT :batch_size
+                        FOR UPDATE
+                    )
+                    UPDATE "user" SET role = 'ADMIN'
+                    FROM batch
+                    WHERE "user".ctid = batch.ctid
+                    """
+                ),
+                {"batch_size": ROLE_BACKFILL_BATCH_SIZE},
+            )
+            if result.rowcount == 0:
+                break
+
 
 def downgrade():
     op.drop_column('user', 'role')
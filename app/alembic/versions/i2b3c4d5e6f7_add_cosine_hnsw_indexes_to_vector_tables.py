@@ -0,0 +1,67 @@
+"""add cosine hnsw indexes to vector tables
+
+Revision ID: i2b3c4d5e6f7
+Revises: 2cc6996d93d3
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "i2b3c4d5e6f7"
+down_revision = "2cc6996d93d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        # 33567aa9bd58 dropped the GitHub HNSW index via autogenerate; restore it.
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS github_pr_vectors_embedding_hnsw_idx
+            ON github_pr_vectors
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+            """
+        )
+
+        # The Jira index was built with vector_l2_ops, which the planner cannot
+        # use for the cosine_distance ordering issued by the scoring queries.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS jira_issue_vectors_embedding_idx")
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS jira_issue_vectors_embedding_hnsw_idx
+            ON jira_issue_vectors
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+            """
+        )
+
+        # Pre-filter index for project + assignee scoped similarity searches.
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jira_issue_vectors_project_key_assignee_account_id
+            ON jira_issue_vectors (project_key, assignee_account_id)
+            """
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_jira_issue_vectors_project_key_assignee_account_id"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS jira_issue_vectors_embedding_hnsw_idx")
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS jira_issue_vectors_embedding_idx
+            ON jira_issue_vectors
+            USING hnsw (embedding vector_l2_ops)
+            WITH (m = 16, ef_construction = 64)
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS github_pr_vectors_embedding_hnsw_idx")
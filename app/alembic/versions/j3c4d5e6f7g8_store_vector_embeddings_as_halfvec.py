@@ -0,0 +1,52 @@
+"""store vector embeddings as halfvec
+
+Revision ID: j3c4d5e6f7g8
+Revises: i2b3c4d5e6f7
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "j3c4d5e6f7g8"
+down_revision = "i2b3c4d5e6f7"
+branch_labels = None
+depends_on = None
+
+VECTOR_TABLES = ("github_pr_vectors", "jira_issue_vectors")
+
+
+def _swap_embedding_type(column_type: str, opclass: str) -> None:
+    # The HNSW indexes are tied to the column type's operator class, so they
+    # have to be dropped before the ALTER and rebuilt afterwards.
+    with op.get_context().autocommit_block():
+        for table in VECTOR_TABLES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {table}_embedding_hnsw_idx")
+
+    for table in VECTOR_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN embedding TYPE {column_type}(1536) "
+            f"USING embedding::{column_type}(1536)"
+        )
+
+    with op.get_context().autocommit_block():
+        for table in VECTOR_TABLES:
+            op.execute(
+                f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {table}_embedding_hnsw_idx
+                ON {table}
+                USING hnsw (embedding {opclass})
+                WITH (m = 16, ef_construction = 64)
+                """
+            )
+
+
+def upgrade():
+    # FP16 halves the bytes HNSW traversal reads per neighbour; requires pgvector >= 0.7.
+    _swap_embedding_type("halfvec", "halfvec_cosine_ops")
+
+
+def downgrade():
+    _swap_embedding_type("vector", "vector_cosine_ops")
@@ -0,0 +1,42 @@
+"""add author created index to pr vectors
+
+Revision ID: k4d5e6f7g8h9
+Revises: j3c4d5e6f7g8
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "k4d5e6f7g8h9"
+down_revision = "j3c4d5e6f7g8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        # Serves the per-author pre-filter in scoring and newest-first author
+        # listings; supersedes the single-column author_id index.
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_github_pr_vectors_author_id_created_at
+            ON github_pr_vectors (author_id, created_at DESC)
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_github_pr_vectors_author_id")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_github_pr_vectors_author_id
+            ON github_pr_vectors (author_id)
+            """
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_github_pr_vectors_author_id_created_at"
+        )
@@ -0,0 +1,48 @@
+"""bound resource profile identity columns
+
+Revision ID: l5e6f7g8h9i0
+Revises: k4d5e6f7g8h9
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = "l5e6f7g8h9i0"
+down_revision = "k4d5e6f7g8h9"
+branch_labels = None
+depends_on = None
+
+# Atlassian account IDs are at most 128 characters.
+BOUNDED_COLUMNS = {
+    "jira_account_id": 128,
+    "jira_email": 255,
+    "github_login": 255,
+    "github_email": 255,
+}
+
+
+def upgrade():
+    for column, length in BOUNDED_COLUMNS.items():
+        op.alter_column(
+            "resource_profiles",
+            column,
+            existing_type=sqlmodel.sql.sqltypes.AutoString(),
+            type_=sa.String(length=length),
+            existing_nullable=True,
+        )
+
+
+def downgrade():
+    for column, length in BOUNDED_COLUMNS.items():
+        op.alter_column(
+            "resource_profiles",
+            column,
+            existing_type=sa.String(length=length),
+            type_=sqlmodel.sql.sqltypes.AutoString(),
+            existing_nullable=True,
+        )
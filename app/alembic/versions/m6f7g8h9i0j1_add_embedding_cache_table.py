@@ -0,0 +1,41 @@
+"""add embedding cache table
+
+Revision ID: m6f7g8h9i0j1
+Revises: l5e6f7g8h9i0
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from pgvector.sqlalchemy import HALFVEC
+
+
+# revision identifiers, used by Alembic.
+revision = "m6f7g8h9i0j1"
+down_revision = "l5e6f7g8h9i0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "embedding_cache",
+        sa.Column(
+            "model_name", sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False
+        ),
+        sa.Column(
+            "prompt_name", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False
+        ),
+        sa.Column(
+            "content_hash", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False
+        ),
+        sa.Column("embedding", HALFVEC(dim=1536), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("model_name", "prompt_name", "content_hash"),
+    )
+
+
+def downgrade():
+    op.drop_table("embedding_cache")
@@ -0,0 +1,39 @@
+"""add context hash to pr vectors
+
+Revision ID: n7g8h9i0j1k2
+Revises: m6f7g8h9i0j1
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = "n7g8h9i0j1k2"
+down_revision = "m6f7g8h9i0j1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "github_pr_vectors",
+        sa.Column(
+            "context_hash", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True
+        ),
+    )
+    # Backfill with the same sha256-of-UTF-8 digest the sync computes, so
+    # existing vectors are not re-embedded on the first run after upgrading.
+    op.execute(
+        """
+        UPDATE github_pr_vectors
+        SET context_hash = encode(sha256(convert_to(coalesce(context, ''), 'UTF8')), 'hex')
+        """
+    )
+
+
+def downgrade():
+    op.drop_column("github_pr_vectors", "context_hash")
@@ -0,0 +1,34 @@
+"""drop redundant jira project_key index
+
+Revision ID: o8h9i0j1k2l3
+Revises: n7g8h9i0j1k2
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "o8h9i0j1k2l3"
+down_revision = "n7g8h9i0j1k2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # project_key is the leading column of
+    # ix_jira_issue_vectors_project_key_assignee_account_id, which serves
+    # project-only filters too; the single-column index only costs writes.
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jira_issue_vectors_project_key")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jira_issue_vectors_project_key
+            ON jira_issue_vectors (project_key)
+            """
+        )
@@ -0,0 +1,51 @@
+"""store jira project keys as json
+
+Revision ID: p9i0j1k2l3m4
+Revises: o8h9i0j1k2l3
+Create Date: 2026-10-16 18:30:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "p9i0j1k2l3m4"
+down_revision = "o8h9i0j1k2l3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # "A, B,,C" -> ["A", "B", "C"]; blank values become NULL (sync all projects).
+    op.execute(
+        r"""
+        ALTER TABLE org_integrations_jira
+        ALTER COLUMN project_keys TYPE JSON
+        USING CASE
+            WHEN btrim(coalesce(project_keys, '')) = '' THEN NULL
+            ELSE to_json(array_remove(
+                regexp_split_to_array(btrim(project_keys), '\s*,\s*'), ''
+            ))
+        END
+        """
+    )
+
+
+def downgrade():
+    # USING cannot hold a subquery, so rebuild the CSV through a new column.
+    op.execute("ALTER TABLE org_integrations_jira ADD COLUMN project_keys_csv VARCHAR")
+    op.execute(
+        """
+        UPDATE org_integrations_jira
+        SET project_keys_csv = (
+            SELECT string_agg(key, ',')
+            FROM json_array_elements_text(project_keys) AS key
+        )
+        WHERE project_keys IS NOT NULL
+        """
+    )
+    op.execute("ALTER TABLE org_integrations_jira DROP COLUMN project_keys")
+    op.execute(
+        "ALTER TABLE org_integrations_jira RENAME COLUMN project_keys_csv TO project_keys"
+    )
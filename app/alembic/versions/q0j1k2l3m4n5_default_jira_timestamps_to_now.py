@@ -0,0 +1,35 @@
+"""default jira timestamps to now()
+
+Revision ID: q0j1k2l3m4n5
+Revises: p9i0j1k2l3m4
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "q0j1k2l3m4n5"
+down_revision = "p9i0j1k2l3m4"
+branch_labels = None
+depends_on = None
+
+JIRA_TABLES = (
+    "org_integrations_jira",
+    "jira_oauth_tokens",
+    "jira_issue_type_statuses",
+)
+
+
+def upgrade():
+    for table in JIRA_TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade():
+    for table in JIRA_TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(table, column, server_default=None)
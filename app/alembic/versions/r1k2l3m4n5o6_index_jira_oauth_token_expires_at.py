@@ -0,0 +1,31 @@
+"""index jira oauth token expires_at
+
+Revision ID: r1k2l3m4n5o6
+Revises: q0j1k2l3m4n5
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "r1k2l3m4n5o6"
+down_revision = "q0j1k2l3m4n5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        op.f("ix_jira_oauth_tokens_expires_at"),
+        "jira_oauth_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_jira_oauth_tokens_expires_at"), table_name="jira_oauth_tokens"
+    )
@@ -1,12 +1,10 @@
 """Token schemas."""
 
-from datetime import datetime
-
-from sqlmodel import SQLModel
+from pydantic import BaseModel, ConfigDict
 
 
 # JSON payload containing access token
-class Token(SQLModel):
+class Token(BaseModel):
     """Access token schema."""
 
     access_token: str
@@ -14,18 +12,23 @@ class Token(SQLModel):
 
 
 # Contents of JWT token
-class TokenPayload(SQLModel):
+class TokenPayload(BaseModel):
     """
     JWT token payload schema.
 
+    Built on every authenticated request, so it is a plain frozen model and
+    keeps the epoch-second ints PyJWT decodes instead of parsing datetimes.
+
     Fields:
         sub: User ID (subject)
-        exp: Expiration timestamp
-        iat: Issued at timestamp
+        exp: Expiration timestamp (epoch seconds)
+        iat: Issued at timestamp (epoch seconds)
         role: User's role
     """
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     sub: str | None = None
-    exp: datetime | None = None
-    iat: datetime | None = None
+    exp: int | None = None
+    iat: int | None = None
     role: str | None = None
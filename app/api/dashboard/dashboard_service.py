@@ -26,7 +26,9 @@ from app.api.dashboard.dashboard_schema import (
     TeamUtilizationCard,
     UserWorkload,
 )
-from app.api.embedding.embedding_model import JiraIssueVector
+from app.api.embedding.embedding_model import GitHubPRVector, JiraIssueVector
+from app.api.integrations.GitHub.github_model import GithubOrgIntBaseModel
+from app.api.integrations.Jira.jira_model import JiraOAuthToken
 from app.api.integrations.Jira.jira_service import JiraIntegrationService
 from app.api.knowledge_graph.kg_service import KnowledgeGraphService
 from app.api.profiles.profile_model import ResourceProfile
@@ -36,9 +38,6 @@ from app.core.config import settings
 
 def get_integration_health(session: Session) -> ConnectedIntegrationsCard:
     """Check Jira OAuth token and GitHub org integration status."""
-    from app.api.integrations.GitHub.github_model import GithubOrgIntBaseModel
-    from app.api.integrations.Jira.jira_model import JiraOAuthToken
-
     # --- Jira ---
     jira_token = session.exec(
         select(JiraOAuthToken).order_by(JiraOAuthToken.updated_at.desc())  # type: ignore[union-attr]
@@ -194,8 +193,6 @@ def get_dashboard_data(session: Session) -> DashboardResponse:
 
 def get_github_pr_stats(session: Session) -> GitHubPRStatsCard:
     """Get aggregated GitHub PR statistics."""
-    from app.api.embedding.embedding_model import GitHubPRVector
-
     # Total Active PRs
     total_prs = session.exec(select(func.count()).select_from(GitHubPRVector)).one()
 
@@ -228,8 +225,6 @@ def get_github_pr_stats(session: Session) -> GitHubPRStatsCard:
 
 def get_jira_task_stats(session: Session) -> JiraTaskStatsCard:
     """Get aggregated Jira task statistics."""
-    from app.api.embedding.embedding_model import JiraIssueVector
-
     # Total Active Tasks
     total_tasks = session.exec(select(func.count()).select_from(JiraIssueVector)).one()
 
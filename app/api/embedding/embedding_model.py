@@ -1,8 +1,8 @@
 from datetime import datetime
 from typing import Any
 
-from pgvector.sqlalchemy import Vector  # type: ignore[import-untyped]
-from sqlalchemy import JSON, Column, Text
+from pgvector.sqlalchemy import HALFVEC  # type: ignore[import-untyped]
+from sqlalchemy import JSON, Column, Index, Text, desc
 from sqlmodel import Field, SQLModel
 
 
@@ -10,6 +10,20 @@ class GitHubPRVector(SQLModel, table=True):
     """Model for storing GitHub PR embeddings."""
 
     __tablename__ = "github_pr_vectors"
+    __table_args__ = (
+        Index(
+            "github_pr_vectors_embedding_hnsw_idx",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+        Index(
+            "ix_github_pr_vectors_author_id_created_at",
+            "author_id",
+            desc("created_at"),
+        ),
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -19,16 +33,18 @@ class GitHubPRVector(SQLModel, table=True):
     pr_id: str = Field(unique=True, index=True)
     pr_number: int
     author_login: str = Field(index=True)
-    author_id: int = Field(index=True)
+    author_id: int
     pr_title: str
     pr_url: str
     pr_description: str | None = Field(default=None)
 
-    # Vector embedding for similarity search (HNSW index created in migration)
-    embedding: Vector = Field(sa_column=Column(Vector(dim=1536)))
+    # Half-precision embedding for similarity search (cosine HNSW index above)
+    embedding: HALFVEC = Field(sa_column=Column(HALFVEC(dim=1536)))
 
     # Original context text
     context: str = Field(sa_column=Column(Text))
+    # sha256 hex of ``context``; unchanged PRs are not re-embedded on re-sync
+    context_hash: str | None = Field(default=None, max_length=64)
     metadata_json: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON))
 
     created_at: datetime | None = Field(default_factory=datetime.utcnow)
@@ -39,17 +55,32 @@ class JiraIssueVector(SQLModel, table=True):
     """Model for storing Jira issue embeddings for NLP/similarity search."""
 
     __tablename__ = "jira_issue_vectors"
+    __table_args__ = (
+        Index(
+            "jira_issue_vectors_embedding_hnsw_idx",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+        Index(
+            "ix_jira_issue_vectors_project_key_assignee_account_id",
+            "project_key",
+            "assignee_account_id",
+        ),
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
     id: int | None = Field(default=None, primary_key=True)
     issue_id: str = Field(unique=True, index=True)
     issue_key: str = Field(index=True)
-    project_key: str = Field(index=True)
+    # Served by the (project_key, assignee_account_id) index above
+    project_key: str
     assignee_account_id: str | None = Field(default=None, index=True)
 
-    # Vector embedding for similarity search
-    embedding: Vector = Field(sa_column=Column(Vector(dim=1536)))
+    # Half-precision embedding for similarity search (cosine HNSW index above)
+    embedding: HALFVEC = Field(sa_column=Column(HALFVEC(dim=1536)))
 
     # Original context text used for embedding
     context: str = Field(sa_column=Column(Text))
@@ -57,3 +88,20 @@ class JiraIssueVector(SQLModel, table=True):
 
     created_at: datetime | None = Field(default_factory=datetime.utcnow)
     updated_at: datetime | None = Field(default_factory=datetime.utcnow)
+
+
+class EmbeddingCache(SQLModel, table=True):
+    """Content-addressed cache of document embeddings, keyed by model, prompt and text hash."""
+
+    __tablename__ = "embedding_cache"
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    model_name: str = Field(primary_key=True, max_length=255)
+    prompt_name: str = Field(default="", primary_key=True, max_length=64)
+    # SHA-256 hex digest of the input text
+    content_hash: str = Field(primary_key=True, max_length=64)
+
+    embedding: HALFVEC = Field(sa_column=Column(HALFVEC(dim=1536), nullable=False))
+
+    created_at: datetime | None = Field(default_factory=datetime.utcnow)
@@ -1,42 +1,50 @@
 """Vector search and sync API routes."""
 
-from typing import Any
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
+from app.api.embedding.embedding_service import VectorEmbeddingService
 from app.api.embedding.embedding_sync_service import (
     SyncAllRequest,
     SyncAllResponse,
-    run_sync_all_vectors,
+    arun_sync_all_vectors,
 )
+from app.api.embedding.similarity_search_service import SimilaritySearchService
 from app.api.integrations.GitHub.github_service import GithubIntegrationService
 from app.api.user.user_model import Role
+from app.core.config import settings
 from app.utils.deps import RoleChecker, SessionDep
 
 router = APIRouter(prefix="/vectors", tags=["Vector Embeddings"])
 
 
+def get_github_service(session: SessionDep) -> GithubIntegrationService:
+    return GithubIntegrationService(session)
+
+
+GithubServiceDep = Annotated[GithubIntegrationService, Depends(get_github_service)]
+
+
 @router.post(
     "/sync/author", dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))]
 )
-async def sync_author_vectors(
-    session: SessionDep,
+def sync_author_vectors(
+    service: GithubServiceDep,
     author_login: str,
     max_prs: int = 100,
 ) -> dict[str, Any]:
     """Sync PR vectors for a specific author."""
     try:
-        service = GithubIntegrationService(session)
-        # Get org members to find matching user
-        members = service.get_all_org_members()
-        author = next((m for m in members if m.login == author_login), None)
-
+        author = service.get_org_members_by_login().get(author_login)
         if not author:
             raise HTTPException(status_code=404, detail="Author not found")
 
         result = service.sync_author_prs_to_vectors(author, max_prs)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -76,13 +84,12 @@ async def sync_all_vectors(
     ```
     """
     request = request or SyncAllRequest()
-    return run_sync_all_vectors(session=session, request=request)
+    return await arun_sync_all_vectors(session=session, request=request)
 
 
-class UnifiedSearchRequest(BaseModel):
-    """Request schema for unified search across all sources."""
+class UnifiedSearchOptions(BaseModel):
+    """Result count, source selection and filters shared by unified searches."""
 
-    query: str = Field(..., description="Search query text")
     n_results: int = Field(
         default=10, ge=1, le=100, description="Max results to return"
     )
@@ -103,6 +110,20 @@ class UnifiedSearchRequest(BaseModel):
     )
 
 
+class UnifiedSearchRequest(UnifiedSearchOptions):
+    """Request schema for unified search across all sources."""
+
+    query: str = Field(..., description="Search query text")
+
+
+class UnifiedBatchSearchRequest(UnifiedSearchOptions):
+    """Request schema for running several unified searches at once."""
+
+    queries: list[str] = Field(
+        ..., min_length=1, max_length=20, description="Search query texts"
+    )
+
+
 class SearchResult(BaseModel):
     """Individual search result."""
 
@@ -123,3 +144,97 @@ class UnifiedSearchResponse(BaseModel):
     github_results: int
     jira_results: int
     results: list[SearchResult]
+
+
+def _to_search_response(
+    query: str, matches: list[dict[str, Any]]
+) -> UnifiedSearchResponse:
+    results = [
+        SearchResult(
+            source=match["source"],
+            id=match["id"],
+            title=match["title"],
+            url=match["url"],
+            author=match["author"],
+            context=match["context"],
+            created_at=(
+                match["created_at"].isoformat() if match["created_at"] else None
+            ),
+        )
+        for match in matches
+    ]
+    github_count = sum(1 for r in results if r.source == "github")
+    return UnifiedSearchResponse(
+        query=query,
+        total_results=len(results),
+        github_results=github_count,
+        jira_results=len(results) - github_count,
+        results=results,
+    )
+
+
+@router.post(
+    "/search/unified",
+    response_model=UnifiedSearchResponse,
+    dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
+)
+def unified_search(
+    session: SessionDep,
+    request: UnifiedSearchRequest,
+) -> UnifiedSearchResponse:
+    """Search GitHub PRs and Jira issues together, ranked by cosine similarity."""
+    try:
+        embedding_service = VectorEmbeddingService(session)
+        query_embedding = embedding_service.embed_query(
+            request.query,
+            prompt_name=settings.GITHUB_QUERY_PROMPT_NAME,
+        )
+
+        matches = SimilaritySearchService(session).unified_search(
+            query_embedding,
+            request.n_results,
+            search_github=request.search_github,
+            search_jira=request.search_jira,
+            github_author_login=request.github_author_login,
+            jira_project_key=request.jira_project_key,
+            jira_assignee_id=request.jira_assignee_id,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return _to_search_response(request.query, matches)
+
+
+@router.post(
+    "/search/unified/batch",
+    response_model=list[UnifiedSearchResponse],
+    dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
+)
+def unified_search_batch(
+    session: SessionDep,
+    request: UnifiedBatchSearchRequest,
+) -> list[UnifiedSearchResponse]:
+    """Run several unified searches with one embedding call and one query."""
+    try:
+        embedding_service = VectorEmbeddingService(session)
+        query_embeddings = embedding_service.embed_queries(
+            request.queries,
+            prompt_name=settings.GITHUB_QUERY_PROMPT_NAME,
+        )
+
+        matches_per_query = SimilaritySearchService(session).unified_search_batch(
+            query_embeddings,
+            request.n_results,
+            search_github=request.search_github,
+            search_jira=request.search_jira,
+            github_author_login=request.github_author_login,
+            jira_project_key=request.jira_project_key,
+            jira_assignee_id=request.jira_assignee_id,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return [
+        _to_search_response(query, matches)
+        for query, matches in zip(request.queries, matches_per_query, strict=True)
+    ]
@@ -1,29 +1,154 @@
+import functools
+import hashlib
+import json
 import logging
 import math
 import re
+import threading
 import time
 import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from typing import Any, cast
 
+import numpy as np
 import requests
+from numpy.typing import NDArray
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
-
-from app.api.embedding.embedding_model import GitHubPRVector
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from app.api.embedding.embedding_model import (
+    EmbeddingCache,
+    GitHubPRVector,
+    JiraIssueVector,
+)
 from app.api.integrations.GitHub.github_schema import GitHubUser, PullRequestContent
 from app.core.config import settings
+from app.db.session import engine
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT; keeps each statement far below Postgres'
+# 65535 bind-parameter limit for the widest vector table.
+VECTOR_INSERT_BATCH_SIZE = 1000
+
+# Above this many rows (initial loads), stream through COPY into a staging
+# table instead of binding every value into multi-row INSERTs.
+VECTOR_COPY_MIN_ROWS = 5000
+
+# Search and scoring re-embed the same query text often; remember the most
+# recent query vectors, keyed by (model, prompt_name, text).
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+_query_embedding_cache: OrderedDict[tuple[str, str | None, str], tuple[float, ...]] = (
+    OrderedDict()
+)
+_query_embedding_cache_lock = threading.Lock()
+
+# Characters dropped before embedding: C0/C1 controls other than \t, \n, \r,
+# plus zero-width and bidi marks (U+200B-U+200F, U+2028-U+202F, U+FEFF).
+_STRIP_CHARS_TABLE = dict.fromkeys(
+    [
+        *(c for c in range(0x20) if chr(c) not in "\t\n\r"),
+        *range(0x7F, 0xA0),
+        *range(0x200B, 0x2010),
+        *range(0x2028, 0x2030),
+        0xFEFF,
+    ]
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+CLEAN_TEXT_CACHE_SIZE = 1024
+
+LOCAL_ENCODE_BATCH_SIZE = 32
+_local_models: dict[str, Any] = {}
+_local_models_lock = threading.Lock()
+
+
+def _get_local_model(model_name: str) -> Any:
+    """Load a SentenceTransformer once per process; loading takes seconds and GBs."""
+    with _local_models_lock:
+        if model_name not in _local_models:
+            from sentence_transformers import SentenceTransformer
+
+            _local_models[model_name] = SentenceTransformer(model_name)
+        return _local_models[model_name]
+
+
+# Shared across batches and threads for keep-alive connection reuse.
+_jina_http = requests.Session()
+
+# Jina calls are capped process-wide, so parallel author syncs share one
+# request budget instead of each getting their own.
+JINA_MAX_IN_FLIGHT = 5
+# Upper bound on texts per Jina request. Batches are also cut by estimated
+# tokens so a single request never exceeds the per-minute token budget.
+JINA_EMBED_BATCH_SIZE = 128
+_jina_in_flight = threading.BoundedSemaphore(JINA_MAX_IN_FLIGHT)
+_jina_throttle_lock = threading.Lock()
+_jina_next_start = 0.0
+
+# Authors embedded and written concurrently by store_all_authors_pr_contexts.
+AUTHOR_SYNC_WORKERS = 4
+
+
+def _reserve_jina_slot(required_delay: float) -> float:
+    """Reserve the next request start time; returns seconds to sleep until it."""
+    global _jina_next_start
+    with _jina_throttle_lock:
+        start_at = max(_jina_next_start, time.monotonic())
+        _jina_next_start = start_at + required_delay
+    return start_at - time.monotonic()
+
+
+def _context_hash(context: str) -> str:
+    return hashlib.sha256(context.encode("utf-8")).hexdigest()
+
+
+def _copy_value(value: Any) -> Any:
+    """Render a row value for text-format COPY; vectors use pgvector's '[...]' literal."""
+    if isinstance(value, list | tuple | np.ndarray):
+        return "[" + ",".join(str(float(x)) for x in value) + "]"
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return value
+
 
 def is_retryable_error(exception: BaseException) -> bool:
     """Check if the exception corresponds to a retryable error (Connection, 429, 5xx)."""
     if isinstance(exception, requests.exceptions.HTTPError):
-        status_code = exception.response.status_code if exception.response else 0
+        # Response.__bool__ is False for 4xx/5xx, so compare against None.
+        status_code = (
+            exception.response.status_code if exception.response is not None else 0
+        )
         return status_code == 429 or status_code >= 500
     return isinstance(exception, requests.exceptions.RequestException)
 
 
+_exponential_wait = wait_exponential(multiplier=1, min=2, max=20)
+
+
+def wait_for_retry_after(retry_state: RetryCallState) -> float:
+    """Honor a 429 Retry-After header (capped at 60s), else back off exponentially."""
+    exception = retry_state.outcome.exception() if retry_state.outcome else None
+    if (
+        isinstance(exception, requests.exceptions.HTTPError)
+        and exception.response is not None
+    ):
+        retry_after = exception.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), 60.0)
+    return float(_exponential_wait(retry_state))
+
+
 class VectorEmbeddingService:
     def __init__(self, db: Session, use_api: bool = True):
         """
@@ -48,9 +173,7 @@ class VectorEmbeddingService:
         else:
             # Local embedding model
             try:
-                from sentence_transformers import SentenceTransformer
-
-                self.model = SentenceTransformer(settings.JINA_EMBEDDING_MODEL2)
+                self.model = _get_local_model(settings.JINA_EMBEDDING_MODEL2)
                 logger.debug(
                     f"Using local Jina model for embeddings: {settings.JINA_EMBEDDING_MODEL2}"
                 )
@@ -60,16 +183,143 @@ class VectorEmbeddingService:
                 )
 
     def generate_embeddings(
-        self, texts: list[str], prompt_name: str | None = None
+        self,
+        texts: list[str],
+        prompt_name: str | None = None,
+        use_cache: bool = False,
+    ) -> list[list[float]]:
+        """Generate embeddings using Jina (API or local).
+
+        With ``use_cache`` the embedding_cache table is consulted first and only
+        misses are embedded; new vectors are written back to the cache. Cache
+        reads and writes use their own short-lived session, never ``self.db``.
+        """
+        if not use_cache:
+            return self._embed_texts(texts, prompt_name)
+
+        hashes = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+        cached = self._load_cached_embeddings(set(hashes), prompt_name)
+        miss_indices = [i for i, digest in enumerate(hashes) if digest not in cached]
+
+        if miss_indices:
+            new_embeddings = self._embed_texts(
+                [texts[i] for i in miss_indices], prompt_name
+            )
+            new_entries = {
+                hashes[i]: embedding
+                for i, embedding in zip(miss_indices, new_embeddings, strict=True)
+            }
+            self._store_cached_embeddings(new_entries, prompt_name)
+            cached.update(new_entries)
+        else:
+            logger.debug(f"All {len(texts)} embeddings served from cache")
+
+        return [cached[digest] for digest in hashes]
+
+    def _embed_texts(
+        self, texts: list[str], prompt_name: str | None
     ) -> list[list[float]]:
-        """Generate embeddings using Jina (API or local)."""
+        raw_embeddings: list[list[float]] | NDArray[np.float32]
         if self.use_api:
             raw_embeddings = self._generate_embeddings_api(texts, prompt_name)
         else:
             raw_embeddings = self._generate_embeddings_local(texts, prompt_name)
 
         # Normalize shape early so downstream callers can assume consistent dimensions
-        return [self._normalize_embedding_dimension(emb) for emb in raw_embeddings]
+        return self._normalize_embedding_matrix(raw_embeddings)
+
+    @property
+    def _model_name(self) -> str:
+        return (
+            settings.JINA_EMBEDDING_MODEL1
+            if self.use_api
+            else settings.JINA_EMBEDDING_MODEL2
+        )
+
+    def _cache_session(self) -> Session:
+        # Callers release self.db before the slow embedding step; touching it
+        # here would reopen an idle transaction and tie cache failures to
+        # their pending work.
+        return Session(engine)
+
+    def _load_cached_embeddings(
+        self, hashes: set[str], prompt_name: str | None
+    ) -> dict[str, list[float]]:
+        cache = cast(Any, EmbeddingCache)
+        try:
+            with self._cache_session() as session:
+                rows = session.execute(
+                    select(cache.content_hash, cache.embedding).where(
+                        cache.model_name == self._model_name,
+                        cache.prompt_name == (prompt_name or ""),
+                        cache.content_hash.in_(hashes),
+                    )
+                ).all()
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed, embedding all texts: {e}")
+            return {}
+        return {row[0]: row[1].to_list() for row in rows}
+
+    def _store_cached_embeddings(
+        self, entries: dict[str, list[float]], prompt_name: str | None
+    ) -> None:
+        if not entries:
+            return
+        now = datetime.utcnow()
+        rows = [
+            {
+                "model_name": self._model_name,
+                "prompt_name": prompt_name or "",
+                "content_hash": digest,
+                "embedding": embedding,
+                "created_at": now,
+            }
+            for digest, embedding in entries.items()
+        ]
+        stmt = pg_insert(cast(Any, EmbeddingCache).__table__).on_conflict_do_nothing()
+        try:
+            with self._cache_session() as session, session.begin():
+                for start in range(0, len(rows), VECTOR_INSERT_BATCH_SIZE):
+                    batch = rows[start : start + VECTOR_INSERT_BATCH_SIZE]
+                    session.execute(stmt, batch)
+        except Exception as e:
+            # The embeddings are already computed; a cache miss next time is
+            # the only cost of failing here.
+            logger.warning(f"Failed to store {len(rows)} embeddings in cache: {e}")
+
+    def embed_query(self, text: str, prompt_name: str | None = None) -> list[float]:
+        """Embed a single search query, reusing recently computed vectors."""
+        return self.embed_queries([text], prompt_name=prompt_name)[0]
+
+    def embed_queries(
+        self, texts: list[str], prompt_name: str | None = None
+    ) -> list[list[float]]:
+        """Embed search queries, reusing cached vectors.
+
+        All cache misses are embedded together in one generate_embeddings call.
+        """
+        keys = [(self._model_name, prompt_name, text) for text in texts]
+        found: dict[tuple[str, str | None, str], list[float]] = {}
+        with _query_embedding_cache_lock:
+            for key in keys:
+                cached = _query_embedding_cache.get(key)
+                if cached is not None:
+                    _query_embedding_cache.move_to_end(key)
+                    found[key] = list(cached)
+
+        misses = list(dict.fromkeys(key for key in keys if key not in found))
+        if misses:
+            embeddings = self.generate_embeddings(
+                [key[2] for key in misses], prompt_name=prompt_name
+            )
+            with _query_embedding_cache_lock:
+                for key, embedding in zip(misses, embeddings, strict=True):
+                    _query_embedding_cache[key] = tuple(embedding)
+                    found[key] = embedding
+                while len(_query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+                    _query_embedding_cache.popitem(last=False)
+
+        return [list(found[key]) for key in keys]
 
     @staticmethod
     def _prompt_name_to_task(prompt_name: str | None) -> str | None:
@@ -84,29 +334,34 @@ class VectorEmbeddingService:
             return prompt_name
         return None
 
-    def _clean_text_for_embedding(self, text: str) -> str:
-        """Clean text to remove problematic characters for Jina API."""
+    @staticmethod
+    @functools.lru_cache(maxsize=CLEAN_TEXT_CACHE_SIZE)
+    def _clean_text_for_embedding(text: str) -> str:
+        """Clean text to remove problematic characters for Jina API.
+
+        Cached: PR templates and empty-body placeholders repeat across
+        authors and syncs, and the Unicode passes dominate the cost.
+        """
         if not text or not text.strip():
             return "Empty content"
 
         # Normalize Unicode characters
         text = unicodedata.normalize("NFKD", text)
 
-        # Remove control characters except newline, tab, carriage return
-        text = "".join(
-            char
-            for char in text
-            if unicodedata.category(char)[0] != "C" or char in "\n\t\r"
-        )
+        # Remove ASCII/C1 control characters (except newline, tab, carriage
+        # return) and zero-width characters in one C-level pass
+        text = text.translate(_STRIP_CHARS_TABLE)
 
-        # Remove zero-width characters
-        text = re.sub(r"[\u200b-\u200f\u2028-\u202f\ufeff]", "", text)
+        # Remaining format/private-use/surrogate code points are non-ASCII
+        if not text.isascii():
+            text = "".join(
+                char
+                for char in text
+                if unicodedata.category(char)[0] != "C" or char in "\n\t\r"
+            )
 
         # Replace multiple whitespace with single space
-        text = re.sub(r"\s+", " ", text)
-
-        # Ensure it's valid UTF-8
-        text = text.encode("utf-8", errors="ignore").decode("utf-8")
+        text = _WHITESPACE_RE.sub(" ", text)
 
         # Truncate if too long (Jina limit is 8192)
         if len(text) > 8000:
@@ -119,7 +374,7 @@ class VectorEmbeddingService:
     ) -> list[list[float]]:
         """Generate embeddings using Jina API with batching and rate limiting."""
         # Constants for rate limiting
-        batch_size = 30  # Conservative batch size
+        batch_size = JINA_EMBED_BATCH_SIZE
         rpm_limit = 100
         tpm_limit = 100000
         safety_margin = 0.8  # Use 80% to be very safe
@@ -128,31 +383,44 @@ class VectorEmbeddingService:
         min_request_interval = 60.0 / (rpm_limit * safety_margin)
         # (100000 * 0.8) / 60 = 1333 tokens/s
         tokens_per_second = (tpm_limit * safety_margin) / 60.0
+        # One request may spend at most a minute's worth of token budget.
+        max_batch_tokens = int(tpm_limit * safety_margin)
+
+        # Embed each distinct cleaned text once (empty bodies and PR templates
+        # repeat a lot), then scatter the vectors back to input positions.
+        unique_index: dict[str, int] = {}
+        inverse: list[int] = []
+        for text in texts:
+            cleaned = self._clean_text_for_embedding(text)
+            inverse.append(unique_index.setdefault(cleaned, len(unique_index)))
+        unique_texts = list(unique_index)
+        if len(unique_texts) < len(texts):
+            logger.debug(
+                f"Embedding {len(unique_texts)} unique texts for {len(texts)} inputs"
+            )
 
-        all_embeddings: list[list[float]] = []
-
-        for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i : i + batch_size]
-
-            # Clean texts first
-            cleaned_batch = [self._clean_text_for_embedding(t) for t in batch_texts]
-
-            # Estimate tokens (approx 4 chars per token)
-            total_chars = sum(len(t) for t in cleaned_batch)
-            estimated_tokens = math.ceil(total_chars / 4)
-
-            start_time = time.time()
+        # Cut batches by count and by estimated tokens (approx 4 chars per
+        # token), whichever limit is hit first.
+        batches: list[list[str]] = []
+        batch_starts: list[int] = []
+        batch_tokens = 0
+        for index, text in enumerate(unique_texts):
+            text_tokens = math.ceil(len(text) / 4)
+            if batches and (
+                len(batches[-1]) < batch_size
+                and batch_tokens + text_tokens <= max_batch_tokens
+            ):
+                batches[-1].append(text)
+                batch_tokens += text_tokens
+            else:
+                batches.append([text])
+                batch_starts.append(index)
+                batch_tokens = text_tokens
 
-            try:
-                batch_embeddings = self._call_jina_api_with_retry(
-                    cleaned_batch, prompt_name
-                )
-                all_embeddings.extend(batch_embeddings)
-            except Exception as e:
-                logger.error(
-                    f"Failed to process batch {i // batch_size} (indices {i}-{i + batch_size}): {str(e)}"
-                )
-                raise
+        def embed_batch(
+            batch_index: int, cleaned_batch: list[str]
+        ) -> list[list[float]]:
+            estimated_tokens = sum(math.ceil(len(t) / 4) for t in cleaned_batch)
 
             # Calculate rate limit delay
             # specific delay for tokens
@@ -160,20 +428,49 @@ class VectorEmbeddingService:
             # max of rpm delay and tpm delay
             required_delay = max(min_request_interval, token_delay)
 
-            elapsed = time.time() - start_time
-            sleep_time = required_delay - elapsed
-
+            # Reserve a start slot so concurrent batches still respect RPM/TPM.
+            sleep_time = _reserve_jina_slot(required_delay)
             if sleep_time > 0:
                 logger.debug(
                     f"Rate limiting: sleeping {sleep_time:.2f}s (tokens: {estimated_tokens})"
                 )
                 time.sleep(sleep_time)
 
-        return all_embeddings
+            try:
+                with _jina_in_flight:
+                    return self._call_jina_api_with_retry(cleaned_batch, prompt_name)
+            except Exception as e:
+                start = batch_starts[batch_index]
+                logger.error(
+                    f"Failed to process batch {batch_index} (indices {start}-{start + len(cleaned_batch)}): {str(e)}"
+                )
+                raise
+
+        if len(batches) <= 1:
+            unique_embeddings = embed_batch(0, batches[0]) if batches else []
+            return [unique_embeddings[i] for i in inverse]
+
+        # Overlap request latency across batches; results are stitched back in input order.
+        with ThreadPoolExecutor(
+            max_workers=min(JINA_MAX_IN_FLIGHT, len(batches))
+        ) as executor:
+            futures = [
+                executor.submit(embed_batch, index, batch)
+                for index, batch in enumerate(batches)
+            ]
+            try:
+                results = [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        unique_embeddings = [embedding for batch in results for embedding in batch]
+        return [unique_embeddings[i] for i in inverse]
 
     @retry(
         stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=2, max=20),
+        wait=wait_for_retry_after,
         retry=retry_if_exception(is_retryable_error),
     )
     def _call_jina_api_with_retry(
@@ -194,7 +491,7 @@ class VectorEmbeddingService:
             f"Calling Jina API with model: {self.embedding_model}, Batch size: {len(texts)}"
         )
 
-        response = requests.post(
+        response = _jina_http.post(
             self.api_url, json=payload, headers=headers, timeout=60
         )
 
@@ -209,7 +506,7 @@ class VectorEmbeddingService:
         ):
             logger.warning(f"Jina API rejected task='{task}', retrying without task")
             payload.pop("task", None)
-            response = requests.post(
+            response = _jina_http.post(
                 self.api_url, json=payload, headers=headers, timeout=60
             )
 
@@ -232,25 +529,36 @@ class VectorEmbeddingService:
 
     def _generate_embeddings_local(
         self, texts: list[str], prompt_name: str | None = None
-    ) -> list[list[float]]:
-        """Generate embeddings using local Jina model."""
+    ) -> NDArray[np.float32]:
+        """Generate embeddings using local Jina model.
+
+        Returns the float32 matrix from ``encode`` as-is; it is only converted
+        to Python lists once, after dimension normalization.
+        """
+        # Same cleaning/truncation as the API path. encode() already groups
+        # texts by length, so capping the longest inputs is what bounds the
+        # padding in each mini-batch.
+        cleaned_texts = [self._clean_text_for_embedding(t) for t in texts]
+        encode_kwargs: dict[str, Any] = {
+            "batch_size": LOCAL_ENCODE_BATCH_SIZE,
+            "show_progress_bar": True,
+            "convert_to_numpy": True,
+        }
         try:
             if prompt_name:
                 try:
                     embeddings = self.model.encode(
-                        texts,
-                        show_progress_bar=True,
-                        prompt_name=prompt_name,
+                        cleaned_texts, prompt_name=prompt_name, **encode_kwargs
                     )
                 except TypeError:
                     logger.warning(
                         f"Local model encode does not support prompt_name='{prompt_name}', falling back to default encode"
                     )
-                    embeddings = self.model.encode(texts, show_progress_bar=True)
+                    embeddings = self.model.encode(cleaned_texts, **encode_kwargs)
             else:
-                embeddings = self.model.encode(texts, show_progress_bar=True)
+                embeddings = self.model.encode(cleaned_texts, **encode_kwargs)
             logger.info(f"Generated {len(embeddings)} embeddings locally")
-            return cast(list[list[float]], embeddings.tolist())
+            return cast(NDArray[np.float32], embeddings)
         except Exception as e:
             logger.error(f"Error generating local embeddings: {str(e)}")
             raise
@@ -259,36 +567,54 @@ class VectorEmbeddingService:
         self, author: GitHubUser, pr_contents: list[PullRequestContent]
     ) -> int:
         """Store PR contexts with embeddings in pgvector. Returns count of successfully stored PRs."""
+        return self.store_pr_contexts_batch(pr_contents, label=author.login)
+
+    def store_pr_contexts_batch(
+        self, pr_contents: list[PullRequestContent], label: str
+    ) -> int:
+        """Store PR contexts from any number of authors in one embedding pass.
+
+        Rows carry their own author, so callers holding PRs for several
+        authors (e.g. one repo's worth) get full Jina batches instead of one
+        small request per author. ``label`` only names the batch in logs.
+        """
         if not pr_contents:
-            logger.info(f"No PR contexts to store for author {author.login}")
+            logger.info(f"No PR contexts to store for {label}")
             return 0
 
-        # Filter out PRs that are already embedded to save API calls
+        # Skip PRs whose stored context is unchanged to save API calls
         pr_ids = [str(pr.id) for pr in pr_contents]
-        existing_pr_ids: set[str] = set()
+        context_hashes = {
+            str(pr.id): _context_hash(pr.context or "") for pr in pr_contents
+        }
+        existing_hashes: dict[str, str | None] = {}
 
         try:
-            # Query existing PR IDs efficiently
+            # Query existing PR IDs and context hashes efficiently
             pr_id_column = cast(Any, GitHubPRVector.pr_id)
             existing_records = (
-                self.db.query(pr_id_column).filter(pr_id_column.in_(pr_ids)).all()
+                self.db.query(pr_id_column, cast(Any, GitHubPRVector.context_hash))
+                .filter(pr_id_column.in_(pr_ids))
+                .all()
             )
-            existing_pr_ids = {r[0] for r in existing_records}
+            existing_hashes = {r[0]: r[1] for r in existing_records}
         except Exception as e:
             logger.warning(
                 f"Failed to check existing PRs, proceeding with full list: {e}"
             )
             self.db.rollback()
 
-        # Keep only new PRs
+        # Keep new PRs and PRs whose context changed since they were embedded
         new_pr_contents = [
-            pr for pr in pr_contents if str(pr.id) not in existing_pr_ids
+            pr
+            for pr in pr_contents
+            if existing_hashes.get(str(pr.id)) != context_hashes[str(pr.id)]
         ]
         skipped_count = len(pr_contents) - len(new_pr_contents)
 
         if skipped_count > 0:
             logger.info(
-                f"Skipped {skipped_count} existing PR embeddings for {author.login}. Processing {len(new_pr_contents)} new PRs."
+                f"Skipped {skipped_count} unchanged PR embeddings for {label}. Processing {len(new_pr_contents)} new or changed PRs."
             )
 
         if not new_pr_contents:
@@ -303,11 +629,12 @@ class VectorEmbeddingService:
             valid_embeddings = self.generate_embeddings(
                 pr_contexts,
                 prompt_name=settings.GITHUB_DOCUMENT_PROMPT_NAME,
+                use_cache=True,
             )
             embeddings = cast(list[list[float] | None], valid_embeddings)
         except Exception as e:
             logger.warning(
-                f"Batch embedding failed for {author.login}, processing individually: {str(e)}"
+                f"Batch embedding failed for {label}, processing individually: {str(e)}"
             )
             embeddings = []
             for i, doc in enumerate(pr_contexts):
@@ -350,56 +677,167 @@ class VectorEmbeddingService:
                             )
                         except Exception as final_error:
                             logger.error(
-                                f"Final failure to embed PR {new_pr_contents[i].number} for {author.login}: {str(final_error)}"
+                                f"Final failure to embed PR {new_pr_contents[i].number} for {label}: {str(final_error)}"
                             )
                             embeddings.append(None)
 
-        success_count = 0
-        # Store in database
-        for pr, embedding in zip(new_pr_contents, embeddings, strict=False):
-            if embedding is None:
-                continue
-
-            try:
-                with self.db.begin_nested():
-                    db_pr_vector = GitHubPRVector(
-                        pr_id=str(pr.id),
-                        pr_number=pr.number,
-                        author_login=pr.author.login,
-                        author_id=pr.author.id,
-                        repo_id=pr.repo_id,
-                        repo_name=pr.repo_name or "",
-                        pr_title=pr.title,
-                        pr_url=str(pr.html_url),
-                        pr_description=pr.body or "",
-                        embedding=embedding,
-                        context=pr.context or "",
-                        metadata_json={
-                            "changed_files": pr.changed_files or [],
-                            "labels": pr.labels or [],
-                        },
-                    )
-                    self.db.add(db_pr_vector)
-                    self.db.flush()
-                logger.debug(f"Created PR {pr.number}")
-
-                success_count += 1
-
-            except Exception as e:
-                logger.error(f"Error storing PR {pr.number}: {str(e)}")
-                continue
+        now = datetime.utcnow()
+        rows = [
+            {
+                "pr_id": str(pr.id),
+                "pr_number": pr.number,
+                "author_login": pr.author.login,
+                "author_id": pr.author.id,
+                "repo_id": pr.repo_id,
+                "repo_name": pr.repo_name or "",
+                "pr_title": pr.title,
+                "pr_url": str(pr.html_url),
+                "pr_description": pr.body or "",
+                "embedding": embedding,
+                "context": pr.context or "",
+                "context_hash": context_hashes[str(pr.id)],
+                "metadata_json": {
+                    "changed_files": pr.changed_files or [],
+                    "labels": pr.labels or [],
+                },
+                "created_at": now,
+                "updated_at": now,
+            }
+            for pr, embedding in zip(new_pr_contents, embeddings, strict=False)
+            if embedding is not None
+        ]
 
         try:
+            success_count = self.upsert_vectors_isolating_failures(
+                GitHubPRVector, rows, "pr_id"
+            )
             self.db.commit()
         except Exception as e:
-            logger.error(f"Error committing PR vectors for {author.login}: {str(e)}")
+            logger.error(f"Error storing PR vectors for {label}: {str(e)}")
             self.db.rollback()
             raise
 
-        logger.info(f"Stored {success_count} new PR vectors for {author.login}")
+        logger.info(f"Stored {success_count} new PR vectors for {label}")
         # Return total processed (skipped + newly stored) so the caller gets accurate "synced" count
         return success_count + skipped_count
 
+    def bulk_insert_vectors(
+        self,
+        model: type[GitHubPRVector] | type[JiraIssueVector],
+        rows: list[dict[str, Any]],
+        conflict_column: str,
+    ) -> int:
+        """Upsert vector rows using multi-row INSERT ... ON CONFLICT statements.
+
+        Rows must share the same keys. Existing rows (matched on
+        ``conflict_column``) get their payload columns refreshed. The caller
+        is responsible for committing.
+        """
+        if not rows:
+            return 0
+
+        if len(rows) >= VECTOR_COPY_MIN_ROWS:
+            return self._copy_upsert_vectors(model, rows, conflict_column)
+
+        stmt = pg_insert(cast(Any, model).__table__)
+        update_columns = {
+            key: stmt.excluded[key]
+            for key in rows[0]
+            if key not in (conflict_column, "created_at", "updated_at")
+        }
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[conflict_column],
+            set_={**update_columns, "updated_at": func.now()},
+        )
+
+        for start in range(0, len(rows), VECTOR_INSERT_BATCH_SIZE):
+            self.db.execute(stmt, rows[start : start + VECTOR_INSERT_BATCH_SIZE])
+        return len(rows)
+
+    def upsert_vectors_isolating_failures(
+        self,
+        model: type[GitHubPRVector] | type[JiraIssueVector],
+        rows: list[dict[str, Any]],
+        conflict_column: str,
+    ) -> int:
+        """Bulk upsert inside a SAVEPOINT, falling back to one SAVEPOINT per row.
+
+        A single bad row then costs only itself instead of the whole batch.
+        Returns the number of rows stored; the caller commits.
+        """
+        try:
+            with self.db.begin_nested():
+                return self.bulk_insert_vectors(model, rows, conflict_column)
+        except Exception as e:
+            logger.warning(
+                f"Bulk upsert of {len(rows)} vectors failed, retrying row by row: {e}"
+            )
+
+        stored = 0
+        for row in rows:
+            try:
+                with self.db.begin_nested():
+                    self.bulk_insert_vectors(model, [row], conflict_column)
+                stored += 1
+            except Exception as e:
+                logger.error(f"Skipping vector {row[conflict_column]}: {e}")
+        return stored
+
+    def _copy_upsert_vectors(
+        self,
+        model: type[GitHubPRVector] | type[JiraIssueVector],
+        rows: list[dict[str, Any]],
+        conflict_column: str,
+    ) -> int:
+        """COPY rows into a temp table, then upsert them with one INSERT ... SELECT."""
+        table = cast(Any, model).__table__.name
+        columns = list(rows[0])
+        column_list = ", ".join(columns)
+        updates = ", ".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in columns
+            if column not in (conflict_column, "created_at", "updated_at")
+        )
+
+        raw_connection = cast(Any, self.db.connection().connection.driver_connection)
+        with raw_connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE vector_staging ON COMMIT DROP AS "
+                f"SELECT {column_list} FROM {table} WITH NO DATA"
+            )
+            with cursor.copy(f"COPY vector_staging ({column_list}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row([_copy_value(row[column]) for column in columns])
+            cursor.execute(
+                f"INSERT INTO {table} ({column_list}) "
+                f"SELECT {column_list} FROM vector_staging "
+                f"ON CONFLICT ({conflict_column}) DO UPDATE "
+                f"SET {updates}, updated_at = now()"
+            )
+            cursor.execute("DROP TABLE vector_staging")
+        return len(rows)
+
+    def _normalize_embedding_matrix(
+        self, embeddings: list[list[float]] | NDArray[np.float32]
+    ) -> list[list[float]]:
+        """Pad/truncate a batch of embeddings to the configured dimension in one pass."""
+        if len(embeddings) == 0:
+            return []
+
+        target_dim = settings.EMBEDDING_DIMENSION
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        current_dim = matrix.shape[1]
+
+        if current_dim < target_dim:
+            matrix = np.pad(matrix, ((0, 0), (0, target_dim - current_dim)))
+        elif current_dim > target_dim:
+            logger.warning(
+                f"Embedding size {current_dim} exceeds {target_dim}, truncating"
+            )
+            matrix = matrix[:, :target_dim]
+
+        return cast(list[list[float]], matrix.tolist())
+
     def _normalize_embedding_dimension(self, embedding: list[float]) -> list[float]:
         """Normalize embedding to configured dimensions (default 1536)."""
         target_dim = settings.EMBEDDING_DIMENSION
@@ -418,14 +856,51 @@ class VectorEmbeddingService:
             return embedding[:target_dim]
 
     def store_all_authors_pr_contexts(
-        self, authors_prs: dict[str, list[PullRequestContent]]
-    ) -> None:
-        """Store PR contexts for all authors."""
+        self,
+        authors_prs: dict[str, list[PullRequestContent]],
+        session_factory: Callable[[], Session] | None = None,
+    ) -> tuple[int, list[str]]:
+        """Store PR contexts for all authors.
+
+        Authors run on a small thread pool so one author's Jina latency
+        overlaps the next author's; each worker gets its own session from
+        ``session_factory`` and commits independently.
+
+        Returns the number of PRs stored and one error message per author
+        whose PRs could not be stored.
+        """
+        authors = [prs for prs in authors_prs.values() if prs]
         total_stored = 0
-        for _author_login, pr_contents in authors_prs.items():
-            if pr_contents:
-                author = pr_contents[0].author
-                stored_count = self.store_pr_contexts(author, pr_contents)
-                total_stored += stored_count
+        failures: list[str] = []
+
+        if len(authors) <= 1:
+            for prs in authors:
+                try:
+                    total_stored += self.store_pr_contexts(prs[0].author, prs)
+                except Exception as e:
+                    failures.append(f"{prs[0].author.login}: {e}")
+        else:
+            make_session = session_factory or (lambda: Session(engine))
+
+            def store_author(pr_contents: list[PullRequestContent]) -> int:
+                with make_session() as session:
+                    worker = VectorEmbeddingService(session, use_api=self.use_api)
+                    return worker.store_pr_contexts(pr_contents[0].author, pr_contents)
+
+            with ThreadPoolExecutor(
+                max_workers=min(AUTHOR_SYNC_WORKERS, len(authors))
+            ) as executor:
+                futures = {
+                    executor.submit(store_author, prs): prs[0].author.login
+                    for prs in authors
+                }
+                for future in as_completed(futures):
+                    try:
+                        total_stored += future.result()
+                    except Exception as e:
+                        failures.append(f"{futures[future]}: {e}")
 
+        for failure in failures:
+            logger.error(f"Failed to store PR contexts for {failure}")
         logger.info(f"Total PRs stored: {total_stored}")
+        return total_stored, failures
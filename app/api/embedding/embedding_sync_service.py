@@ -1,12 +1,18 @@
 """Reusable embedding sync workflow shared by sync endpoints and background tasks."""
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from sqlalchemy.orm import Session
 
 from app.api.integrations.GitHub.github_service import GithubIntegrationService
+from app.api.integrations.Jira.jira_schema import (
+    JiraSyncResponse,
+    dedupe_project_keys,
+)
+from app.db.session import engine
 
 
 class SyncAllRequest(BaseModel):
@@ -18,7 +24,9 @@ class SyncAllRequest(BaseModel):
         default=50, ge=1, le=500, description="Max PRs to fetch per GitHub author"
     )
     jira_project_keys: list[str] | None = Field(
-        default=None, description="Specific Jira projects to sync (None = all)"
+        default=None,
+        max_length=200,
+        description="Specific Jira projects to sync (None = all)",
     )
     jira_max_issues: int = Field(
         default=100, ge=1, le=1000, description="Max Jira issues to fetch per project"
@@ -30,6 +38,11 @@ class SyncAllRequest(BaseModel):
         default=True, description="Sync Jira issue comments"
     )
 
+    @field_validator("jira_project_keys")
+    @classmethod
+    def normalize_jira_project_keys(cls, value: list[str] | None) -> list[str] | None:
+        return dedupe_project_keys(value)
+
 
 class SyncAllResponse(BaseModel):
     """Response schema for sync all operation."""
@@ -41,12 +54,35 @@ class SyncAllResponse(BaseModel):
     errors: list[str] = Field(default_factory=list)
 
 
-def run_sync_all_vectors(
+def _sync_github(session: Session, request: SyncAllRequest) -> dict[str, Any]:
+    github_service = GithubIntegrationService(session)
+    return github_service.sync_all_authors_prs_to_vectors(
+        request.github_max_prs_per_author
+    )
+
+
+def _sync_jira(request: SyncAllRequest) -> JiraSyncResponse:
+    from app.api.integrations.Jira.jira_service import JiraIntegrationService
+
+    # Runs alongside the GitHub sync on another thread, so it needs its own
+    # session; sessions are not safe to share across threads.
+    with Session(engine) as jira_session:
+        jira_service = JiraIntegrationService(jira_session)
+        return jira_service.sync_issues(
+            project_keys=request.jira_project_keys,
+            max_results=request.jira_max_issues,
+            include_closed=request.jira_include_closed,
+            sync_comments=request.jira_sync_comments,
+            generate_embeddings=True,
+        )
+
+
+async def arun_sync_all_vectors(
     session: Session,
     request: SyncAllRequest,
     progress_callback: Callable[[int, str], None] | None = None,
 ) -> SyncAllResponse:
-    """Run the full GitHub + Jira vector sync flow with optional progress updates."""
+    """Run the GitHub and Jira vector syncs concurrently with optional progress updates."""
 
     def emit(progress: int, log_message: str) -> None:
         if progress_callback:
@@ -58,53 +94,64 @@ def run_sync_all_vectors(
     total_embeddings = 0
 
     enabled_steps = int(request.sync_github) + int(request.sync_jira)
-    progress = 5
+    completed_steps = 0
 
-    emit(progress, "Starting embedding sync workflow")
+    emit(5, "Starting embedding sync workflow")
 
-    if request.sync_github:
+    async def run_step(label: str, func: Callable[[], Any]) -> Any:
+        nonlocal completed_steps
         try:
-            emit(progress + 10, "Syncing GitHub pull requests")
-            github_service = GithubIntegrationService(session)
-            github_result = github_service.sync_all_authors_prs_to_vectors(
-                request.github_max_prs_per_author
-            )
-            total_embeddings += github_result.get("total_prs", 0)
-            emit(progress + 35, "GitHub sync completed")
+            result = await asyncio.to_thread(func)
         except Exception as exc:
-            error_msg = f"GitHub sync failed: {exc}"
-            errors.append(error_msg)
-            emit(progress + 35, error_msg)
-        progress += 45 if enabled_steps > 1 else 80
+            completed_steps += 1
+            emit(
+                15 + 75 * completed_steps // enabled_steps,
+                f"{label} sync failed: {exc}",
+            )
+            raise
+        completed_steps += 1
+        emit(15 + 75 * completed_steps // enabled_steps, f"{label} sync completed")
+        return result
 
+    steps: dict[str, Awaitable[Any]] = {}
+    if request.sync_github:
+        emit(15, "Syncing GitHub pull requests")
+        steps["github"] = run_step("GitHub", lambda: _sync_github(session, request))
     if request.sync_jira:
-        try:
-            emit(progress + 5, "Syncing Jira issues")
-            from app.api.integrations.Jira.jira_service import JiraIntegrationService
-
-            jira_service = JiraIntegrationService(session)
-            sync_result = jira_service.sync_issues(
-                project_keys=request.jira_project_keys,
-                max_results=request.jira_max_issues,
-                include_closed=request.jira_include_closed,
-                sync_comments=request.jira_sync_comments,
-                generate_embeddings=True,
-            )
+        emit(15, "Syncing Jira issues")
+        steps["jira"] = run_step("Jira", lambda: _sync_jira(request))
+
+    results = dict(
+        zip(
+            steps,
+            await asyncio.gather(*steps.values(), return_exceptions=True),
+            strict=True,
+        )
+    )
+
+    if "github" in results:
+        outcome = results["github"]
+        if isinstance(outcome, BaseException):
+            errors.append(f"GitHub sync failed: {outcome}")
+        else:
+            github_result = outcome
+            total_embeddings += outcome.get("total_prs", 0)
+
+    if "jira" in results:
+        outcome = results["jira"]
+        if isinstance(outcome, BaseException):
+            errors.append(f"Jira sync failed: {outcome}")
+        else:
             jira_result = {
-                "status": sync_result.status,
-                "projects_synced": sync_result.projects_synced,
-                "issues_synced": sync_result.issues_synced,
-                "embeddings_generated": sync_result.embeddings_generated,
-                "duration_seconds": sync_result.sync_duration_seconds,
+                "status": outcome.status,
+                "projects_synced": outcome.projects_synced,
+                "issues_synced": outcome.issues_synced,
+                "embeddings_generated": outcome.embeddings_generated,
+                "duration_seconds": outcome.sync_duration_seconds,
             }
-            total_embeddings += sync_result.embeddings_generated
-            if sync_result.errors:
-                errors.extend(sync_result.errors)
-            emit(90, "Jira sync completed")
-        except Exception as exc:
-            error_msg = f"Jira sync failed: {exc}"
-            errors.append(error_msg)
-            emit(90, error_msg)
+            total_embeddings += outcome.embeddings_generated
+            if outcome.errors:
+                errors.extend(outcome.errors)
 
     if not errors:
         status = "completed"
@@ -122,3 +169,12 @@ def run_sync_all_vectors(
         total_embeddings=total_embeddings,
         errors=errors,
     )
+
+
+def run_sync_all_vectors(
+    session: Session,
+    request: SyncAllRequest,
+    progress_callback: Callable[[int, str], None] | None = None,
+) -> SyncAllResponse:
+    """Blocking entry point for background tasks; see arun_sync_all_vectors."""
+    return asyncio.run(arun_sync_all_vectors(session, request, progress_callback))
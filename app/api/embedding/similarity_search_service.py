@@ -0,0 +1,152 @@
+"""Cross-source similarity search over the pgvector tables."""
+
+from typing import Any, cast
+
+from sqlalchemy import (
+    Integer,
+    Select,
+    String,
+    literal,
+    literal_column,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy import cast as sql_cast
+from sqlalchemy.orm import Session
+
+from app.api.embedding.embedding_model import GitHubPRVector, JiraIssueVector
+
+
+class SimilaritySearchService:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def unified_search(
+        self,
+        embedding: list[float],
+        k: int,
+        search_github: bool = True,
+        search_jira: bool = True,
+        github_author_login: str | None = None,
+        jira_project_key: str | None = None,
+        jira_assignee_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the global top-k GitHub PRs and Jira issues by cosine distance.
+
+        Each source is ordered and limited on its own, so both can use their
+        HNSW index, and the UNION ALL is re-ranked in a single round trip.
+        """
+        query = self._ranked_matches(
+            embedding,
+            k,
+            search_github=search_github,
+            search_jira=search_jira,
+            github_author_login=github_author_login,
+            jira_project_key=jira_project_key,
+            jira_assignee_id=jira_assignee_id,
+        )
+        if query is None:
+            return []
+        return [dict(row) for row in self.db.execute(query).mappings()]
+
+    def unified_search_batch(
+        self,
+        embeddings: list[list[float]],
+        k: int,
+        search_github: bool = True,
+        search_jira: bool = True,
+        github_author_login: str | None = None,
+        jira_project_key: str | None = None,
+        jira_assignee_id: str | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Run unified_search for several embeddings in one round trip.
+
+        Results are returned per embedding, in input order.
+        """
+        queries = []
+        for index, embedding in enumerate(embeddings):
+            ranked = self._ranked_matches(
+                embedding,
+                k,
+                search_github=search_github,
+                search_jira=search_jira,
+                github_author_login=github_author_login,
+                jira_project_key=jira_project_key,
+                jira_assignee_id=jira_assignee_id,
+            )
+            if ranked is None:
+                return [[] for _ in embeddings]
+            queries.append(
+                ranked.add_columns(literal(index, Integer).label("query_index"))
+            )
+
+        if not queries:
+            return []
+
+        batch = union_all(*queries).subquery("batch")
+        query = select(batch).order_by(batch.c.query_index, batch.c.distance)
+
+        results: list[list[dict[str, Any]]] = [[] for _ in embeddings]
+        for row in self.db.execute(query).mappings():
+            match = dict(row)
+            results[match.pop("query_index")].append(match)
+        return results
+
+    def _ranked_matches(
+        self,
+        embedding: list[float],
+        k: int,
+        search_github: bool,
+        search_jira: bool,
+        github_author_login: str | None,
+        jira_project_key: str | None,
+        jira_assignee_id: str | None,
+    ) -> Select[Any] | None:
+        branches = []
+
+        if search_github:
+            pr = cast(Any, GitHubPRVector)
+            pr_distance = pr.embedding.cosine_distance(embedding)
+            github_query = select(
+                literal_column("'github'", String).label("source"),
+                pr.pr_id.label("id"),
+                pr.pr_title.label("title"),
+                pr.pr_url.label("url"),
+                pr.author_login.label("author"),
+                pr.context.label("context"),
+                pr.created_at.label("created_at"),
+                pr_distance.label("distance"),
+            )
+            if github_author_login:
+                github_query = github_query.where(
+                    pr.author_login == github_author_login
+                )
+            branches.append(github_query.order_by(pr_distance).limit(k))
+
+        if search_jira:
+            issue = cast(Any, JiraIssueVector)
+            issue_distance = issue.embedding.cosine_distance(embedding)
+            jira_query = select(
+                literal_column("'jira'", String).label("source"),
+                issue.issue_id.label("id"),
+                issue.issue_key.label("title"),
+                sql_cast(null(), String).label("url"),
+                issue.assignee_account_id.label("author"),
+                issue.context.label("context"),
+                issue.created_at.label("created_at"),
+                issue_distance.label("distance"),
+            )
+            if jira_project_key:
+                jira_query = jira_query.where(issue.project_key == jira_project_key)
+            if jira_assignee_id:
+                jira_query = jira_query.where(
+                    issue.assignee_account_id == jira_assignee_id
+                )
+            branches.append(jira_query.order_by(issue_distance).limit(k))
+
+        if not branches:
+            return None
+
+        combined = union_all(*branches).subquery("matches")
+        return select(combined).order_by(combined.c.distance).limit(k)
@@ -2,12 +2,11 @@
 
 import logging
 import time as time_mod
-from typing import Any
 
 import httpx
 import jwt
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse
 
 from app.api.integrations.GitHub.github_model import GithubOrgIntBaseModel
 from app.api.integrations.GitHub.github_schema import (
@@ -106,7 +105,7 @@ def _discover_and_store_installation(
 @router.get(
     "/auth/connect", dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))]
 )
-async def connect_github(
+def connect_github(
     session: SessionDep,
 ) -> GitHubAppConnectResponse | GitHubAppConnectionStatus:
     """
@@ -154,7 +153,7 @@ async def connect_github(
 @router.get(
     "/auth/callback", dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))]
 )
-async def github_app_setup_callback(
+def github_app_setup_callback(
     session: SessionDep,
     installation_id: int | None = Query(default=None),
     _setup_action: str | None = Query(default=None, alias="setup_action"),
@@ -208,7 +207,7 @@ async def github_app_setup_callback(
     response_model=GitHubAppConnectionStatus,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_github_auth_status(session: SessionDep) -> GitHubAppConnectionStatus:
+def get_github_auth_status(session: SessionDep) -> GitHubAppConnectionStatus:
     """
     Return GitHub App connection status.
     Only checks the database - does NOT auto-discover.
@@ -244,7 +243,7 @@ async def get_github_auth_status(session: SessionDep) -> GitHubAppConnectionStat
     "/auth/disconnect",
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def disconnect_github(session: SessionDep) -> dict[str, str]:
+def disconnect_github(session: SessionDep) -> dict[str, str]:
     """Remove the GitHub App installation record from the database."""
     integrations = session.query(GithubOrgIntBaseModel).all()
     for integration in integrations:
@@ -261,7 +260,7 @@ async def disconnect_github(session: SessionDep) -> dict[str, str]:
     response_model=list[GitHubRepository],
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_repositories(session: SessionDep) -> list[GitHubRepository]:
+def get_repositories(session: SessionDep) -> list[GitHubRepository]:
     """Get all repositories accessible to the GitHub App installation."""
     try:
         service = GithubIntegrationService(session)
@@ -278,7 +277,7 @@ async def get_repositories(session: SessionDep) -> list[GitHubRepository]:
     response_model=list[GitHubRepository],
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_live_repositories(session: SessionDep) -> list[GitHubRepository]:
+def get_live_repositories(session: SessionDep) -> list[GitHubRepository]:
     """Get all repositories with live stats (branch and PR counts)."""
     try:
         service = GithubIntegrationService(session)
@@ -294,14 +293,15 @@ async def get_live_repositories(session: SessionDep) -> list[GitHubRepository]:
     "/repositories/{repo_name}/contributors",
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_repo_contributors(
+def get_repo_contributors(
     session: SessionDep,
     repo_name: str,
-) -> list[dict[str, Any]]:
+) -> JSONResponse:
     """Get contributors for a specific repository in the org."""
     try:
         service = GithubIntegrationService(session)
-        return service.get_repo_contributors(repo_name)
+        # Already plain JSON; skip response-model validation and encoding
+        return JSONResponse(service.get_repo_contributors(repo_name))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch contributors: {str(e)}"
@@ -312,17 +312,17 @@ async def get_repo_contributors(
     "/repositories/{repo_name}/pulls",
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_repo_pull_requests(
+def get_repo_pull_requests(
     session: SessionDep,
     repo_name: str,
     state: str = Query(default="closed", description="PR state: open, closed, all"),
     per_page: int = Query(default=30, ge=1, le=100),
-) -> list[dict[str, Any]]:
+) -> JSONResponse:
     """Get pull requests for a specific repository in the org."""
     try:
         service = GithubIntegrationService(session)
-        return service.get_repo_pull_requests(
-            repo_name, state=state, max_results=per_page
+        return JSONResponse(
+            service.get_repo_pull_requests(repo_name, state=state, max_results=per_page)
         )
     except Exception as e:
         raise HTTPException(
@@ -335,7 +335,7 @@ async def get_repo_pull_requests(
     response_model=GitHubSyncResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def sync_github(
+def sync_github(
     session: SessionDep,
     request: GitHubSyncRequest,
 ) -> GitHubSyncResponse:
@@ -358,7 +358,7 @@ async def sync_github(
 @router.get(
     "/get_developers", dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))]
 )
-async def get_developers(session: SessionDep) -> list[GitHubUser]:
+def get_developers(session: SessionDep) -> list[GitHubUser]:
     try:
         github_manager = GithubIntegrationService(session)
         developers = github_manager.get_all_org_members()
@@ -394,7 +394,7 @@ async def get_developers(session: SessionDep) -> list[GitHubUser]:
     response_model=GitHubDeveloperStats,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_developer_stats_by_login(
+def get_developer_stats_by_login(
     session: SessionDep, login: str
 ) -> GitHubDeveloperStats:
     try:
@@ -412,7 +412,7 @@ async def get_developer_stats_by_login(
     response_model=list[GitHubDeveloperStats],
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_developers_stats(session: SessionDep) -> list[GitHubDeveloperStats]:
+def get_developers_stats(session: SessionDep) -> list[GitHubDeveloperStats]:
     try:
         service = GithubIntegrationService(session)
         return service.get_developers_stats()
@@ -427,7 +427,7 @@ async def get_developers_stats(session: SessionDep) -> list[GitHubDeveloperStats
     "/get_closed_prs_context_per_author",
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_closed_prs_context_per_author(
+def get_closed_prs_context_per_author(
     session: SessionDep, author: GitHubUser
 ) -> list[PullRequestContent]:
     try:
@@ -441,7 +441,7 @@ async def get_closed_prs_context_per_author(
     "/get_closed_prs_context_all_authors",
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_closed_prs_context_all_authors(
+def get_closed_prs_context_all_authors(
     session: SessionDep,
 ) -> dict[str, list[PullRequestContent]]:
     try:
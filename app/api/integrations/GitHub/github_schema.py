@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class GitHubUser(BaseModel):
@@ -20,6 +20,8 @@ class GitHubDeveloperStats(GitHubUser):
 
 
 class PullRequestContent(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
     id: int
     number: int
     title: str
@@ -36,9 +38,6 @@ class PullRequestContent(BaseModel):
 
     author: GitHubUser = Field(..., description="The author of the pull request")
 
-    class Config:
-        populate_by_name = True
-
 
 # ── GitHub App Connection Schemas ────────────────────────────────
 
@@ -1,12 +1,20 @@
 """GitHub integration service using GitHub App authentication."""
 
+import calendar
 import logging
+import queue
 import re
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any
+from itertools import islice
+from typing import Any, cast
 
+import requests
 from github import Auth, Github, GithubException
+from github.Organization import Organization
 from github.PullRequest import PullRequest
 from pydantic import HttpUrl
 from sqlalchemy.orm import Session
@@ -25,6 +33,151 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_WORD_RE = re.compile(r"\w+")
+
+# Org membership changes rarely; cache the login -> member map per org so
+# single-author lookups don't page through the whole org on every request.
+ORG_MEMBERS_CACHE_TTL_SECONDS = 300
+_org_members_cache: dict[str, tuple[float, dict[str, GitHubUser]]] = {}
+_org_members_cache_lock = threading.Lock()
+
+# Installation tokens are valid for an hour. AppInstallationAuth caches its
+# token and refreshes it shortly before expiry, so keeping one auth object per
+# installation saves a JWT signature and a token round-trip per client.
+_installation_auth_cache: dict[tuple[str, int], Auth.AppInstallationAuth] = {}
+_installation_auth_cache_lock = threading.Lock()
+
+# Fewer, larger REST pages, and enough pooled connections for the repo scan
+# workers that share one client.
+GITHUB_PAGE_SIZE = 100
+GITHUB_REPO_SCAN_WORKERS = 8
+
+# Repos fetched ahead of the embed/upsert stage in the all-authors sync.
+SYNC_PIPELINE_DEPTH = 4
+
+# Bulk REST syncs check the core rate limit before starting. A reset this
+# close is waited out; a later one fails fast instead of dying mid-pagination.
+GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS = 60
+
+# Closed PRs are read through GraphQL so one request returns a page of PRs
+# with their labels, files and commits inline, instead of three lazy REST
+# calls per PR. REST reports state="closed" for merged PRs too.
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_PR_PAGE_SIZE = 50
+_PR_CONTEXT_FRAGMENT = """
+fragment PrContext on PullRequest {
+  databaseId
+  number
+  title
+  body
+  url
+  baseRefName
+  headRefName
+  author {
+    login
+    ... on User { databaseId }
+    ... on Bot { databaseId }
+  }
+  baseRepository { databaseId name defaultBranchRef { name } }
+  labels(first: 20) { nodes { name } }
+  files(first: 100) { nodes { path changeType } }
+  commits(first: 50) { nodes { commit { message } } }
+}
+"""
+_CLOSED_PRS_QUERY = (
+    """
+query ($owner: String!, $name: String!, $first: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(
+      states: [CLOSED, MERGED]
+      first: $first
+      after: $cursor
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...PrContext }
+    }
+  }
+}
+"""
+    + _PR_CONTEXT_FRAGMENT
+)
+# Search narrows a single author's PRs server-side across every org repo.
+_AUTHOR_PRS_SEARCH_QUERY = (
+    """
+query ($search: String!, $first: Int!, $cursor: String) {
+  search(query: $search, type: ISSUE, first: $first, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes { ...PrContext }
+  }
+}
+"""
+    + _PR_CONTEXT_FRAGMENT
+)
+# PRs already listed over REST are looked up by number in batches, one
+# aliased pullRequest field each; 25 keeps a query well under the node limit.
+GRAPHQL_PR_BATCH_SIZE = 25
+# REST org member listings omit name and email, so reading them costs one
+# lazy GET /users/{login} per member; GraphQL returns them with the page.
+_ORG_MEMBERS_QUERY = """
+query ($org: String!, $first: Int!, $cursor: String) {
+  organization(login: $org) {
+    membersWithRole(first: $first, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { login databaseId email name avatarUrl url }
+    }
+  }
+}
+"""
+GRAPHQL_MEMBER_PAGE_SIZE = 100
+# Repo listing for the closed-PR scans. Repos without a closed or merged PR
+# (empty, docs-only, most forks) would each cost a wasted PR query.
+_ORG_REPOS_QUERY = """
+query ($org: String!, $first: Int!, $cursor: String) {
+  organization(login: $org) {
+    repositories(
+      first: $first
+      after: $cursor
+      orderBy: {field: PUSHED_AT, direction: DESC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name pullRequests(states: [CLOSED, MERGED]) { totalCount } }
+    }
+  }
+}
+"""
+GRAPHQL_REPO_PAGE_SIZE = 100
+_github_http = requests.Session()
+
+
+def _iter_prefetched(
+    paginated: Any, page_size: int = GITHUB_PAGE_SIZE
+) -> Iterator[Any]:
+    """Iterate a PaginatedList, fetching the next page while this one is used.
+
+    A short page is the last one, so no request is wasted past the end.
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="gh-page") as pool:
+        page_number = 0
+        page = paginated.get_page(page_number)
+        while page:
+            upcoming = (
+                pool.submit(paginated.get_page, page_number + 1)
+                if len(page) >= page_size
+                else None
+            )
+            try:
+                yield from page
+            except GeneratorExit:
+                if upcoming is not None:
+                    upcoming.cancel()
+                raise
+            if upcoming is None:
+                return
+            page_number += 1
+            page = upcoming.result()
+
 
 class GithubIntegrationService:
     def __init__(self, db: Session, use_jina_api: bool | None = None) -> None:
@@ -32,10 +185,10 @@ class GithubIntegrationService:
         self.use_jina_api = (
             use_jina_api if use_jina_api is not None else settings.USE_JINA_API
         )
-        self.credentials: GithubOrgIntBaseModel | None = db.query(
-            GithubOrgIntBaseModel
-        ).first()
+        self.credentials = db.query(GithubOrgIntBaseModel).first()
         self._vector_service: VectorEmbeddingService | None = None
+        self._installation_auth: Auth.AppInstallationAuth | None = None
+        self._organization: Organization | None = None
 
     @property
     def vector_service(self) -> VectorEmbeddingService:
@@ -57,33 +210,227 @@ class GithubIntegrationService:
                 "Server configuration error: GitHub App ID or Private Key missing"
             )
 
-        app_auth = Auth.AppAuth(
-            app_id=str(settings.GITHUB_APP_ID),
-            private_key=settings.GITHUB_PRIVATE_KEY,
+        cache_key = (
+            str(settings.GITHUB_APP_ID),
+            int(self.installation_id),
         )
-        installation_auth = app_auth.get_installation_auth(
-            int(self.credentials.github_install_id)
+        with _installation_auth_cache_lock:
+            installation_auth = _installation_auth_cache.get(cache_key)
+            if installation_auth is None:
+                app_auth = Auth.AppAuth(
+                    app_id=str(settings.GITHUB_APP_ID),
+                    private_key=settings.GITHUB_PRIVATE_KEY,
+                )
+                installation_auth = app_auth.get_installation_auth(cache_key[1])
+                _installation_auth_cache[cache_key] = installation_auth
+        self._installation_auth = installation_auth
+        return Github(
+            auth=installation_auth,
+            per_page=GITHUB_PAGE_SIZE,
+            pool_size=GITHUB_REPO_SCAN_WORKERS,
         )
-        return Github(auth=installation_auth)
+
+    @property
+    def credentials(self) -> GithubOrgIntBaseModel | None:
+        return self._credentials
+
+    @credentials.setter
+    def credentials(self, value: GithubOrgIntBaseModel | None) -> None:
+        self._credentials = value
+        # Plain copies: background fetch threads read these, and the row's
+        # attributes expire (and lazy-load through the shared session) every
+        # time the calling thread commits.
+        self._org_name = value.org_name if value else None
+        self._install_id = value.github_install_id if value else None
 
     @property
     def organization_name(self) -> str:
-        if not self.credentials:
+        if self._org_name is None:
             raise Exception("GitHub integration credentials not found in database")
-        return self.credentials.org_name
+        return self._org_name
 
     @property
     def installation_id(self) -> str:
-        if not self.credentials:
+        if self._install_id is None:
             raise Exception("GitHub integration credentials not found in database")
-        return self.credentials.github_install_id
+        return self._install_id
+
+    def get_organization(self) -> Organization:
+        """Returns the installation's organization, fetched once per service."""
+        if self._organization is None:
+            self._organization = self.get_github_client().get_organization(
+                self.organization_name
+            )
+        return self._organization
+
+    def _ensure_rate_limit(self, gh: Github, needed: int) -> None:
+        """Make sure ``needed`` core REST calls are available before a bulk sync."""
+        try:
+            core = gh.get_rate_limit().core
+        except Exception as e:
+            logger.warning(f"Could not read GitHub rate limit, continuing: {e}")
+            return
+        if core.remaining >= needed:
+            return
+
+        wait_seconds = calendar.timegm(core.reset.utctimetuple()) - time.time()
+        if wait_seconds > GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS:
+            raise Exception(
+                f"GitHub rate limit too low for sync: {core.remaining} calls left, "
+                f"about {needed} needed; resets at {core.reset.isoformat()}"
+            )
+        logger.info(
+            f"GitHub rate limit low ({core.remaining} left); "
+            f"waiting {max(wait_seconds, 0):.0f}s for reset"
+        )
+        time.sleep(max(wait_seconds, 0) + 1)
+
+    def _installation_token(self) -> str:
+        """Installation access token for API calls PyGithub does not wrap."""
+        if self._installation_auth is None:
+            self.get_github_client()
+        return cast(Auth.AppInstallationAuth, self._installation_auth).token
+
+    def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        response = _github_http.post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            headers={"Authorization": f"bearer {self._installation_token()}"},
+            timeout=30,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            raise Exception(f"GitHub GraphQL error: {payload['errors']}")
+        return cast(dict[str, Any], payload["data"])
+
+    def _iter_closed_pr_nodes(self, repo_name: str) -> Iterator[dict[str, Any]]:
+        """Yield closed and merged PRs of a repo, most recently updated first."""
+        cursor: str | None = None
+        while True:
+            data = self._graphql(
+                _CLOSED_PRS_QUERY,
+                {
+                    "owner": self.organization_name,
+                    "name": repo_name,
+                    "first": GRAPHQL_PR_PAGE_SIZE,
+                    "cursor": cursor,
+                },
+            )
+            if not data.get("repository"):
+                return
+            pull_requests = data["repository"]["pullRequests"]
+            yield from pull_requests["nodes"]
+            if not pull_requests["pageInfo"]["hasNextPage"]:
+                return
+            cursor = pull_requests["pageInfo"]["endCursor"]
+
+    def _iter_author_closed_pr_nodes(self, login: str) -> Iterator[dict[str, Any]]:
+        """Yield an author's closed and merged org PRs, most recently updated first."""
+        search = (
+            f"is:pr is:closed author:{login} org:{self.organization_name} "
+            "sort:updated-desc"
+        )
+        cursor: str | None = None
+        while True:
+            data = self._graphql(
+                _AUTHOR_PRS_SEARCH_QUERY,
+                {"search": search, "first": GRAPHQL_PR_PAGE_SIZE, "cursor": cursor},
+            )
+            results = data["search"]
+            yield from (node for node in results["nodes"] if node)
+            if not results["pageInfo"]["hasNextPage"]:
+                return
+            cursor = results["pageInfo"]["endCursor"]
+
+    def _fetch_prs_graphql(
+        self, repo_name: str, numbers: list[int]
+    ) -> list[dict[str, Any] | None]:
+        """PR nodes for the given PR numbers, in order; None where one is gone."""
+        fields = "\n".join(
+            f"    pr{i}: pullRequest(number: {int(number)}) {{ ...PrContext }}"
+            for i, number in enumerate(numbers)
+        )
+        query = (
+            "query ($owner: String!, $name: String!) {\n"
+            "  repository(owner: $owner, name: $name) {\n"
+            f"{fields}\n"
+            "  }\n"
+            "}\n" + _PR_CONTEXT_FRAGMENT
+        )
+        data = self._graphql(
+            query, {"owner": self.organization_name, "name": repo_name}
+        )
+        repository = data.get("repository") or {}
+        return [repository.get(f"pr{i}") for i in range(len(numbers))]
+
+    def _iter_org_member_nodes(self) -> Iterator[dict[str, Any]]:
+        """Yield org members (public and private) with their profile fields."""
+        cursor: str | None = None
+        while True:
+            data = self._graphql(
+                _ORG_MEMBERS_QUERY,
+                {
+                    "org": self.organization_name,
+                    "first": GRAPHQL_MEMBER_PAGE_SIZE,
+                    "cursor": cursor,
+                },
+            )
+            members = data["organization"]["membersWithRole"]
+            yield from members["nodes"]
+            if not members["pageInfo"]["hasNextPage"]:
+                return
+            cursor = members["pageInfo"]["endCursor"]
+
+    def _list_closed_pr_repo_names(self) -> list[str]:
+        """Names of org repos with at least one closed or merged PR."""
+        names: list[str] = []
+        cursor: str | None = None
+        while True:
+            data = self._graphql(
+                _ORG_REPOS_QUERY,
+                {
+                    "org": self.organization_name,
+                    "first": GRAPHQL_REPO_PAGE_SIZE,
+                    "cursor": cursor,
+                },
+            )
+            repositories = data["organization"]["repositories"]
+            names.extend(
+                node["name"]
+                for node in repositories["nodes"]
+                if node and node["pullRequests"]["totalCount"]
+            )
+            if not repositories["pageInfo"]["hasNextPage"]:
+                return names
+            cursor = repositories["pageInfo"]["endCursor"]
 
     @staticmethod
     def _should_skip_default_branch_sync_pr(pr: PullRequest) -> bool:
         """Skip branch-sync PRs where default branch is opened into another branch."""
-        default_branch = (pr.base.repo.default_branch or "").strip()
-        base_branch = (pr.base.ref or "").strip()
-        head_branch = (pr.head.ref or "").strip()
+        return GithubIntegrationService._is_default_branch_sync(
+            pr.base.repo.default_branch, pr.base.ref, pr.head.ref
+        )
+
+    @staticmethod
+    def _should_skip_default_branch_sync_node(node: dict[str, Any]) -> bool:
+        """GraphQL counterpart of ``_should_skip_default_branch_sync_pr``."""
+        default_branch_ref = (node.get("baseRepository") or {}).get(
+            "defaultBranchRef"
+        ) or {}
+        return GithubIntegrationService._is_default_branch_sync(
+            default_branch_ref.get("name"),
+            node.get("baseRefName"),
+            node.get("headRefName"),
+        )
+
+    @staticmethod
+    def _is_default_branch_sync(
+        default_branch: str | None, base_ref: str | None, head_ref: str | None
+    ) -> bool:
+        default_branch = (default_branch or "").strip()
+        base_branch = (base_ref or "").strip()
+        head_branch = (head_ref or "").strip()
 
         if not default_branch:
             return False
@@ -94,8 +441,7 @@ class GithubIntegrationService:
 
     def get_repositories(self) -> list[GitHubRepository]:
         """Get all repositories accessible to the GitHub App installation."""
-        gh = self.get_github_client()
-        org = gh.get_organization(self.organization_name)
+        org = self.get_organization()
         repos: list[GitHubRepository] = []
 
         for r in org.get_repos():
@@ -122,7 +468,7 @@ class GithubIntegrationService:
     def get_live_repositories(self) -> list[GitHubRepository]:
         """Get all repositories with live stats like branch and PR counts."""
         gh = self.get_github_client()
-        org = gh.get_organization(self.organization_name)
+        org = self.get_organization()
         repos: list[GitHubRepository] = []
 
         for r in org.get_repos():
@@ -255,8 +601,7 @@ class GithubIntegrationService:
 
     def get_repo_contributors(self, repo_name: str) -> list[dict[str, Any]]:
         """Get contributors for a repository within the org."""
-        gh = self.get_github_client()
-        org = gh.get_organization(self.organization_name)
+        org = self.get_organization()
         repo = org.get_repo(repo_name)
 
         return [
@@ -276,8 +621,7 @@ class GithubIntegrationService:
         max_results: int = 30,
     ) -> list[dict[str, Any]]:
         """Get pull requests for a repository within the org."""
-        gh = self.get_github_client()
-        org = gh.get_organization(self.organization_name)
+        org = self.get_organization()
         repo = org.get_repo(repo_name)
         prs_data: list[dict[str, Any]] = []
 
@@ -317,33 +661,41 @@ class GithubIntegrationService:
         """Sync PRs from GitHub repos, optionally generate embeddings."""
         start_time = time.time()
 
-        gh = self.get_github_client()
-        org = gh.get_organization(self.organization_name)
+        org = self.get_organization()
 
+        # Repos already listed by discovery are reused instead of re-fetched
+        known_repos: dict[str, Any] = {}
         if repo_names is None:
-            repos = list(org.get_repos())
-            repo_names = [r.name for r in repos]
+            known_repos = {r.name: r for r in org.get_repos()}
+            repo_names = list(known_repos)
 
         prs_synced = 0
         embeddings_generated = 0
         errors: list[str] = []
         all_pr_contents: list[PullRequestContent] = []
 
-        for repo_name in repo_names:
+        states = ["closed"]
+        if include_open:
+            states.append("open")
+
+        # At least one pulls page per repo and state
+        self._ensure_rate_limit(self.get_github_client(), len(repo_names) * len(states))
+
+        def collect_repo_prs(
+            repo_name: str,
+        ) -> tuple[list[PullRequestContent], list[str]]:
+            repo_contents: list[PullRequestContent] = []
+            repo_errors: list[str] = []
             try:
                 logger.info(
                     f"Syncing GitHub repo: {self.organization_name}/{repo_name}"
                 )
-                repo = org.get_repo(repo_name)
-
-                states = ["closed"]
-                if include_open:
-                    states.append("open")
+                repo = known_repos.get(repo_name) or org.get_repo(repo_name)
 
                 for state in states:
-                    count = 0
-                    for pr in repo.get_pulls(
-                        state=state, sort="updated", direction="desc"
+                    selected: list[PullRequest] = []
+                    for pr in _iter_prefetched(
+                        repo.get_pulls(state=state, sort="updated", direction="desc")
                     ):
                         if self._should_skip_default_branch_sync_pr(pr):
                             logger.debug(
@@ -356,19 +708,37 @@ class GithubIntegrationService:
                             )
                             continue
 
-                        if count >= max_prs_per_repo:
+                        if len(selected) >= max_prs_per_repo:
                             break
-                        try:
-                            pr_content = self.generate_pr_context(pr)
-                            all_pr_contents.append(pr_content)
-                            prs_synced += 1
-                            count += 1
-                        except Exception as e:
-                            errors.append(
-                                f"Error processing PR #{pr.number} in {repo_name}: {e}"
+                        selected.append(pr)
+
+                    try:
+                        # Files and commits only feed the embeddings
+                        repo_contents.extend(
+                            self.generate_pr_contexts(
+                                selected, include_details=generate_embeddings
                             )
+                        )
+                    except Exception as e:
+                        repo_errors.append(
+                            f"Error processing {state} PRs in {repo_name}: {e}"
+                        )
             except Exception as e:
-                errors.append(f"Error syncing repo {repo_name}: {e}")
+                repo_errors.append(f"Error syncing repo {repo_name}: {e}")
+            return repo_contents, repo_errors
+
+        # Repos are independent and the work is network-bound; results are
+        # merged in the requested repo order.
+        if repo_names:
+            with ThreadPoolExecutor(
+                max_workers=min(GITHUB_REPO_SCAN_WORKERS, len(repo_names))
+            ) as executor:
+                for repo_contents, repo_errors in executor.map(
+                    collect_repo_prs, repo_names
+                ):
+                    all_pr_contents.extend(repo_contents)
+                    prs_synced += len(repo_contents)
+                    errors.extend(repo_errors)
 
         if generate_embeddings and all_pr_contents:
             try:
@@ -378,8 +748,13 @@ class GithubIntegrationService:
                     if login not in authors_prs:
                         authors_prs[login] = []
                     authors_prs[login].append(pr_content)
-                self.vector_service.store_all_authors_pr_contexts(authors_prs)
-                embeddings_generated = len(all_pr_contents)
+                embeddings_generated, store_errors = (
+                    self.vector_service.store_all_authors_pr_contexts(authors_prs)
+                )
+                errors.extend(
+                    f"Error generating embeddings for {failure}"
+                    for failure in store_errors
+                )
             except Exception as e:
                 errors.append(f"Error generating embeddings: {e}")
 
@@ -401,11 +776,45 @@ class GithubIntegrationService:
     def get_all_org_members(self) -> list[GitHubUser]:
         """Retrieves all members of the organization.
 
+        Reads members with their profile fields through GraphQL, a page of
+        100 per request. Falls back to the REST listing if that fails.
+        """
+        try:
+            members_list = [
+                GitHubUser(
+                    login=node["login"],
+                    id=node["databaseId"],
+                    # GraphQL reports a hidden email as "", REST as null.
+                    email=node.get("email") or None,
+                    name=node.get("name"),
+                    avatar_url=HttpUrl(node["avatarUrl"])
+                    if node.get("avatarUrl")
+                    else None,
+                    html_url=HttpUrl(node["url"]) if node.get("url") else None,
+                )
+                for node in self._iter_org_member_nodes()
+            ]
+            logger.info(
+                "Successfully fetched %d members for org: %s",
+                len(members_list),
+                self.organization_name,
+            )
+            return members_list
+        except Exception as e:
+            logger.warning(
+                "GraphQL member listing failed for org %s, using REST: %s",
+                self.organization_name,
+                str(e),
+            )
+        return self._get_all_org_members_rest()
+
+    def _get_all_org_members_rest(self) -> list[GitHubUser]:
+        """REST member listing.
+
         First tries to get all members (public + private) using filter_="all".
         Falls back to public members only if that fails.
         """
-        gh = self.get_github_client()
-        org = gh.get_organization(self.organization_name)
+        org = self.get_organization()
         members_list = []
 
         try:
@@ -452,6 +861,20 @@ class GithubIntegrationService:
 
         return members_list
 
+    def get_org_members_by_login(self) -> dict[str, GitHubUser]:
+        """Returns org members keyed by login, cached for a short TTL."""
+        org_name = self.organization_name
+        now = time.monotonic()
+        with _org_members_cache_lock:
+            cached = _org_members_cache.get(org_name)
+        if cached and now - cached[0] < ORG_MEMBERS_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        members_by_login = {m.login: m for m in self.get_all_org_members()}
+        with _org_members_cache_lock:
+            _org_members_cache[org_name] = (now, members_by_login)
+        return members_by_login
+
     def get_developers_stats(self) -> list[GitHubDeveloperStats]:
         members = self.get_all_org_members()
         gh = self.get_github_client()
@@ -550,118 +973,284 @@ class GithubIntegrationService:
             raise Exception(f"Failed to fetch stats for {login}: {str(e)}")
 
     def generate_pr_context(
-        self, pr: PullRequest, max_tokens: int = 8000
+        self, pr: PullRequest, max_tokens: int = 8000, include_details: bool = True
     ) -> PullRequestContent:
-        """Generates a structured context string from a pull request."""
-        author = GitHubUser(
-            login=pr.user.login,
-            id=pr.user.id,
-        )
-        pr_content = PullRequestContent(
+        """Generates a structured context string from a pull request.
+
+        With ``include_details=False`` the files and commits sections stay
+        empty and the PR costs no request beyond the listing.
+
+        Only fields present in the pulls listing JSON are read (user, base,
+        labels, body), so PyGithub never completes the object with another
+        GET. Avoid ``pr.raw_data``, ``pr.update()`` and fields such as
+        ``pr.user.name`` here: each forces one request per PR. Files and
+        commits are the two unavoidable calls, and ``generate_pr_contexts``
+        replaces them with GraphQL.
+        """
+        return PullRequestContent(
             id=pr.id,
             number=pr.number,
-            title=pr.title,
             html_url=HttpUrl(pr.html_url),
-            author=author,
+            author=GitHubUser(login=pr.user.login, id=pr.user.id),
             repo_id=pr.base.repo.id,
             repo_name=pr.base.repo.name,
+            **self._pr_context_fields(
+                title=pr.title,
+                raw_body=pr.body,
+                labels=[label.name for label in pr.labels],
+                files=(
+                    [(f.status, f.filename) for f in pr.get_files()]
+                    if include_details
+                    else []
+                ),
+                # One page (GITHUB_PAGE_SIZE commits) covers nearly every PR and
+                # is more than the GraphQL path reads; don't page through huge PRs.
+                commit_messages=(
+                    [commit.commit.message for commit in pr.get_commits().get_page(0)]
+                    if include_details
+                    else []
+                ),
+            ),
         )
 
-        clean_description = re.sub(
-            r"<!--.*?-->", "", pr.body or "", flags=re.DOTALL
-        ).strip()
+    def generate_pr_contexts(
+        self, prs: list[PullRequest], include_details: bool = True
+    ) -> list[PullRequestContent]:
+        """Contexts for REST-listed PRs, with their details read over GraphQL.
 
-        pr_content.body = clean_description
+        Labels, files and commits for a batch of PRs come back in one query
+        per repo instead of two lazy REST calls per PR. A batch that fails,
+        or a PR missing from the response, falls back to ``generate_pr_context``.
+        Without ``include_details`` contexts are built from the listing alone.
+        """
+        if not include_details:
+            return [self.generate_pr_context(pr, include_details=False) for pr in prs]
 
-        header = (
-            f"PR_INTENT: {pr.title}\n"
-            f"DESCRIPTION: {clean_description[:1000]}\n"
-            f"LABELS: {', '.join([label.name for label in pr.labels])}\n"
+        contexts: list[PullRequestContent] = []
+        for start in range(0, len(prs), GRAPHQL_PR_BATCH_SIZE):
+            batch = prs[start : start + GRAPHQL_PR_BATCH_SIZE]
+            try:
+                nodes: list[dict[str, Any] | None] = [None] * len(batch)
+                by_repo: dict[str, list[int]] = {}
+                for index, pr in enumerate(batch):
+                    by_repo.setdefault(pr.base.repo.name, []).append(index)
+                for repo_name, indexes in by_repo.items():
+                    repo_nodes = self._fetch_prs_graphql(
+                        repo_name, [batch[i].number for i in indexes]
+                    )
+                    for index, node in zip(indexes, repo_nodes, strict=True):
+                        nodes[index] = node
+                batch_contexts = [
+                    self.generate_pr_context_from_node(node)
+                    if node
+                    else self.generate_pr_context(pr)
+                    for pr, node in zip(batch, nodes, strict=True)
+                ]
+            except Exception as e:
+                logger.warning(
+                    f"GraphQL PR lookup failed for {len(batch)} PRs, using REST: {e}"
+                )
+                batch_contexts = [self.generate_pr_context(pr) for pr in batch]
+            contexts.extend(batch_contexts)
+        return contexts
+
+    def generate_pr_context_from_node(self, node: dict[str, Any]) -> PullRequestContent:
+        """Builds the same context as ``generate_pr_context`` from a GraphQL PR node."""
+        base_repository = node["baseRepository"]
+        return PullRequestContent(
+            id=node["databaseId"],
+            number=node["number"],
+            html_url=HttpUrl(node["url"]),
+            author=GitHubUser(
+                login=node["author"]["login"], id=node["author"]["databaseId"]
+            ),
+            repo_id=base_repository["databaseId"],
+            repo_name=base_repository["name"],
+            **self._pr_context_fields(
+                title=node["title"],
+                raw_body=node.get("body"),
+                labels=[label["name"] for label in node["labels"]["nodes"]],
+                # REST reports deleted files as "removed"; keep the context text
+                # identical.
+                files=[
+                    (
+                        "removed"
+                        if f["changeType"] == "DELETED"
+                        else f["changeType"].lower(),
+                        f["path"],
+                    )
+                    for f in node["files"]["nodes"]
+                ],
+                commit_messages=[
+                    c["commit"]["message"] for c in node["commits"]["nodes"]
+                ],
+            ),
         )
 
-        files = pr.get_files()
-        pr_content.labels = [label.name for label in pr.labels]
-
-        body = "\nFILE_CHANGES:\n"
-        files_list = []
-        for f in files:
-            status = f.status
-            body += f"- [{status.upper()}] {f.filename}\n"
-            files_list.append(f.filename)
+    @staticmethod
+    def _pr_context_fields(
+        title: str,
+        raw_body: str | None,
+        labels: list[str],
+        files: list[tuple[str, str]],
+        commit_messages: list[str],
+    ) -> dict[str, Any]:
+        """Derived ``PullRequestContent`` fields; the model itself is frozen."""
+        description = raw_body or ""
+        # Most bodies carry no template comments; skip the regex pass for them.
+        if "<!--" in description:
+            description = _HTML_COMMENT_RE.sub("", description)
+        clean_description = description.strip()
+
+        parts = [
+            f"PR_INTENT: {title}\n"
+            f"DESCRIPTION: {clean_description[:1000]}\n"
+            f"LABELS: {', '.join(labels)}\n",
+            "\nFILE_CHANGES:\n",
+        ]
+        parts.extend(f"- [{status.upper()}] {filename}\n" for status, filename in files)
 
-        body += "\nCOMMITS:\n"
-        for commit in pr.get_commits():
-            commit_message = commit.commit.message
-            len_message = len(re.findall(r"\w+", commit_message))
-            if len_message > 5:
-                body += f"- {commit_message.splitlines()[0]}\n"
+        parts.append("\nCOMMITS:\n")
+        for commit_message in commit_messages:
+            # Only "more than five words" matters, so stop matching at six.
+            if sum(1 for _ in islice(_WORD_RE.finditer(commit_message), 6)) > 5:
+                parts.append(f"- {commit_message.splitlines()[0]}\n")
 
-        pr_content.context = header + body
-        pr_content.changed_files = files_list
-        return pr_content
+        return {
+            "title": title,
+            "body": clean_description,
+            "labels": labels,
+            "context": "".join(parts),
+            "changed_files": [filename for _, filename in files],
+        }
 
     def get_org_closed_prs_context_by_author(
         self, author: GitHubUser, max_prs: int = 100
     ) -> list[PullRequestContent]:
-        """Retrieves closed pull requests from all repositories in the organization."""
-        gh = self.get_github_client()
-        org = gh.get_organization(self.organization_name)
-        prs_content_list: list[PullRequestContent] = []
+        """Retrieves an author's closed pull requests across the organization.
+
+        Uses the search API so only the author's PRs are fetched, most
+        recently updated first. Falls back to scanning every repository if
+        the search fails.
+        """
+        if max_prs <= 0:
+            return []
+
+        try:
+            pr_contents: list[PullRequestContent] = []
+            for node in self._iter_author_closed_pr_nodes(author.login):
+                if self._should_skip_default_branch_sync_node(node):
+                    continue
+                if (node.get("author") or {}).get("databaseId") != author.id:
+                    continue
+                pr_contents.append(self.generate_pr_context_from_node(node))
+                if len(pr_contents) >= max_prs:
+                    break
+            return pr_contents
+        except Exception as e:
+            logger.warning(
+                "PR search failed for %s, scanning repos instead: %s",
+                author.login,
+                str(e),
+            )
+        return self._scan_org_closed_prs_by_author(author, max_prs)
+
+    def _scan_org_closed_prs_by_author(
+        self, author: GitHubUser, max_prs: int
+    ) -> list[PullRequestContent]:
+        """Scans every repository for the author's closed pull requests.
+
+        Repositories are scanned concurrently; workers stop paging once
+        ``max_prs`` PRs have been claimed across all repos. Results keep repo
+        order, most recently pushed first.
+        """
+        repo_names = self._list_closed_pr_repo_names()
+        if not repo_names or max_prs <= 0:
+            return []
+
+        claimed = 0
+        claim_lock = threading.Lock()
+        limit_reached = threading.Event()
 
-        for repo in org.get_repos():
+        def scan_repo(repo_name: str) -> list[PullRequestContent]:
+            nonlocal claimed
+            repo_contents: list[PullRequestContent] = []
             try:
-                repo_prs = repo.get_pulls(
-                    state="closed", sort="updated", direction="desc"
-                )
+                for node in self._iter_closed_pr_nodes(repo_name):
+                    if limit_reached.is_set():
+                        break
 
-                for pr in repo_prs:
-                    if self._should_skip_default_branch_sync_pr(pr):
+                    if self._should_skip_default_branch_sync_node(node):
                         continue
 
-                    if not pr.user:
+                    if not (node.get("author") or {}).get("databaseId"):
                         continue
 
-                    if pr.user.id != author.id:
+                    if node["author"]["databaseId"] != author.id:
                         continue
 
-                    if len(prs_content_list) >= max_prs:
-                        return prs_content_list
+                    with claim_lock:
+                        if claimed >= max_prs:
+                            limit_reached.set()
+                            break
+                        claimed += 1
 
-                    prs_content_list.append(self.generate_pr_context(pr))
+                    repo_contents.append(self.generate_pr_context_from_node(node))
             except Exception as e:
-                logger.warning("Skipping repo %s: %s", repo.name, str(e))
-                continue
+                logger.warning("Skipping repo %s: %s", repo_name, str(e))
+            return repo_contents
 
-        return prs_content_list
+        with ThreadPoolExecutor(
+            max_workers=min(GITHUB_REPO_SCAN_WORKERS, len(repo_names))
+        ) as executor:
+            per_repo = list(executor.map(scan_repo, repo_names))
+
+        return [pr for repo_contents in per_repo for pr in repo_contents][:max_prs]
 
     def get_org_closed_prs_context_all_authors(
         self, max_prs_per_author: int = 100
     ) -> dict[str, list[PullRequestContent]]:
-        """Retrieves closed pull requests grouped by author for all org members."""
-        gh = self.get_github_client()
-        org = gh.get_organization(self.organization_name)
-        authors_prs: dict[str, list[PullRequestContent]] = {}
+        """Retrieves closed pull requests grouped by author for all org members.
 
-        for repo in org.get_repos():
+        Repositories are scanned concurrently for PR nodes. Contexts are only
+        built for the PRs each author keeps, most recently pushed repo first.
+        """
+        repo_names = self._list_closed_pr_repo_names()
+        if not repo_names or max_prs_per_author <= 0:
+            return {}
+
+        def scan_repo(repo_name: str) -> list[dict[str, Any]]:
+            repo_nodes: list[dict[str, Any]] = []
+            repo_counts: dict[int, int] = {}
             try:
-                repo_prs = repo.get_pulls(
-                    state="closed", sort="updated", direction="desc"
-                )
-                for pr in repo_prs:
-                    if self._should_skip_default_branch_sync_pr(pr):
+                for node in self._iter_closed_pr_nodes(repo_name):
+                    if self._should_skip_default_branch_sync_node(node):
+                        continue
+
+                    author_id = (node.get("author") or {}).get("databaseId")
+                    if not author_id:
                         continue
 
-                    if pr.user:
-                        author_login = pr.user.login
-                        if author_login not in authors_prs:
-                            authors_prs[author_login] = []
-                        authors_prs[author_login].append(self.generate_pr_context(pr))
+                    # No author keeps more than the limit from a single repo.
+                    if repo_counts.get(author_id, 0) >= max_prs_per_author:
+                        continue
+                    repo_counts[author_id] = repo_counts.get(author_id, 0) + 1
+                    repo_nodes.append(node)
             except Exception as e:
-                logger.warning("Skipping repo %s: %s", repo.name, str(e))
-                continue
+                logger.warning("Skipping repo %s: %s", repo_name, str(e))
+            return repo_nodes
+
+        with ThreadPoolExecutor(
+            max_workers=min(GITHUB_REPO_SCAN_WORKERS, len(repo_names))
+        ) as executor:
+            per_repo = list(executor.map(scan_repo, repo_names))
 
-        for author in authors_prs:
-            authors_prs[author] = authors_prs[author][:max_prs_per_author]
+        authors_prs: dict[str, list[PullRequestContent]] = {}
+        for repo_nodes in per_repo:
+            for node in repo_nodes:
+                author_prs = authors_prs.setdefault(node["author"]["login"], [])
+                if len(author_prs) < max_prs_per_author:
+                    author_prs.append(self.generate_pr_context_from_node(node))
 
         return authors_prs
 
@@ -679,68 +1268,92 @@ class GithubIntegrationService:
     def sync_all_authors_prs_to_vectors(
         self, max_prs_per_author: int = 100
     ) -> dict[str, int]:
-        """Fetch PRs for all authors and store their vectors incrementally."""
-        gh = self.get_github_client()
-        org = gh.get_organization(self.organization_name)
+        """Fetch PRs for all authors and store their vectors incrementally.
+
+        A producer thread fetches repos and builds PR contexts, handing each
+        repo's batch over a bounded queue. GitHub latency for the next repos
+        therefore overlaps embedding and upserting the current one. Each
+        repo's PRs, across all authors, are embedded and stored in one call
+        so Jina batches stay full. Only the calling thread touches the DB
+        session; the producer reads credentials from plain copies.
+        """
+        repos = list(self.get_organization().get_repos())
+        # At least one pulls page per repo
+        self._ensure_rate_limit(self.get_github_client(), len(repos))
 
         # Track how many PRs we've stored per author to respect the limit
         # Using ID instead of login for stability
         author_pr_counts: dict[int, int] = {}
         total_prs_processed = 0
-        total_authors_touched = set()
+        total_authors_touched: set[int] = set()
 
-        # Iterate repos and process immediately
-        for repo in org.get_repos():
-            try:
-                logger.info(f"Scanning repo: {repo.name}...")
-                repo_prs = repo.get_pulls(
-                    state="closed", sort="updated", direction="desc"
-                )
+        batches: queue.Queue[tuple[str, list[PullRequestContent]] | None]
+        batches = queue.Queue(maxsize=SYNC_PIPELINE_DEPTH)
+        fetch_errors: list[Exception] = []
 
-                # Buffer for current repo to group by author ID
-                current_repo_prs: dict[int, list[PullRequestContent]] = {}
-                repo_has_eligible_prs = False
+        def fetch_repos() -> None:
+            try:
+                for repo in repos:
+                    try:
+                        logger.info(f"Scanning repo: {repo.name}...")
+                        repo_prs = _iter_prefetched(
+                            repo.get_pulls(
+                                state="closed", sort="updated", direction="desc"
+                            )
+                        )
 
-                for pr in repo_prs:
-                    if self._should_skip_default_branch_sync_pr(pr):
-                        continue
+                        selected: list[PullRequest] = []
 
-                    if not pr.user:
-                        continue
+                        for pr in repo_prs:
+                            if self._should_skip_default_branch_sync_pr(pr):
+                                continue
 
-                    author_id = pr.user.id
+                            if not pr.user:
+                                continue
 
-                    # Check if this author has already reached the global limit
-                    current_count = author_pr_counts.get(author_id, 0)
-                    if current_count >= max_prs_per_author:
-                        continue
+                            author_id = pr.user.id
 
-                    if author_id not in current_repo_prs:
-                        current_repo_prs[author_id] = []
+                            # Check if this author has already reached the global limit
+                            current_count = author_pr_counts.get(author_id, 0)
+                            if current_count >= max_prs_per_author:
+                                continue
 
-                    current_repo_prs[author_id].append(self.generate_pr_context(pr))
+                            selected.append(pr)
 
-                    # Update global count immediately
-                    author_pr_counts[author_id] = current_count + 1
-                    total_authors_touched.add(author_id)
-                    repo_has_eligible_prs = True
+                            # Update global count immediately
+                            author_pr_counts[author_id] = current_count + 1
+                            total_authors_touched.add(author_id)
 
-                # Flush current repo's PRs to vector store
-                if repo_has_eligible_prs:
-                    for author_id, pr_contents in current_repo_prs.items():
-                        if pr_contents:
-                            author = pr_contents[0].author
-                            logger.info(
-                                f"Syncing {len(pr_contents)} PRs for {author.login} (ID: {author_id}) from {repo.name}..."
-                            )
-                            stored_count = self.vector_service.store_pr_contexts(
-                                author, pr_contents
+                        if selected:
+                            batches.put(
+                                (repo.name, self.generate_pr_contexts(selected))
                             )
-                            total_prs_processed += stored_count
+                    except Exception as e:
+                        logger.warning("Skipping repo %s: %s", repo.name, str(e))
+            except Exception as e:
+                fetch_errors.append(e)
+            finally:
+                batches.put(None)
+
+        producer = threading.Thread(
+            target=fetch_repos, name="github-pr-fetch", daemon=True
+        )
+        producer.start()
 
+        # Flush each repo's PRs to the vector store as it arrives
+        while (batch := batches.get()) is not None:
+            repo_name, pr_contents = batch
+            logger.info(f"Syncing {len(pr_contents)} PRs from {repo_name}...")
+            try:
+                total_prs_processed += self.vector_service.store_pr_contexts_batch(
+                    pr_contents, label=repo_name
+                )
             except Exception as e:
-                logger.warning("Skipping repo %s: %s", repo.name, str(e))
-                continue
+                logger.warning("Failed to store PRs from %s: %s", repo_name, str(e))
+
+        producer.join()
+        if fetch_errors:
+            raise fetch_errors[0]
 
         return {
             "total_authors": len(total_authors_touched),
@@ -1,5 +1,6 @@
-import hashlib
 import hmac
+import json
+import logging
 
 from fastapi import APIRouter, HTTPException, Request
 
@@ -7,8 +8,16 @@ from app.api.integrations.GitHub.github_model import GithubOrgIntBaseModel
 from app.core.config import settings
 from app.utils.deps import SessionDep
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/github", tags=["github"])
 
+_SIGNATURE_PREFIX = "sha256="
+# Encoded once; settings are fixed for the life of the process.
+_WEBHOOK_SECRET: bytes | None = (
+    settings.GITHUB_WEBHOOK_SECRET.encode() if settings.GITHUB_WEBHOOK_SECRET else None
+)
+
 
 @router.post("/webhook")
 async def github_webhook(request: Request, session: SessionDep) -> dict[str, str]:
@@ -16,30 +25,34 @@ async def github_webhook(request: Request, session: SessionDep) -> dict[str, str
     signature = request.headers.get("X-Hub-Signature-256")
     body = await request.body()
 
-    if not settings.GITHUB_WEBHOOK_SECRET:
+    if not _WEBHOOK_SECRET:
         raise HTTPException(
             status_code=500, detail="Server configuration error: Webhook secret missing"
         )
 
-    mac = hmac.new(
-        key=settings.GITHUB_WEBHOOK_SECRET.encode(), msg=body, digestmod=hashlib.sha256
-    )
-    expected_signature = "sha256=" + mac.hexdigest()
+    if not signature or not signature.startswith(_SIGNATURE_PREFIX):
+        raise HTTPException(status_code=403, detail="Invalid signature")
+    try:
+        provided_digest = bytes.fromhex(signature[len(_SIGNATURE_PREFIX) :])
+    except ValueError:
+        raise HTTPException(status_code=403, detail="Invalid signature")
 
-    if signature is None or not hmac.compare_digest(signature, expected_signature):
+    expected_digest = hmac.digest(_WEBHOOK_SECRET, body, "sha256")
+    if not hmac.compare_digest(provided_digest, expected_digest):
         raise HTTPException(status_code=403, detail="Invalid signature")
 
-    # 2. Process Data
-    payload = await request.json()
+    # 2. Process Data (parse the bytes already read for the signature)
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
     action = payload.get("action")
 
     if action == "created" and "installation" in payload:
         install_id = payload["installation"]["id"]
         org_name = payload["installation"]["account"]["login"]
 
-        import logging
-
-        logging.getLogger(__name__).info(
+        logger.info(
             "Linked GitHub organization %s with installation %s", org_name, install_id
         )
 
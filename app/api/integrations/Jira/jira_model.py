@@ -2,9 +2,14 @@
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, func
 from sqlmodel import Field, SQLModel
 
+# Timestamps come from the database clock: one now() per statement rather than
+# a Python call per row, and updated_at refreshes on every ORM UPDATE.
+_CREATED_AT_KWARGS = {"server_default": func.now()}
+_UPDATED_AT_KWARGS = {"server_default": func.now(), "onupdate": func.now()}
+
 
 class JiraOrgIntegration(SQLModel, table=True):
     """Model for storing Jira organization integration credentials."""
@@ -14,11 +19,17 @@ class JiraOrgIntegration(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     jira_url: str = Field(..., description="Jira instance URL")
     jira_email: str = Field(..., description="Email associated with API token")
-    project_keys: str | None = Field(
-        default=None, description="Comma-separated list of project keys to sync"
+    project_keys: list[str] | None = Field(
+        default=None,
+        sa_column=Column(JSON, nullable=True),
+        description="Project keys to sync; all projects when empty",
+    )
+    created_at: datetime | None = Field(
+        default=None, sa_column_kwargs=_CREATED_AT_KWARGS
+    )
+    updated_at: datetime | None = Field(
+        default=None, sa_column_kwargs=_UPDATED_AT_KWARGS
     )
-    created_at: datetime | None = Field(default_factory=datetime.utcnow)
-    updated_at: datetime | None = Field(default_factory=datetime.utcnow)
 
 
 class JiraOAuthToken(SQLModel, table=True):
@@ -36,13 +47,20 @@ class JiraOAuthToken(SQLModel, table=True):
     )
     access_token: str = Field(..., description="Bearer access token")
     refresh_token: str | None = Field(default=None, description="Refresh token")
-    expires_at: datetime = Field(..., description="Access token expiry (UTC)")
+    # Indexed for _get_active_token's ORDER BY expires_at DESC
+    expires_at: datetime = Field(
+        ..., index=True, description="Access token expiry (UTC)"
+    )
     scope: str | None = Field(
         default=None, description="Space-separated scopes granted by Atlassian"
     )
     token_type: str | None = Field(default="Bearer", description="Token type")
-    created_at: datetime | None = Field(default_factory=datetime.utcnow)
-    updated_at: datetime | None = Field(default_factory=datetime.utcnow)
+    created_at: datetime | None = Field(
+        default=None, sa_column_kwargs=_CREATED_AT_KWARGS
+    )
+    updated_at: datetime | None = Field(
+        default=None, sa_column_kwargs=_UPDATED_AT_KWARGS
+    )
 
 
 class JiraIssueTypeStatus(SQLModel, table=True):
@@ -70,5 +88,9 @@ class JiraIssueTypeStatus(SQLModel, table=True):
         sa_column=Column(JSON, nullable=False, server_default="[]"),
         description="Statuses that qualify issues of this type for embedding",
     )
-    created_at: datetime | None = Field(default_factory=datetime.utcnow)
-    updated_at: datetime | None = Field(default_factory=datetime.utcnow)
+    created_at: datetime | None = Field(
+        default=None, sa_column_kwargs=_CREATED_AT_KWARGS
+    )
+    updated_at: datetime | None = Field(
+        default=None, sa_column_kwargs=_UPDATED_AT_KWARGS
+    )
@@ -4,9 +4,10 @@ import urllib.parse
 from datetime import datetime
 from typing import Any, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import RedirectResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse, RedirectResponse
 
+from app.api.embedding.embedding_sync_service import SyncAllRequest
 from app.api.integrations.Jira.jira_model import JiraOAuthToken
 from app.api.integrations.Jira.jira_schema import (
     JiraAssignedIssue,
@@ -22,9 +23,17 @@ from app.api.integrations.Jira.jira_schema import (
     JiraLiveStatsResponse,
     JiraSyncRequest,
     JiraSyncResponse,
+    JiraSyncTaskResponse,
     JiraUser,
 )
-from app.api.integrations.Jira.jira_service import JiraIntegrationService
+from app.api.integrations.Jira.jira_service import (
+    JiraIntegrationService,
+    clear_jira_directory_cache,
+)
+from app.api.tasks.task_service import (
+    SyncTaskAlreadyRunningError,
+    enqueue_embedding_task,
+)
 from app.api.user.user_model import Role
 from app.core.config import settings
 from app.utils.deps import RoleChecker, SessionDep
@@ -37,7 +46,7 @@ router = APIRouter(prefix="/jira", tags=["jira"])
     response_model=JiraAuthConnectResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def connect_jira(session: SessionDep) -> JiraAuthConnectResponse:
+def connect_jira(session: SessionDep) -> JiraAuthConnectResponse:
     """Initiate Atlassian OAuth (3LO) for Jira Cloud."""
     try:
         jira_service = JiraIntegrationService(session)
@@ -49,7 +58,7 @@ async def connect_jira(session: SessionDep) -> JiraAuthConnectResponse:
 
 
 @router.get("/auth/callback")
-async def jira_oauth_callback(
+def jira_oauth_callback(
     session: SessionDep,
     code: str = Query(..., description="Authorization code from Atlassian"),
     state: str = Query(..., description="State returned by Atlassian"),
@@ -85,7 +94,7 @@ async def jira_oauth_callback(
 @router.get(
     "/auth/status", dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))]
 )
-async def get_jira_auth_status(session: SessionDep) -> dict[str, Any]:
+def get_jira_auth_status(session: SessionDep) -> dict[str, Any]:
     """Return Jira OAuth connection status for the configuration page."""
     token = (
         session.query(JiraOAuthToken)
@@ -131,12 +140,13 @@ async def get_jira_auth_status(session: SessionDep) -> dict[str, Any]:
     "/auth/disconnect",
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def disconnect_jira_auth(session: SessionDep) -> dict[str, str]:
+def disconnect_jira_auth(session: SessionDep) -> dict[str, str]:
     """Disconnect Jira OAuth by removing stored tokens."""
     tokens = session.query(JiraOAuthToken).all()
     for token in tokens:
         session.delete(token)
     session.commit()
+    clear_jira_directory_cache()
     return {"message": "Jira disconnected successfully"}
 
 
@@ -145,7 +155,7 @@ async def disconnect_jira_auth(session: SessionDep) -> dict[str, str]:
     response_model=list[JiraUser],
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_jira_users(
+def get_jira_users(
     session: SessionDep,
     max_results: int = Query(default=100, ge=1, le=500),
 ) -> list[JiraUser]:
@@ -166,7 +176,7 @@ async def get_jira_users(
     response_model=list[JiraIssueTypeStatusResponse],
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def sync_issue_type_statuses(
+def sync_issue_type_statuses(
     session: SessionDep,
 ) -> list[JiraIssueTypeStatusResponse]:
     """Fetch issue types and their workflow statuses from Jira.
@@ -188,7 +198,7 @@ async def sync_issue_type_statuses(
     response_model=list[JiraIssueTypeStatusResponse],
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_issue_type_statuses(
+def get_issue_type_statuses(
     session: SessionDep,
 ) -> list[JiraIssueTypeStatusResponse]:
     """Return all issue types with their available and selected statuses."""
@@ -207,7 +217,7 @@ async def get_issue_type_statuses(
     response_model=JiraIssueTypeStatusResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def update_issue_type_selected_statuses(
+def update_issue_type_selected_statuses(
     session: SessionDep,
     issue_type_id: str,
     body: JiraIssueTypeStatusUpdateRequest,
@@ -231,13 +241,14 @@ async def update_issue_type_selected_statuses(
 @router.get(
     "/projects", dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))]
 )
-async def get_projects(session: SessionDep) -> list[dict[str, Any]]:
+def get_projects(session: SessionDep) -> JSONResponse:
     """
     Get all accessible Jira projects.
     """
     try:
         jira_service = JiraIntegrationService(session)
-        return jira_service.get_all_projects()
+        # Plain JSON from Jira; skip response-model validation and encoding
+        return JSONResponse(jira_service.get_all_projects())
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -249,11 +260,11 @@ async def get_projects(session: SessionDep) -> list[dict[str, Any]]:
 @router.get(
     "/issue-types", dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))]
 )
-async def get_issue_types(session: SessionDep) -> list[dict[str, Any]]:
+def get_issue_types(session: SessionDep) -> JSONResponse:
     """Get all available Jira issue types (excludes subtasks)."""
     try:
         jira_service = JiraIntegrationService(session)
-        return jira_service.fetch_issue_types()
+        return JSONResponse(jira_service.fetch_issue_types())
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -267,7 +278,7 @@ async def get_issue_types(session: SessionDep) -> list[dict[str, Any]]:
     response_model=JiraIssueDetailResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_issue(
+def get_issue(
     session: SessionDep,
     issue_key: str,
 ) -> JiraIssueDetailResponse:
@@ -286,7 +297,7 @@ async def get_issue(
     response_model=JiraCreateIssueResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def create_issue(
+def create_issue(
     session: SessionDep,
     request: JiraCreateIssueRequest,
 ) -> JiraCreateIssueResponse:
@@ -310,7 +321,7 @@ async def create_issue(
     response_model=JiraAssignIssueResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def assign_issue(
+def assign_issue(
     session: SessionDep,
     issue_key: str,
     request: JiraAssignIssueRequest,
@@ -328,17 +339,48 @@ async def assign_issue(
 @router.post(
     "/sync",
     response_model=JiraSyncResponse,
+    responses={202: {"model": JiraSyncTaskResponse}},
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def sync_issues(
+def sync_issues(
     session: SessionDep,
     request: JiraSyncRequest,
-) -> JiraSyncResponse:
+    background_tasks: BackgroundTasks,
+    wait: bool = Query(
+        default=True,
+        description="Run the sync in the request; false queues it as a task (202)",
+    ),
+) -> JiraSyncResponse | JSONResponse:
     """
     Trigger a manual sync of Jira issues.
     This endpoint satisfies the requirement for Workplace Administrators
     to initiate a manual sync (POST /api/v1/jira/sync).
+
+    With ``wait=false`` the sync runs as a background embedding task; poll
+    ``/tasks/status/{task_id}`` for progress.
     """
+    if not wait:
+        if not request.generate_embeddings:
+            raise HTTPException(
+                status_code=400,
+                detail="Background syncs always generate embeddings",
+            )
+        sync_request = SyncAllRequest(
+            sync_github=False,
+            jira_project_keys=request.project_keys,
+            jira_max_issues=request.max_results,
+            jira_include_closed=request.include_closed,
+            jira_sync_comments=request.sync_comments,
+        )
+        try:
+            task_id = enqueue_embedding_task(background_tasks, sync_request)
+        except SyncTaskAlreadyRunningError as exc:
+            raise HTTPException(status_code=409, detail=str(exc))
+        return JSONResponse(
+            status_code=202,
+            content=JiraSyncTaskResponse(task_id=task_id, status="queued").model_dump(),
+        )
+
     try:
         jira_service = JiraIntegrationService(session)
         return jira_service.sync_issues(
@@ -359,7 +401,7 @@ async def sync_issues(
     response_model=JiraLiveStatsResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_jira_live_stats(
+def get_jira_live_stats(
     session: SessionDep,
     project_keys: list[str] | None = Query(
         default=None, description="Optional project keys to filter stats"
@@ -382,9 +424,7 @@ async def get_jira_live_stats(
     response_model=JiraDeveloperStats,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_developer_stats(
-    session: SessionDep, account_id: str
-) -> JiraDeveloperStats:
+def get_developer_stats(session: SessionDep, account_id: str) -> JiraDeveloperStats:
     """Fetch real-time task statistics for a specific Jira user."""
     try:
         jira_service = JiraIntegrationService(session)
@@ -402,7 +442,7 @@ async def get_developer_stats(
     response_model=list[JiraAssignedIssue],
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_developer_issues(
+def get_developer_issues(
     session: SessionDep,
     account_id: str,
     max_results: int = Query(default=50, ge=1, le=200),
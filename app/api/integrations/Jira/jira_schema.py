@@ -2,7 +2,13 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_validator
+
+
+def dedupe_project_keys(value: list[str] | None) -> list[str] | None:
+    """Drop repeated Jira project keys, keeping first-seen order."""
+    # Each key costs a JQL search
+    return list(dict.fromkeys(value)) if value is not None else None
 
 
 class JiraAuthConnectResponse(BaseModel):
@@ -28,7 +34,7 @@ class JiraUser(BaseModel):
     account_id: str = Field(..., description="Jira account ID")
     display_name: str | None = Field(default=None, description="User display name")
     email_address: str | None = Field(default=None, description="User email address")
-    avatar_url: HttpUrl | None = Field(default=None, description="User avatar URL")
+    avatar_url: str | None = Field(default=None, description="User avatar URL")
     active: bool = Field(default=True, description="Whether user is active")
 
 
@@ -56,7 +62,7 @@ class JiraIssueContent(BaseModel):
     labels: list[str] = Field(default_factory=list)
     assignee: JiraUser | None = None
     reporter: JiraUser | None = None
-    issue_url: HttpUrl
+    issue_url: str
     comments: list[JiraComment] = Field(default_factory=list)
     created_at: datetime | None = None
     updated_at: datetime | None = None
@@ -73,7 +79,9 @@ class JiraSyncRequest(BaseModel):
     """Request schema for manual Jira sync."""
 
     project_keys: list[str] | None = Field(
-        default=None, description="Specific projects to sync. If None, syncs all."
+        default=None,
+        max_length=200,
+        description="Specific projects to sync. If None, syncs all.",
     )
     max_results: int = Field(
         default=100, ge=1, le=1000, description="Maximum issues to fetch per project"
@@ -84,6 +92,18 @@ class JiraSyncRequest(BaseModel):
         default=True, description="Generate embeddings for NLP"
     )
 
+    @field_validator("project_keys")
+    @classmethod
+    def normalize_project_keys(cls, value: list[str] | None) -> list[str] | None:
+        return dedupe_project_keys(value)
+
+
+class JiraSyncTaskResponse(BaseModel):
+    """Response schema for a Jira sync queued as a background task."""
+
+    task_id: str
+    status: str
+
 
 class JiraSyncResponse(BaseModel):
     """Response schema for Jira sync operation."""
@@ -187,7 +207,7 @@ class JiraAssigneeStats(BaseModel):
 
     account_id: str
     display_name: str
-    avatar_url: HttpUrl | None = None
+    avatar_url: str | None = None
     task_count: int
 
 
@@ -5,8 +5,10 @@ import hmac
 import logging
 import re
 import secrets
+import threading
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, cast
 
@@ -47,6 +49,72 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Jira markup ({code}, {quote}, etc.) and user mentions ([~name]), stripped in
+# a single pass over the description.
+_JIRA_CLEAN_RE = re.compile(r"\{[^}]+\}|\[~[^\]]+\]")
+# A trailing "+HHMM" / "-HHMM" UTC offset without the colon.
+_JIRA_OFFSET_RE = re.compile(r"([+-]\d{2})(\d{2})$")
+
+# Projects and users change on human timescales; cache the listings per Jira
+# server so configuration pages don't pay an Atlassian round-trip on each load.
+JIRA_DIRECTORY_CACHE_TTL_SECONDS = 60
+# The project list changes even less often and also seeds syncs that have no
+# configured project keys, so it is kept for longer.
+JIRA_PROJECTS_CACHE_TTL_SECONDS = 300
+_directory_cache: dict[tuple[str, str, int], tuple[float, list[Any]]] = {}
+_directory_cache_lock = threading.Lock()
+
+# Live workload searches page through at most this many open issues.
+JIRA_SEARCH_PAGE_SIZE = 100
+JIRA_SEARCH_MAX_RESULTS = 1000
+# Pages after the first are fetched concurrently; kept low to stay clear of 429s.
+JIRA_SEARCH_WORKERS = 8
+
+# The workloads page, dashboard and best-fit scoring all ask for the same live
+# counts; share one search per server and assignee set for a short window.
+# Issue writes made through this service clear it immediately.
+JIRA_WORKLOAD_CACHE_TTL_SECONDS = 30
+_workload_cache: dict[tuple[str, tuple[str, ...]], tuple[float, dict[str, int]]] = {}
+_workload_cache_lock = threading.Lock()
+
+# Shared pooled client so OAuth and Jira REST calls reuse keep-alive connections
+# instead of paying a TCP+TLS handshake per request. Thread-safe; closed on
+# shutdown.
+_http_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    timeout=10,
+)
+
+
+def _parse_jira_timestamp(value: str | None) -> datetime | None:
+    """Parse a Jira ISO-8601 timestamp, or return None when it is missing."""
+    if not value:
+        return None
+    # Jira sends "+0000"-style offsets and the odd trailing "Z"; Python 3.10's
+    # fromisoformat only accepts "+00:00", so both are rewritten to that form.
+    if value[-1] == "Z":
+        value = f"{value[:-1]}+00:00"
+    else:
+        value = _JIRA_OFFSET_RE.sub(r"\1:\2", value)
+    return datetime.fromisoformat(value)
+
+
+def close_jira_http_client() -> None:
+    """Close the pooled connections held by the shared Jira HTTP client."""
+    _http_client.close()
+
+
+def clear_jira_directory_cache() -> None:
+    """Drop cached project and user listings for every Jira server."""
+    with _directory_cache_lock:
+        _directory_cache.clear()
+
+
+def clear_jira_workload_cache() -> None:
+    """Drop cached live workload counts for every Jira server."""
+    with _workload_cache_lock:
+        _workload_cache.clear()
+
 
 class JiraIntegrationService:
     """Service class for Jira API integration."""
@@ -58,6 +126,8 @@ class JiraIntegrationService:
         )
         self._vector_service: VectorEmbeddingService | None = None
         self._client: JIRA | None = None
+        # Active OAuth token, reused for the life of this service instance
+        self._active_token: JiraOAuthToken | None = None
 
         # Load integration config from database or settings
         self.integration = db.query(JiraOrgIntegration).first()
@@ -79,25 +149,25 @@ class JiraIntegrationService:
         issued_at = int(time.time())
         nonce = secrets.token_urlsafe(16)
         body = f"{issued_at}:{ttl_seconds}:{nonce}"
-        sig = hmac.new(
+        return f"{body}:{self._sign_state(body)}"
+
+    @staticmethod
+    def _sign_state(body: str) -> str:
+        return hmac.new(
             key=settings.SECRET_KEY.encode(),
             msg=body.encode(),
             digestmod=hashlib.sha256,
         ).hexdigest()
-        return f"{body}:{sig}"
 
     def _verify_state(self, state: str) -> bool:
         try:
-            issued_at_str, ttl_str, nonce, provided_sig = state.split(":", 3)
-            body = f"{issued_at_str}:{ttl_str}:{nonce}"
-            expected_sig = hmac.new(
-                key=settings.SECRET_KEY.encode(),
-                msg=body.encode(),
-                digestmod=hashlib.sha256,
-            ).hexdigest()
-            if not hmac.compare_digest(expected_sig, provided_sig):
+            # The signature covers everything before the last colon, so the
+            # signed body is checked as-is before it is parsed.
+            body, _, provided_sig = state.rpartition(":")
+            if not hmac.compare_digest(self._sign_state(body), provided_sig):
                 return False
 
+            issued_at_str, ttl_str, _nonce = body.split(":", 2)
             issued_at = int(issued_at_str)
             ttl = int(ttl_str)
             return (int(time.time()) - issued_at) <= ttl
@@ -148,7 +218,7 @@ class JiraIntegrationService:
             "redirect_uri": str(settings.ATLASSIAN_REDIRECT_URI),
         }
 
-        resp = httpx.post(str(settings.ATLASSIAN_TOKEN_URL), json=payload, timeout=10)
+        resp = _http_client.post(str(settings.ATLASSIAN_TOKEN_URL), json=payload)
         if resp.status_code != 200:
             raise ValueError(f"Token exchange failed ({resp.status_code}): {resp.text}")
 
@@ -162,6 +232,9 @@ class JiraIntegrationService:
         if not access_token:
             raise ValueError("Token exchange succeeded but access_token missing")
 
+        # A new connection may grant access to a different set of projects
+        clear_jira_directory_cache()
+
         # Discover accessible resources to capture cloud_id and site URL
         cloud_id = None
         jira_site_url = None
@@ -188,10 +261,9 @@ class JiraIntegrationService:
         )
 
     def _fetch_accessible_resources(self, access_token: str) -> list[dict[str, Any]]:
-        resp = httpx.get(
+        resp = _http_client.get(
             "https://api.atlassian.com/oauth/token/accessible-resources",
             headers={"Authorization": f"Bearer {access_token}"},
-            timeout=10,
         )
         if resp.status_code != 200:
             raise ValueError(
@@ -234,7 +306,6 @@ class JiraIntegrationService:
             token.token_type = token_type or "Bearer"
             token.cloud_id = cloud_id or token.cloud_id
             token.jira_site_url = jira_site_url or token.jira_site_url
-            token.updated_at = self._now()
         else:
             token = JiraOAuthToken(
                 access_token=access_token,
@@ -250,9 +321,14 @@ class JiraIntegrationService:
         self.db.commit()
         self.db.refresh(token)
         self._client = None
+        self._active_token = None
         return token
 
     def _get_active_token(self) -> JiraOAuthToken | None:
+        cached = self._active_token
+        if cached and cached.expires_at > self._now() + timedelta(seconds=90):
+            return cached
+
         token = (
             self.db.query(JiraOAuthToken)
             .order_by(cast(Any, JiraOAuthToken.expires_at).desc())
@@ -270,6 +346,7 @@ class JiraIntegrationService:
                 return None
             token = self._refresh_access_token(token)
 
+        self._active_token = token
         return token
 
     def _refresh_access_token(self, token: JiraOAuthToken) -> JiraOAuthToken:
@@ -283,7 +360,7 @@ class JiraIntegrationService:
             "refresh_token": token.refresh_token,
         }
 
-        resp = httpx.post(str(settings.ATLASSIAN_TOKEN_URL), json=payload, timeout=10)
+        resp = _http_client.post(str(settings.ATLASSIAN_TOKEN_URL), json=payload)
         if resp.status_code != 200:
             raise ValueError(f"Token refresh failed ({resp.status_code}): {resp.text}")
 
@@ -394,9 +471,29 @@ class JiraIntegrationService:
 
         return settings.JIRA_URL or ""
 
+    def _get_cached_directory(
+        self, key: tuple[str, str, int], ttl: float = JIRA_DIRECTORY_CACHE_TTL_SECONDS
+    ) -> list[Any] | None:
+        now = time.monotonic()
+        with _directory_cache_lock:
+            cached = _directory_cache.get(key)
+        if cached and now - cached[0] < ttl:
+            return list(cached[1])
+        return None
+
+    def _set_cached_directory(
+        self, key: tuple[str, str, int], items: list[Any]
+    ) -> None:
+        with _directory_cache_lock:
+            _directory_cache[key] = (time.monotonic(), list(items))
+
     def get_all_projects(self) -> list[dict[str, Any]]:
-        """Retrieve all accessible Jira projects."""
+        """Retrieve all accessible Jira projects, cached for a short TTL."""
         client = self.get_jira_client()
+        cache_key = (client._options["server"], "projects", 0)
+        cached = self._get_cached_directory(cache_key, JIRA_PROJECTS_CACHE_TTL_SECONDS)
+        if cached is not None:
+            return cached
 
         auth_header = client._session.headers.get("Authorization")
         if not auth_header:
@@ -409,7 +506,7 @@ class JiraIntegrationService:
         }
 
         try:
-            resp = httpx.get(
+            resp = _http_client.get(
                 f"{server}/rest/api/3/project",
                 headers=headers,
                 timeout=10,
@@ -429,7 +526,7 @@ class JiraIntegrationService:
 
             data = resp.json()
             projects = data if isinstance(data, list) else data.get("values", [])
-            return [
+            result = [
                 {
                     "key": p.get("key"),
                     "name": p.get("name"),
@@ -440,9 +537,16 @@ class JiraIntegrationService:
         except httpx.RequestError as e:
             raise ValueError(f"HTTP error fetching projects: {str(e)}")
 
+        self._set_cached_directory(cache_key, result)
+        return result
+
     def get_all_jira_users(self, max_results: int = 100) -> list[JiraUser]:
-        """Retrieve all users from Jira Cloud."""
+        """Retrieve all users from Jira Cloud, cached for a short TTL."""
         client = self.get_jira_client()
+        cache_key = (client._options["server"], "users", max_results)
+        cached = self._get_cached_directory(cache_key)
+        if cached is not None:
+            return cached
 
         auth_header = client._session.headers.get("Authorization")
         if not auth_header:
@@ -456,7 +560,7 @@ class JiraIntegrationService:
 
         try:
             # Use the users/search endpoint for Jira Cloud
-            resp = httpx.get(
+            resp = _http_client.get(
                 f"{server}/rest/api/3/users/search",
                 headers=headers,
                 params={"maxResults": max_results},
@@ -471,7 +575,7 @@ class JiraIntegrationService:
                 )
 
             users = resp.json()
-            return [
+            result = [
                 JiraUser(
                     account_id=u.get("accountId"),
                     display_name=u.get("displayName"),
@@ -485,6 +589,9 @@ class JiraIntegrationService:
         except httpx.RequestError as e:
             raise ValueError(f"HTTP error fetching users: {str(e)}")
 
+        self._set_cached_directory(cache_key, result)
+        return result
+
     def fetch_issues(
         self,
         project_key: str | None = None,
@@ -547,7 +654,7 @@ class JiraIntegrationService:
             "Accept": "application/json",
         }
 
-        resp = httpx.get(
+        resp = _http_client.get(
             f"{server}/rest/api/3/issuetype",
             headers=headers,
             timeout=10,
@@ -587,7 +694,7 @@ class JiraIntegrationService:
             "Accept": "application/json",
         }
 
-        resp = httpx.get(
+        resp = _http_client.get(
             f"{server}/rest/api/3/project/{project_key}/statuses",
             headers=headers,
             timeout=10,
@@ -652,7 +759,6 @@ class JiraIntegrationService:
                 existing.selected_statuses = [
                     s for s in existing.selected_statuses if s in available
                 ]
-                existing.updated_at = self._now()
             else:
                 default_selected = self._detect_terminal_statuses(available)
                 existing = JiraIssueTypeStatus(
@@ -718,7 +824,6 @@ class JiraIntegrationService:
             )
 
         row.selected_statuses = selected_statuses
-        row.updated_at = self._now()
         self.db.commit()
         self.db.refresh(row)
         return self._to_response(row)
@@ -737,12 +842,7 @@ class JiraIntegrationService:
         avatar_url = None
         if hasattr(user_data, "avatarUrls") and user_data.avatarUrls:
             # Try to get the 48x48 avatar URL using getattr
-            avatar_48 = getattr(user_data.avatarUrls, "48x48", None)
-            if avatar_48:
-                try:
-                    avatar_url = HttpUrl(avatar_48)
-                except Exception:
-                    pass
+            avatar_url = getattr(user_data.avatarUrls, "48x48", None) or None
 
         return JiraUser(
             account_id=getattr(user_data, "accountId", "") or "",
@@ -777,31 +877,15 @@ class JiraIntegrationService:
                             id=c.id,
                             author=author,
                             body=getattr(c, "body", ""),
-                            created=datetime.fromisoformat(
-                                c.created.replace("Z", "+00:00")
-                            ),
-                            updated=datetime.fromisoformat(
-                                c.updated.replace("Z", "+00:00")
-                            )
-                            if hasattr(c, "updated") and c.updated
-                            else None,
+                            created=cast(datetime, _parse_jira_timestamp(c.created)),
+                            updated=_parse_jira_timestamp(getattr(c, "updated", None)),
                         )
                     )
 
         # Parse timestamps
-        created_at = None
-        if hasattr(fields, "created") and fields.created:
-            created_at = datetime.fromisoformat(fields.created.replace("Z", "+00:00"))
-
-        updated_at = None
-        if hasattr(fields, "updated") and fields.updated:
-            updated_at = datetime.fromisoformat(fields.updated.replace("Z", "+00:00"))
-
-        resolved_at = None
-        if hasattr(fields, "resolutiondate") and fields.resolutiondate:
-            resolved_at = datetime.fromisoformat(
-                fields.resolutiondate.replace("Z", "+00:00")
-            )
+        created_at = _parse_jira_timestamp(getattr(fields, "created", None))
+        updated_at = _parse_jira_timestamp(getattr(fields, "updated", None))
+        resolved_at = _parse_jira_timestamp(getattr(fields, "resolutiondate", None))
 
         issue_content = JiraIssueContent(
             issue_id=issue.id,
@@ -815,7 +899,7 @@ class JiraIntegrationService:
             labels=labels,
             assignee=assignee,
             reporter=reporter,
-            issue_url=HttpUrl(f"{self.jira_url}/browse/{issue.key}"),
+            issue_url=f"{self.jira_url}/browse/{issue.key}",
             comments=comments,
             created_at=created_at,
             updated_at=updated_at,
@@ -919,7 +1003,7 @@ class JiraIntegrationService:
             JiraAssigneeStats(
                 account_id=a["account_id"],
                 display_name=a["display_name"],
-                avatar_url=HttpUrl(a["avatar_url"]) if a["avatar_url"] else None,
+                avatar_url=a["avatar_url"] or None,
                 task_count=a["task_count"],
             )
             for a in top_assignee_data
@@ -1020,8 +1104,8 @@ class JiraIntegrationService:
         """Return real-time active Jira task counts for the provided assignees.
 
         This method is intended for capacity-aware ranking during best-fit scoring.
-        It fetches non-done issues once and aggregates counts only for the supplied
-        Jira account IDs.
+        It fetches only the non-done issues assigned to the supplied Jira account
+        IDs in one paged search, then aggregates counts per assignee.
         """
         account_ids = [account_id for account_id in assignee_account_ids if account_id]
         if not account_ids:
@@ -1031,23 +1115,48 @@ class JiraIntegrationService:
         workload_by_assignee = dict.fromkeys(tracked_ids, 0)
 
         client = self.get_jira_client()
-        jql = "statusCategory != Done"
+        cache_key = (client._options["server"], tuple(sorted(tracked_ids)))
+        now = time.monotonic()
+        with _workload_cache_lock:
+            cached = _workload_cache.get(cache_key)
+        if cached and now - cached[0] < JIRA_WORKLOAD_CACHE_TTL_SECONDS:
+            return dict(cached[1])
+
+        assignees = ", ".join(f'"{account_id}"' for account_id in sorted(tracked_ids))
+        jql = f"statusCategory != Done AND assignee in ({assignees})"
         fields = ["assignee"]
 
-        batch_size = 100
-        start_at = 0
-
-        while True:
-            issues = client.search_issues(
-                jql,
-                startAt=start_at,
-                maxResults=batch_size,
-                fields=fields,
+        def fetch_page(start_at: int) -> list[Issue]:
+            return cast(
+                list[Issue],
+                client.search_issues(
+                    jql,
+                    startAt=start_at,
+                    maxResults=JIRA_SEARCH_PAGE_SIZE,
+                    fields=fields,
+                ),
             )
 
-            if not issues:
-                break
-
+        # The first page reports the total, so the remaining pages can overlap.
+        first_page = fetch_page(0)
+        total = getattr(first_page, "total", len(first_page))
+        if total > JIRA_SEARCH_MAX_RESULTS:
+            logger.warning(
+                "Reached 1000 issue limit for assignee workload map; results may be partial."
+            )
+        offsets = range(
+            JIRA_SEARCH_PAGE_SIZE,
+            min(total, JIRA_SEARCH_MAX_RESULTS),
+            JIRA_SEARCH_PAGE_SIZE,
+        )
+        pages = [first_page]
+        if offsets:
+            with ThreadPoolExecutor(
+                max_workers=min(JIRA_SEARCH_WORKERS, len(offsets))
+            ) as executor:
+                pages.extend(executor.map(fetch_page, offsets))
+
+        for issues in pages:
             for issue in issues:
                 assignee = getattr(issue.fields, "assignee", None)
                 if not assignee:
@@ -1056,16 +1165,8 @@ class JiraIntegrationService:
                 if account_id in tracked_ids:
                     workload_by_assignee[account_id] += 1
 
-            if len(issues) < batch_size:
-                break
-
-            start_at += batch_size
-            if start_at >= 1000:
-                logger.warning(
-                    "Reached 1000 issue limit for assignee workload map; results may be partial."
-                )
-                break
-
+        with _workload_cache_lock:
+            _workload_cache[cache_key] = (now, dict(workload_by_assignee))
         return workload_by_assignee
 
     def _generate_issue_context(self, issue: JiraIssueContent) -> str:
@@ -1076,13 +1177,8 @@ class JiraIntegrationService:
         # Clean description
         clean_description = ""
         if issue.description:
-            # Remove Jira markup/formatting
-            clean_description = re.sub(
-                r"\{[^}]+\}", "", issue.description
-            )  # Remove {code}, {quote}, etc.
-            clean_description = re.sub(
-                r"\[~[^\]]+\]", "", clean_description
-            )  # Remove user mentions
+            # Remove Jira markup/formatting and user mentions
+            clean_description = _JIRA_CLEAN_RE.sub("", issue.description)
             clean_description = clean_description[:1500]  # Limit length
 
         # Build context
@@ -1124,13 +1220,15 @@ class JiraIntegrationService:
         that type's ``selected_statuses`` list are embedded.  If no config
         exists yet, issue types are auto-synced with sensible defaults.
         """
-        import time
-
         start_time = time.time()
 
+        # Workloads are recounted after a sync; the project list is reused from
+        # the directory cache so back-to-back syncs skip the listing call.
+        clear_jira_workload_cache()
+
         if project_keys is None:
             if self.integration and self.integration.project_keys:
-                project_keys = self.integration.project_keys.split(",")
+                project_keys = list(self.integration.project_keys)
             else:
                 projects = self.get_all_projects()
                 project_keys = [p["key"] for p in projects]
@@ -1155,43 +1253,62 @@ class JiraIntegrationService:
             30  # Minimum length for a Jira issue description to be embedded
         )
 
-        for project_key in project_keys:
-            try:
-                logger.info(f"Syncing Jira project: {project_key}")
-                issues = self.fetch_issues(
+        # Project fetches are network-bound and independent, so they overlap.
+        # Build the client here first: worker threads then reuse it instead of
+        # touching the DB session, and parsing stays on this thread.
+        try:
+            self.get_jira_client()
+            fetch_workers = max(1, min(JIRA_SEARCH_WORKERS, len(project_keys)))
+        except Exception:
+            # Each project reports the failure below; keep session use serial
+            fetch_workers = 1
+
+        with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+            fetches = {
+                project_key: executor.submit(
+                    self.fetch_issues,
                     project_key=project_key,
                     max_results=max_results,
                     include_closed=include_closed,
                 )
+                for project_key in project_keys
+            }
 
-                for issue in issues:
-                    try:
-                        issue_content = self._parse_issue(
-                            issue, include_comments=sync_comments
-                        )
-                        all_issue_contents.append(issue_content)
-
-                        # Only embed issues with sufficient description length
-                        description = issue_content.description or ""
-                        if (
-                            self._matches_selected_status(issue_content, status_map)
-                            and description
-                            and len(description.strip()) >= MIN_DESCRIPTION_LENGTH
-                        ):
-                            embedding_eligible.append(issue_content)
-                        elif self._matches_selected_status(issue_content, status_map):
-                            logger.info(
-                                f"Skipping embedding for Jira issue {issue_content.issue_key}: description too short or missing."
+            # Parse each project as its fetch completes, in order, while later
+            # fetches are still running; popping drops the raw issues once parsed.
+            for project_key in list(fetches):
+                try:
+                    logger.info(f"Syncing Jira project: {project_key}")
+                    issues = fetches.pop(project_key).result()
+
+                    for issue in issues:
+                        try:
+                            issue_content = self._parse_issue(
+                                issue, include_comments=sync_comments
                             )
-                    except Exception as e:
-                        error_msg = f"Error processing issue {issue.key}: {str(e)}"
-                        logger.error(error_msg)
-                        errors.append(error_msg)
+                            all_issue_contents.append(issue_content)
+
+                            if not self._matches_selected_status(
+                                issue_content, status_map
+                            ):
+                                continue
+                            # Only embed issues with sufficient description length
+                            description = (issue_content.description or "").strip()
+                            if len(description) >= MIN_DESCRIPTION_LENGTH:
+                                embedding_eligible.append(issue_content)
+                            else:
+                                logger.info(
+                                    f"Skipping embedding for Jira issue {issue_content.issue_key}: description too short or missing."
+                                )
+                        except Exception as e:
+                            error_msg = f"Error processing issue {issue.key}: {str(e)}"
+                            logger.error(error_msg)
+                            errors.append(error_msg)
 
-            except Exception as e:
-                error_msg = f"Error syncing project {project_key}: {str(e)}"
-                logger.error(error_msg)
-                errors.append(error_msg)
+                except Exception as e:
+                    error_msg = f"Error syncing project {project_key}: {str(e)}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
 
         if generate_embeddings and embedding_eligible:
             try:
@@ -1252,7 +1369,7 @@ class JiraIntegrationService:
         The embedding generation step (model inference) can take many minutes.
         To avoid PostgreSQL killing the idle-in-transaction connection we:
         1. Release any open transaction **before** the expensive compute.
-        2. Write results back in small batches with per-item rollback recovery.
+        2. Write results back with batched multi-row upserts.
         """
         if not issues:
             return (0, 0)
@@ -1307,6 +1424,7 @@ class JiraIntegrationService:
             raw = self.vector_service.generate_embeddings(
                 contexts,
                 prompt_name=settings.JIRA_DOCUMENT_PROMPT_NAME,
+                use_cache=True,
             )
             embeddings = cast(list[list[float] | None], raw)
         except Exception as e:
@@ -1356,51 +1474,35 @@ class JiraIntegrationService:
                             )
                             embeddings.append(None)
 
-        # --- Phase 3: write to DB in batches with per-item recovery -----------
-        created_count = 0
-        batch_size = 10
-
-        for idx, (issue, embedding) in enumerate(
-            zip(new_issues, embeddings, strict=False)
-        ):
-            if embedding is None:
-                continue
-
-            try:
-                normalized = self.vector_service._normalize_embedding_dimension(
-                    embedding
-                )
-
-                # We already know these are new, so just create
-                db_vector = JiraIssueVector(
-                    issue_id=issue.issue_id,
-                    issue_key=issue.issue_key,
-                    project_key=issue.project_key,
-                    assignee_account_id=(
-                        issue.assignee.account_id if issue.assignee else None
-                    ),
-                    embedding=normalized,
-                    context=issue.context or "",
-                )
-                self.db.add(db_vector)
-                created_count += 1
-
-                if (idx + 1) % batch_size == 0:
-                    self.db.commit()
-
-            except Exception as e:
-                logger.error(f"Error storing embedding for {issue.issue_key}: {str(e)}")
-                try:
-                    self.db.rollback()
-                except Exception:
-                    pass
+        # --- Phase 3: bulk upsert the new vectors ------------------------------
+        now = datetime.utcnow()
+        rows = [
+            {
+                "issue_id": issue.issue_id,
+                "issue_key": issue.issue_key,
+                "project_key": issue.project_key,
+                "assignee_account_id": (
+                    issue.assignee.account_id if issue.assignee else None
+                ),
+                "embedding": embedding,
+                "context": issue.context or "",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for issue, embedding in zip(new_issues, embeddings, strict=False)
+            if embedding is not None
+        ]
 
-        # Flush remaining items
+        created_count = 0
         try:
+            created_count = self.vector_service.upsert_vectors_isolating_failures(
+                JiraIssueVector, rows, "issue_id"
+            )
             self.db.commit()
         except Exception as e:
-            logger.error(f"Error committing final embedding batch: {str(e)}")
+            logger.error(f"Error storing Jira issue embeddings: {str(e)}")
             self.db.rollback()
+            created_count = 0
 
         logger.info(
             f"Stored {created_count} new Jira issue vectors. Skipped {skipped_count} existing."
@@ -1417,25 +1519,28 @@ class JiraIntegrationService:
             if issue.assignee and issue.assignee.account_id:
                 assignees[issue.assignee.account_id] = issue
 
-        for account_id, issue in assignees.items():
-            try:
-                profile = (
-                    self.db.query(ResourceProfile)
-                    .filter(cast(Any, ResourceProfile.jira_account_id == account_id))
-                    .first()
-                )
+        if not assignees:
+            return
 
-                if profile:
-                    if issue.assignee:
-                        profile.jira_display_name = issue.assignee.display_name
-                        profile.jira_email = issue.assignee.email_address
-                # Note: Don't create new profiles here - they should be created
-                # via the profiles API when users connect their Jira accounts
+        # One IN query for all assignees instead of a lookup per account.
+        account_id_column = cast(Any, ResourceProfile.jira_account_id)
+        try:
+            profiles = (
+                self.db.query(ResourceProfile)
+                .filter(account_id_column.in_(list(assignees)))
+                .all()
+            )
+        except Exception as e:
+            logger.warning(f"Error loading resource profiles for assignees: {str(e)}")
+            return
 
-            except Exception as e:
-                logger.warning(
-                    f"Error updating resource profile for {account_id}: {str(e)}"
-                )
+        # Note: Don't create new profiles here - they should be created
+        # via the profiles API when users connect their Jira accounts
+        for profile in profiles:
+            assignee = assignees[cast(str, profile.jira_account_id)].assignee
+            if assignee:
+                profile.jira_display_name = assignee.display_name
+                profile.jira_email = assignee.email_address
 
     def get_issue(self, issue_key: str) -> JiraIssueDetailResponse:
         """Fetch a single Jira issue by its key."""
@@ -1450,7 +1555,7 @@ class JiraIntegrationService:
             "Accept": "application/json",
         }
 
-        resp = httpx.get(
+        resp = _http_client.get(
             f"{server}/rest/api/3/issue/{issue_key}",
             headers=headers,
             params={"fields": "summary,description,assignee,status,issuetype"},
@@ -1600,7 +1705,7 @@ class JiraIntegrationService:
         if assignee_account_id:
             issue_fields["assignee"] = {"id": assignee_account_id}
 
-        resp = httpx.post(
+        resp = _http_client.post(
             f"{server}/rest/api/3/issue",
             headers=headers,
             json={"fields": issue_fields},
@@ -1612,6 +1717,7 @@ class JiraIntegrationService:
                 f"Failed to create issue: HTTP {resp.status_code} - {resp.text}"
             )
 
+        clear_jira_workload_cache()
         data = resp.json()
         issue_key = data.get("key", "")
         issue_url = f"{self.jira_url}/browse/{issue_key}"
@@ -1646,7 +1752,7 @@ class JiraIntegrationService:
             "Content-Type": "application/json",
         }
 
-        resp = httpx.put(
+        resp = _http_client.put(
             f"{server}/rest/api/3/issue/{issue_key}/assignee",
             headers=headers,
             json={"accountId": profile.jira_account_id},
@@ -1658,6 +1764,7 @@ class JiraIntegrationService:
                 f"Failed to assign issue: HTTP {resp.status_code} - {resp.text}"
             )
 
+        clear_jira_workload_cache()
         return JiraAssignIssueResponse(
             issue_key=issue_key,
             assigned_to=profile.jira_display_name,
@@ -1675,6 +1782,10 @@ class JiraIntegrationService:
         """
         result: dict[str, Any] = {"event_type": event_type, "processed": False}
 
+        if event_type.startswith("jira:issue_"):
+            # Assignment or status may have changed; live counts are stale
+            clear_jira_workload_cache()
+
         try:
             if event_type in ["jira:issue_created", "jira:issue_updated"]:
                 issue_data = payload.get("issue")
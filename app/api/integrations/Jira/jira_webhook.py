@@ -3,11 +3,13 @@
 import hashlib
 import hmac
 import logging
-from typing import Any
+from datetime import datetime
+from typing import Any, cast
 
 from fastapi import APIRouter, HTTPException, Request
 
 from app.api.integrations.Jira.jira_service import JiraIntegrationService
+from app.api.profiles.profile_model import ResourceProfile
 from app.core.config import settings
 from app.utils.deps import SessionDep
 
@@ -146,11 +148,6 @@ async def jira_webhook(request: Request, session: SessionDep) -> dict[str, Any]:
             # User events - update resource profiles
             user_data = payload.get("user")
             if user_data:
-                from datetime import datetime
-                from typing import cast
-
-                from app.api.profiles.profile_model import ResourceProfile
-
                 account_id = user_data.get("accountId")
                 display_name = user_data.get("displayName")
                 email = user_data.get("emailAddress")
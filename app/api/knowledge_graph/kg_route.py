@@ -52,7 +52,7 @@ class KGExtractEntitiesResponse(BaseModel):
 
 
 @router.post("/extract-entities", response_model=KGExtractEntitiesResponse)
-async def extract_entities(
+def extract_entities(
     request: KGExtractEntitiesRequest = Body(...),
 ) -> KGExtractEntitiesResponse:
     """
@@ -139,7 +139,7 @@ def _get_user_by_id(session: SessionDep, user_id: UUID) -> User:
 @router.post(
     "/graph/build", dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))]
 )
-async def build_knowledge_graph(
+def build_knowledge_graph(
     background_tasks: BackgroundTasks,
     author_github_id: int | None = None,  # optional: rebuild for one author only
     batch_size: int = 50,
@@ -164,7 +164,7 @@ async def build_knowledge_graph(
 
 
 @router.get("/taxonomy", response_model=KGTaxonomyResponse)
-async def get_taxonomy() -> KGTaxonomyResponse:
+def get_taxonomy() -> KGTaxonomyResponse:
     """
     Return the full KG taxonomy for frontend selectors.
 
@@ -209,7 +209,7 @@ async def get_taxonomy() -> KGTaxonomyResponse:
     response_model=KGExperienceProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_my_resource_experience(
+def get_my_resource_experience(
     session: SessionDep,
     current_user: CurrentUser,
 ) -> KGExperienceProfileResponse:
@@ -227,7 +227,7 @@ async def get_my_resource_experience(
     response_model=KGExperienceProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_resource_experience(
+def get_resource_experience(
     session: SessionDep,
     github_id: int,
 ) -> KGExperienceProfileResponse:
@@ -277,7 +277,7 @@ async def get_resource_experience(
     response_model=KGExperienceProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_resource_experience_by_user(
+def get_resource_experience_by_user(
     session: SessionDep,
     user_id: UUID,
 ) -> KGExperienceProfileResponse:
@@ -294,7 +294,7 @@ async def get_resource_experience_by_user(
     response_model=KGExperienceProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def update_resource_experience(
+def update_resource_experience(
     session: SessionDep,
     github_id: int,
     request: KGExperienceUpdateRequest,
@@ -383,7 +383,7 @@ async def update_resource_experience(
     response_model=KGExperienceProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def update_resource_experience_by_user(
+def update_resource_experience_by_user(
     session: SessionDep,
     user_id: UUID,
     request: KGExperienceUpdateRequest,
@@ -432,7 +432,7 @@ async def update_resource_experience_by_user(
         "If the item already exists, its `experience_level` is updated instead."
     ),
 )
-async def add_experience_item(
+def add_experience_item(
     session: SessionDep,
     user_id: UUID,
     category: KGExperienceCategory,
@@ -478,7 +478,7 @@ async def add_experience_item(
         "Returns 422 if `item_name` is not a valid taxonomy value or is not yet in the user's profile."
     ),
 )
-async def update_experience_item_level(
+def update_experience_item_level(
     session: SessionDep,
     user_id: UUID,
     category: KGExperienceCategory,
@@ -519,7 +519,7 @@ async def update_experience_item_level(
         "Returns 422 if `item_name` is unknown or not in the user's profile."
     ),
 )
-async def delete_experience_item(
+def delete_experience_item(
     session: SessionDep,
     user_id: UUID,
     category: KGExperienceCategory,
@@ -552,7 +552,7 @@ async def delete_experience_item(
     response_model=KGLearningIntentProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_my_resource_learning_intent(
+def get_my_resource_learning_intent(
     session: SessionDep,
     current_user: CurrentUser,
 ) -> KGLearningIntentProfileResponse:
@@ -570,7 +570,7 @@ async def get_my_resource_learning_intent(
     response_model=KGLearningIntentProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_resource_learning_intent(
+def get_resource_learning_intent(
     session: SessionDep,
     github_id: int,
 ) -> KGLearningIntentProfileResponse:
@@ -592,7 +592,7 @@ async def get_resource_learning_intent(
     response_model=KGLearningIntentProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_resource_learning_intent_by_user(
+def get_resource_learning_intent_by_user(
     session: SessionDep,
     user_id: UUID,
 ) -> KGLearningIntentProfileResponse:
@@ -610,7 +610,7 @@ async def get_resource_learning_intent_by_user(
     response_model=KGPRInsightsResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_my_resource_pr_insights(
+def get_my_resource_pr_insights(
     session: SessionDep,
     current_user: CurrentUser,
 ) -> KGPRInsightsResponse:
@@ -628,7 +628,7 @@ async def get_my_resource_pr_insights(
     response_model=KGPRInsightsResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_resource_pr_insights(
+def get_resource_pr_insights(
     session: SessionDep,
     github_id: int,
 ) -> KGPRInsightsResponse:
@@ -651,7 +651,7 @@ async def get_resource_pr_insights(
     response_model=KGPRInsightsResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def get_resource_pr_insights_by_user(
+def get_resource_pr_insights_by_user(
     session: SessionDep,
     user_id: UUID,
 ) -> KGPRInsightsResponse:
@@ -665,7 +665,7 @@ async def get_resource_pr_insights_by_user(
 
 
 @router.post("/intent/me", response_model=KGLearningIntentResponse)
-async def ingest_my_learning_intent(
+def ingest_my_learning_intent(
     session: SessionDep,
     current_user: CurrentUser,
     request: KGLearningIntentRequest,
@@ -733,7 +733,7 @@ async def ingest_my_learning_intent(
     response_model=KGLearningIntentResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def ingest_learning_intent_by_user(
+def ingest_learning_intent_by_user(
     session: SessionDep,
     user_id: UUID,
     request: KGLearningIntentRequest,
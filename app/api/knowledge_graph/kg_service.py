@@ -43,6 +43,7 @@ SKILL_VALUE_MAP = {value.lower(): value for value in SKILL_SLUGS}
 LANGUAGE_VALUE_MAP = {value.lower(): value for value in LANGUAGE_SLUGS}
 FRAMEWORK_VALUE_MAP = {value.lower(): value for value in FRAMEWORK_SLUGS}
 TOOL_VALUE_MAP = {value.lower(): value for value in TOOL_SLUGS}
+_LABELS_RE = re.compile(r"LABELS: (.+)")
 
 
 class KnowledgeGraphService:
@@ -458,7 +459,7 @@ class KnowledgeGraphService:
             self._connect_if_missing(pr_a.similar_to, pr_b, {"score": score})
 
     def _extract_labels_from_context(self, context: str) -> list[str]:
-        match = re.search(r"LABELS: (.+)", context)
+        match = _LABELS_RE.search(context)
         if match:
             return [l.strip() for l in match.group(1).split(",") if l.strip()]  # noqa: E741
         return []
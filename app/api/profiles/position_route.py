@@ -17,7 +17,7 @@ router = APIRouter(prefix="/positions", tags=["Job Positions"])
 
 
 @router.post("/", response_model=JobPositionResponse)
-async def create_position(
+def create_position(
     session: SessionDep, _current_user: CurrentUser, request: JobPositionCreate
 ) -> Any:
     """Create a new job position."""
@@ -37,7 +37,7 @@ async def create_position(
 
 
 @router.get("/", response_model=list[JobPositionResponse])
-async def list_positions(
+def list_positions(
     session: SessionDep,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=500),
@@ -48,7 +48,7 @@ async def list_positions(
 
 
 @router.get("/{position_id}", response_model=JobPositionResponse)
-async def get_position(session: SessionDep, position_id: int) -> Any:
+def get_position(session: SessionDep, position_id: int) -> Any:
     """Get a job position by ID."""
     position = session.get(JobPosition, position_id)
     if not position:
@@ -57,7 +57,7 @@ async def get_position(session: SessionDep, position_id: int) -> Any:
 
 
 @router.patch("/{position_id}", response_model=JobPositionResponse)
-async def update_position(
+def update_position(
     session: SessionDep,
     _current_user: CurrentUser,
     position_id: int,
@@ -88,7 +88,7 @@ async def update_position(
 
 
 @router.delete("/{position_id}")
-async def delete_position(
+def delete_position(
     session: SessionDep, _current_user: CurrentUser, position_id: int
 ) -> dict[str, str]:
     """Delete a job position."""
@@ -50,6 +50,7 @@ class ResourceProfile(SQLModel, table=True):
     # === Jira Integration (optional) ===
     jira_account_id: str | None = Field(
         default=None,
+        max_length=128,
         unique=True,
         index=True,
         description="Jira account ID (from Atlassian)",
@@ -57,7 +58,9 @@ class ResourceProfile(SQLModel, table=True):
     jira_display_name: str | None = Field(
         default=None, description="Display name from Jira"
     )
-    jira_email: str | None = Field(default=None, description="Email from Jira")
+    jira_email: str | None = Field(
+        default=None, max_length=255, description="Email from Jira"
+    )
     jira_avatar_url: str | None = Field(
         default=None, description="Avatar URL from Jira"
     )
@@ -74,6 +77,7 @@ class ResourceProfile(SQLModel, table=True):
     )
     github_login: str | None = Field(
         default=None,
+        max_length=255,
         unique=True,
         index=True,
         description="GitHub username",
@@ -81,7 +85,9 @@ class ResourceProfile(SQLModel, table=True):
     github_display_name: str | None = Field(
         default=None, description="Display name from GitHub"
     )
-    github_email: str | None = Field(default=None, description="Email from GitHub")
+    github_email: str | None = Field(
+        default=None, max_length=255, description="Email from GitHub"
+    )
     github_avatar_url: str | None = Field(
         default=None, description="Avatar URL from GitHub"
     )
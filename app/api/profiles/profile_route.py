@@ -4,7 +4,8 @@ import uuid
 from datetime import datetime
 from typing import Any, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import selectinload
 
 from app.api.integrations.Jira.jira_service import JiraIntegrationService
@@ -26,6 +27,9 @@ from app.utils.deps import CurrentUser, RoleChecker, SessionDep
 
 router = APIRouter(prefix="/profiles", tags=["profiles"])
 
+# Built once; dump_json serializes the whole list in pydantic-core
+_WORKLOADS_ADAPTER = TypeAdapter(list[ProfileWorkload])
+
 
 def _to_response(profile: ResourceProfile) -> ResourceProfileResponse:
     """Convert ResourceProfile model to response schema."""
@@ -57,7 +61,7 @@ def _to_response(profile: ResourceProfile) -> ResourceProfileResponse:
 
 
 @router.get("/me", response_model=ResourceProfileResponse)
-async def get_my_profile(
+def get_my_profile(
     session: SessionDep, current_user: CurrentUser
 ) -> ResourceProfileResponse:
     """Get the current user's resource profile."""
@@ -70,7 +74,7 @@ async def get_my_profile(
     response_model=ResourceProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def update_my_profile(
+def update_my_profile(
     session: SessionDep,
     current_user: CurrentUser,
     request: UpdateMyProfileRequest,
@@ -91,7 +95,7 @@ async def update_my_profile(
     response_model=ResourceProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def update_profile_by_user_id(
+def update_profile_by_user_id(
     session: SessionDep,
     user_id: uuid.UUID,
     request: UpdateProfileRequest,
@@ -112,7 +116,7 @@ async def update_profile_by_user_id(
     response_model=ResourceProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def create_profile(
+def create_profile(
     session: SessionDep, request: ResourceProfileCreate
 ) -> ResourceProfileResponse:
     """Create a new resource profile for a user."""
@@ -152,7 +156,7 @@ async def create_profile(
     response_model=list[ResourceProfileResponse],
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR, Role.USER]))],
 )
-async def list_profiles(
+def list_profiles(
     session: SessionDep,
     has_jira: bool | None = Query(default=None, description="Filter by Jira connected"),
     has_github: bool | None = Query(
@@ -184,41 +188,50 @@ async def list_profiles(
     response_model=list[ProfileWorkload],
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def get_all_workloads(
+def get_all_workloads(
     session: SessionDep,
     sort_by: str = Query(default="total", description="Sort by: total, jira, github"),
-) -> list[ProfileWorkload]:
+) -> Response:
     """Get workload metrics for all profiles, sorted by workload."""
     _ = sort_by
-    profiles = session.query(ResourceProfile).all()
+    # Column rows only; full ResourceProfile hydration is not needed here
+    profiles = session.query(
+        cast(Any, ResourceProfile.user_id),
+        cast(Any, ResourceProfile.jira_account_id),
+        cast(Any, ResourceProfile.jira_display_name),
+        cast(Any, ResourceProfile.github_display_name),
+    ).all()
 
     jira_counts = JiraIntegrationService(session).get_live_assignee_workload_map(
         [p.jira_account_id for p in profiles if p.jira_account_id]
     )
 
-    workloads = [
-        ProfileWorkload(
-            user_id=p.user_id,
-            display_name=p.jira_display_name or p.github_display_name,
-            jira_workload=(
-                jira_counts.get(p.jira_account_id, 0) if p.jira_account_id else 0
-            ),
-            total_workload=(
-                jira_counts.get(p.jira_account_id, 0) if p.jira_account_id else 0
-            ),
-            last_updated=None,
+    workloads: list[ProfileWorkload] = []
+    for p in profiles:
+        # Unlinked profiles (None) are never keys in jira_counts, so they get 0
+        jira_workload = jira_counts.get(p.jira_account_id, 0)
+        workloads.append(
+            ProfileWorkload(
+                user_id=p.user_id,
+                display_name=p.jira_display_name or p.github_display_name,
+                jira_workload=jira_workload,
+                total_workload=jira_workload,
+                last_updated=None,
+            )
         )
-        for p in profiles
-    ]
 
     # Sort by specified field (ascending - least busy first)
     workloads.sort(key=lambda w: w.total_workload)
 
-    return workloads
+    # Already validated on construction; response_model stays for the OpenAPI schema
+    return Response(
+        content=_WORKLOADS_ADAPTER.dump_json(workloads),
+        media_type="application/json",
+    )
 
 
 @router.get("/by-jira/{jira_account_id}", response_model=ResourceProfileResponse)
-async def get_profile_by_jira(
+def get_profile_by_jira(
     session: SessionDep, jira_account_id: str
 ) -> ResourceProfileResponse:
     """Get a resource profile by Jira account ID."""
@@ -235,7 +248,7 @@ async def get_profile_by_jira(
 
 
 @router.get("/by-github/{github_login}", response_model=ResourceProfileResponse)
-async def get_profile_by_github(
+def get_profile_by_github(
     session: SessionDep, github_login: str
 ) -> ResourceProfileResponse:
     """Get a resource profile by GitHub login."""
@@ -252,7 +265,7 @@ async def get_profile_by_github(
 
 
 @router.post("/me/connect/jira", response_model=ResourceProfileResponse)
-async def connect_jira(
+def connect_jira(
     session: SessionDep, current_user: CurrentUser, request: JiraConnectionRequest
 ) -> ResourceProfileResponse:
     """Connect Jira account to current user's profile."""
@@ -262,7 +275,7 @@ async def connect_jira(
 
 
 @router.post("/me/connect/github", response_model=ResourceProfileResponse)
-async def connect_github(
+def connect_github(
     session: SessionDep, current_user: CurrentUser, request: GitHubConnectionRequest
 ) -> ResourceProfileResponse:
     """Connect GitHub account to current user's profile."""
@@ -272,7 +285,7 @@ async def connect_github(
 
 
 @router.delete("/me/disconnect/jira", response_model=ResourceProfileResponse)
-async def disconnect_jira(
+def disconnect_jira(
     session: SessionDep, current_user: CurrentUser
 ) -> ResourceProfileResponse:
     """Disconnect Jira account from current user's profile."""
@@ -299,7 +312,7 @@ async def disconnect_jira(
 
 
 @router.delete("/me/disconnect/github", response_model=ResourceProfileResponse)
-async def disconnect_github(
+def disconnect_github(
     session: SessionDep, current_user: CurrentUser
 ) -> ResourceProfileResponse:
     """Disconnect GitHub account from current user's profile."""
@@ -331,7 +344,7 @@ async def disconnect_github(
     response_model=ResourceProfileResponse,
     dependencies=[Depends(RoleChecker([Role.ADMIN, Role.MODERATOR]))],
 )
-async def update_skills(
+def update_skills(
     session: SessionDep, current_user: CurrentUser, request: UpdateSkillsRequest
 ) -> ResourceProfileResponse:
     """Update profile metadata for current user's profile."""
@@ -344,7 +357,7 @@ async def update_skills(
 
 
 @router.get("/match-jira-github", response_model=list[ProfileMatchResponse])
-async def match_jira_github_profiles(
+def match_jira_github_profiles(
     session: SessionDep,
     threshold: float = Query(
         default=75.0, ge=0.0, le=100.0, description="Matching threshold (0-100)"
@@ -359,9 +372,7 @@ async def match_jira_github_profiles(
 
 # Place the dynamic user_id route at the end to avoid shadowing static paths
 @router.get("/{user_id}", response_model=ResourceProfileResponse)
-async def get_profile(
-    session: SessionDep, user_id: uuid.UUID
-) -> ResourceProfileResponse:
+def get_profile(session: SessionDep, user_id: uuid.UUID) -> ResourceProfileResponse:
     """Get a resource profile by user ID."""
     profile = (
         session.query(ResourceProfile)
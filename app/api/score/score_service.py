@@ -3,6 +3,8 @@ import uuid
 from typing import Any, cast
 
 import torch
+from pgvector import HalfVector  # type: ignore[import-untyped]
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlmodel import select
 from torch import cosine_similarity
@@ -37,6 +39,8 @@ class ScoreService:
     RELEVANT_PR_TARGET = 3
     # Confidence saturates after this many total PRs.
     HISTORY_PR_TARGET = 10
+    # SUMMARY is the second line of a Jira issue context; this covers it.
+    ISSUE_CONTEXT_HEAD_CHARS = 512
     KG_MAX_SCORE = 350.0
     KG_HISTORY_TARGET = 4
     KG_CATEGORY_WEIGHTS = {
@@ -201,6 +205,13 @@ class ScoreService:
 
         return float(weighted_similarity) * confidence * 1000.0
 
+    @staticmethod
+    def _embedding_tensor(embedding: Any) -> torch.Tensor:
+        """Stored embeddings come back from pgvector as HalfVector; widen to float32."""
+        if isinstance(embedding, HalfVector):
+            embedding = embedding.to_list()
+        return torch.tensor(embedding, dtype=torch.float)
+
     def _calculate_developer_github_score(
         self, github_id: int, task_embedding: list[float], threshold: int
     ) -> tuple[float, list[PrScoreInfo]]:
@@ -209,8 +220,15 @@ class ScoreService:
         Returns the average cosine similarity (%) across up to `threshold` PRs.
         """
         github_filter = cast(Any, GitHubPRVector.author_id == github_id)
+        # Only the columns scored and returned; context and metadata stay in the DB
         prs = (
-            self.db.query(GitHubPRVector)
+            self.db.query(
+                cast(Any, GitHubPRVector.pr_id),
+                cast(Any, GitHubPRVector.pr_title),
+                cast(Any, GitHubPRVector.pr_url),
+                cast(Any, GitHubPRVector.pr_description),
+                cast(Any, GitHubPRVector.embedding),
+            )
             .filter(github_filter)
             .order_by(GitHubPRVector.embedding.cosine_distance(task_embedding))
             .limit(threshold)
@@ -226,7 +244,7 @@ class ScoreService:
         for pr in prs:
             if pr.embedding is None:
                 continue
-            pr_tensor = torch.tensor(pr.embedding, dtype=torch.float)
+            pr_tensor = self._embedding_tensor(pr.embedding)
             # Use dim=0 since vectors are 1-D
             sim = cosine_similarity(task_tensor, pr_tensor, dim=0)
             sim_value = float(sim.item())
@@ -284,8 +302,15 @@ class ScoreService:
         Returns the aggregated score and top matching issues.
         """
         jira_filter = cast(Any, JiraIssueVector.assignee_account_id == jira_account_id)
+        # The summary is read from the head of context, so the rest is not fetched
         issues = (
-            self.db.query(JiraIssueVector)
+            self.db.query(
+                cast(Any, JiraIssueVector.issue_key),
+                cast(Any, JiraIssueVector.embedding),
+                func.substr(
+                    cast(Any, JiraIssueVector.context), 1, self.ISSUE_CONTEXT_HEAD_CHARS
+                ).label("context"),
+            )
             .filter(jira_filter)
             .order_by(JiraIssueVector.embedding.cosine_distance(task_embedding))
             .limit(threshold)
@@ -303,7 +328,7 @@ class ScoreService:
         for issue in issues:
             if issue.embedding is None:
                 continue
-            issue_tensor = torch.tensor(issue.embedding, dtype=torch.float)
+            issue_tensor = self._embedding_tensor(issue.embedding)
             sim = cosine_similarity(task_tensor, issue_tensor, dim=0)
             sim_value = float(sim.item())
             similarities.append(sim_value)
@@ -382,10 +407,10 @@ class ScoreService:
             return []
 
         embedding_service = VectorEmbeddingService(self.db)
-        task_embedding = embedding_service.generate_embeddings(
-            [task],
+        task_embedding = embedding_service.embed_query(
+            task,
             prompt_name=settings.GITHUB_QUERY_PROMPT_NAME,
-        )[0]
+        )
 
         task_entities = self._extract_task_entities(best_fit_input)
         logger.info("Score task entities extracted: %s", task_entities.to_dict())
@@ -1,7 +1,8 @@
 """User endpoints."""
 
 import uuid
-from typing import Any
+from datetime import datetime
+from typing import Any, cast
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import func, select
@@ -207,8 +208,6 @@ def register_user_with_profile(
     )
     user = user_service.create_user(session=session, user_create=user_create)
 
-    from datetime import datetime
-
     profile = ResourceProfile(
         user_id=user.id,
         position_id=user_in.position_id,
@@ -316,8 +315,6 @@ def delete_user(
             status_code=403, detail="Admins are not allowed to delete themselves"
         )
 
-    from typing import Any, cast
-
     profile = (
         session.query(ResourceProfile)
         .filter(cast(Any, ResourceProfile.user_id == user_id))
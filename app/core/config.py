@@ -61,6 +61,10 @@ class Settings(BaseSettings):
     POSTGRES_SSL_MODE: str = (
         "prefer"  # Options: disable, allow, prefer, require, verify-ca, verify-full
     )
+    # App engine pool; vector syncs run GitHub and Jira writers side by side.
+    POSTGRES_POOL_SIZE: int = 20
+    POSTGRES_MAX_OVERFLOW: int = 40
+    POSTGRES_POOL_RECYCLE_SECONDS: int = 1800
 
     # Neo4j (Knowledge Graph)
     NEO4J_SCHEME: str = "neo4j+s"
@@ -190,7 +194,7 @@ class Settings(BaseSettings):
     JINA_EMBEDDING_MODEL1: str = "jina-code-embeddings-0.5b"  # API model (1536 dims)
     JINA_EMBEDDING_MODEL2: str = "jinaai/jina-code-embeddings-0.5b"  # Local model
     USE_JINA_API: bool = False
-    EMBEDDING_DIMENSION: int = 1536  # Must match database Vector(dim=1536)
+    EMBEDDING_DIMENSION: int = 1536  # Must match database HALFVEC(dim=1536)
     # Asymmetric embedding prompt names (Jina task prefixes)
     GITHUB_QUERY_PROMPT_NAME: str = "nl2code_query"
     GITHUB_DOCUMENT_PROMPT_NAME: str = "nl2code_document"
@@ -11,9 +11,9 @@ engine = create_engine(
         "connect_timeout": 10,
     },
     pool_pre_ping=True,  # Enable connection health checks
-    pool_size=5,
-    max_overflow=10,
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+    pool_recycle=settings.POSTGRES_POOL_RECYCLE_SECONDS,
 )
 
 
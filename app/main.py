@@ -8,6 +8,7 @@ from fastapi.routing import APIRoute
 from neomodel import config as neomodel_config
 from starlette.middleware.cors import CORSMiddleware
 
+from app.api.integrations.Jira.jira_service import close_jira_http_client
 from app.api.main import api_router
 from app.api.tasks.task_scheduler import start_task_scheduler, stop_task_scheduler
 from app.core.config import settings
@@ -44,6 +45,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     stop_task_scheduler()
+    close_jira_http_client()
     logger.info("Shutting down...")
 
 
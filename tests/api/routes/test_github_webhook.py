@@ -0,0 +1,89 @@
+import hashlib
+import hmac
+import json
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.integrations.GitHub import github_webhook
+from app.core.config import settings
+
+WEBHOOK_URL = f"{settings.API_V1_STR}/github/webhook"
+SECRET = b"test-webhook-secret"
+
+
+@pytest.fixture(autouse=True)
+def webhook_secret() -> Generator[None, None, None]:
+    with patch.object(github_webhook, "_WEBHOOK_SECRET", SECRET):
+        yield
+
+
+def _sign(body: bytes) -> str:
+    return "sha256=" + hmac.new(SECRET, body, hashlib.sha256).hexdigest()
+
+
+def test_valid_signature_is_accepted(client: TestClient) -> None:
+    body = json.dumps({"action": "ping"}).encode()
+
+    response = client.post(
+        WEBHOOK_URL,
+        content=body,
+        headers={"X-Hub-Signature-256": _sign(body)},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ignored"}
+
+
+@pytest.mark.parametrize(
+    "signature",
+    [None, "", "sha1=abcdef", "deadbeef"],
+)
+def test_missing_or_unprefixed_signature_is_rejected(
+    client: TestClient, signature: str | None
+) -> None:
+    body = json.dumps({"action": "ping"}).encode()
+    headers = {} if signature is None else {"X-Hub-Signature-256": signature}
+
+    response = client.post(WEBHOOK_URL, content=body, headers=headers)
+
+    assert response.status_code == 403
+
+
+def test_non_hex_signature_is_rejected(client: TestClient) -> None:
+    body = json.dumps({"action": "ping"}).encode()
+
+    response = client.post(
+        WEBHOOK_URL,
+        content=body,
+        headers={"X-Hub-Signature-256": "sha256=not-a-hex-digest"},
+    )
+
+    assert response.status_code == 403
+
+
+def test_wrong_digest_is_rejected(client: TestClient) -> None:
+    body = json.dumps({"action": "ping"}).encode()
+
+    response = client.post(
+        WEBHOOK_URL,
+        content=body,
+        headers={"X-Hub-Signature-256": _sign(b"some other body")},
+    )
+
+    assert response.status_code == 403
+
+
+def test_malformed_json_with_valid_signature_is_rejected(client: TestClient) -> None:
+    body = b"{not json"
+
+    response = client.post(
+        WEBHOOK_URL,
+        content=body,
+        headers={"X-Hub-Signature-256": _sign(body)},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid JSON payload"
@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from app.api.tasks.task_service import SyncTaskAlreadyRunningError
+from app.core.config import settings
+
+SYNC_URL = f"{settings.API_V1_STR}/jira/sync"
+
+
+@patch("app.api.integrations.Jira.jira_route.enqueue_embedding_task")
+def test_sync_without_wait_queues_task(
+    mock_enqueue: MagicMock,
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    mock_enqueue.return_value = "task-123"
+
+    response = client.post(
+        f"{SYNC_URL}?wait=false",
+        headers=superuser_token_headers,
+        json={"project_keys": ["PROJ", "PROJ", "OPS"], "max_results": 50},
+    )
+
+    assert response.status_code == 202
+    assert response.json() == {"task_id": "task-123", "status": "queued"}
+    sync_request = mock_enqueue.call_args[0][1]
+    assert sync_request.sync_github is False
+    assert sync_request.jira_project_keys == ["PROJ", "OPS"]
+    assert sync_request.jira_max_issues == 50
+
+
+@patch("app.api.integrations.Jira.jira_route.enqueue_embedding_task")
+def test_sync_without_wait_rejects_disabled_embeddings(
+    mock_enqueue: MagicMock,
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    response = client.post(
+        f"{SYNC_URL}?wait=false",
+        headers=superuser_token_headers,
+        json={"generate_embeddings": False},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Background syncs always generate embeddings"
+    mock_enqueue.assert_not_called()
+
+
+@patch("app.api.integrations.Jira.jira_route.enqueue_embedding_task")
+def test_sync_without_wait_conflicts_with_running_task(
+    mock_enqueue: MagicMock,
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    mock_enqueue.side_effect = SyncTaskAlreadyRunningError("task-456")
+
+    response = client.post(
+        f"{SYNC_URL}?wait=false",
+        headers=superuser_token_headers,
+        json={},
+    )
+
+    assert response.status_code == 409
+    assert response.json()["detail"] == "A sync task is already running: task-456"
@@ -5,14 +5,21 @@ retryable-error detection, and the store_pr_contexts pipeline.
 API/model calls are fully mocked.
 """
 
+import hashlib
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 import requests
+from pgvector import HalfVector  # type: ignore[import-untyped]
 
+from app.api.embedding import embedding_service as embedding_service_module
+from app.api.embedding.embedding_model import GitHubPRVector
 from app.api.embedding.embedding_service import (
     VectorEmbeddingService,
     is_retryable_error,
+    wait_for_retry_after,
 )
 
 # ---------------------------------------------------------------------------
@@ -73,6 +80,34 @@ class TestIsRetryableError:
         exc = ValueError("Some error")
         assert is_retryable_error(exc) is False
 
+    def test_real_429_response_is_retryable(self) -> None:
+        # requests.Response is falsy for error statuses
+        resp = requests.Response()
+        resp.status_code = 429
+        exc = requests.exceptions.HTTPError(response=resp)
+        assert is_retryable_error(exc) is True
+
+
+class TestWaitForRetryAfter:
+    def _retry_state(self, exc: BaseException) -> MagicMock:
+        state = MagicMock()
+        state.outcome.exception.return_value = exc
+        state.attempt_number = 1
+        return state
+
+    def test_uses_retry_after_header(self) -> None:
+        resp = requests.Response()
+        resp.status_code = 429
+        resp.headers["Retry-After"] = "7"
+        exc = requests.exceptions.HTTPError(response=resp)
+
+        assert wait_for_retry_after(self._retry_state(exc)) == 7.0
+
+    def test_falls_back_to_exponential(self) -> None:
+        exc = requests.exceptions.ConnectionError("reset")
+
+        assert wait_for_retry_after(self._retry_state(exc)) == 2.0
+
 
 # ===================================================================
 # 2. Prompt name to task mapping (static method)
@@ -95,6 +130,174 @@ class TestPromptNameToTask:
         assert VectorEmbeddingService._prompt_name_to_task("random_name") is None
 
 
+@pytest.fixture()
+def cache_session() -> Any:
+    """Patch the service's short-lived embedding-cache session."""
+    session = MagicMock()
+    session.__enter__.return_value = session
+    with patch.object(
+        VectorEmbeddingService, "_cache_session", return_value=session
+    ):
+        yield session
+
+
+class TestGenerateEmbeddingsCache:
+    @patch.object(VectorEmbeddingService, "_embed_texts")
+    def test_without_cache_skips_db(
+        self,
+        mock_embed: MagicMock,
+        service: VectorEmbeddingService,
+        cache_session: MagicMock,
+    ) -> None:
+        mock_embed.return_value = [[0.1]]
+
+        assert service.generate_embeddings(["a"]) == [[0.1]]
+        cache_session.execute.assert_not_called()
+        service.db.execute.assert_not_called()
+
+    @patch.object(VectorEmbeddingService, "_embed_texts")
+    def test_only_misses_are_embedded_and_order_is_kept(
+        self,
+        mock_embed: MagicMock,
+        service: VectorEmbeddingService,
+        cache_session: MagicMock,
+    ) -> None:
+        hit_hash = hashlib.sha256(b"cached text").hexdigest()
+        cache_session.execute.return_value.all.return_value = [
+            (hit_hash, HalfVector([0.5, 0.5]))
+        ]
+        mock_embed.return_value = [[0.25, 0.25]]
+
+        result = service.generate_embeddings(
+            ["new text", "cached text"], prompt_name="nl2code_document", use_cache=True
+        )
+
+        assert result == [[0.25, 0.25], [0.5, 0.5]]
+        mock_embed.assert_called_once_with(["new text"], "nl2code_document")
+        # one lookup + one insert of the miss, none on the caller's session
+        assert cache_session.execute.call_count == 2
+        stored_rows = cache_session.execute.call_args[0][1]
+        assert stored_rows[0]["content_hash"] == hashlib.sha256(b"new text").hexdigest()
+        service.db.execute.assert_not_called()
+
+    @patch.object(VectorEmbeddingService, "_embed_texts")
+    def test_full_hit_skips_embedding(
+        self,
+        mock_embed: MagicMock,
+        service: VectorEmbeddingService,
+        cache_session: MagicMock,
+    ) -> None:
+        digest = hashlib.sha256(b"same").hexdigest()
+        cache_session.execute.return_value.all.return_value = [
+            (digest, HalfVector([1.0]))
+        ]
+
+        result = service.generate_embeddings(["same", "same"], use_cache=True)
+
+        assert result == [[1.0], [1.0]]
+        mock_embed.assert_not_called()
+        cache_session.execute.assert_called_once()
+
+    @patch.object(VectorEmbeddingService, "_embed_texts")
+    def test_lookup_failure_falls_back_to_embedding(
+        self,
+        mock_embed: MagicMock,
+        service: VectorEmbeddingService,
+        cache_session: MagicMock,
+    ) -> None:
+        cache_session.execute.side_effect = [RuntimeError("no table"), MagicMock()]
+        mock_embed.return_value = [[0.3]]
+
+        assert service.generate_embeddings(["x"], use_cache=True) == [[0.3]]
+        service.db.rollback.assert_not_called()
+
+    @patch.object(VectorEmbeddingService, "_embed_texts")
+    def test_store_failure_still_returns_embeddings(
+        self,
+        mock_embed: MagicMock,
+        service: VectorEmbeddingService,
+        cache_session: MagicMock,
+    ) -> None:
+        lookup = MagicMock()
+        lookup.all.return_value = []
+        cache_session.execute.side_effect = [lookup, RuntimeError("insert failed")]
+        mock_embed.return_value = [[0.7]]
+
+        assert service.generate_embeddings(["y"], use_cache=True) == [[0.7]]
+        mock_embed.assert_called_once()
+        service.db.rollback.assert_not_called()
+
+
+class TestGenerateEmbeddingsApi:
+    @patch("app.api.embedding.embedding_service.time.sleep")
+    @patch.object(VectorEmbeddingService, "_call_jina_api_with_retry")
+    def test_batches_are_stitched_in_input_order(
+        self,
+        mock_call: MagicMock,
+        _mock_sleep: MagicMock,
+        service: VectorEmbeddingService,
+    ) -> None:
+        mock_call.side_effect = lambda batch, _prompt: [
+            [float(text.split("-")[1])] for text in batch
+        ]
+        count = 2 * embedding_service_module.JINA_EMBED_BATCH_SIZE + 15
+        texts = [f"text-{i}" for i in range(count)]
+
+        result = service._generate_embeddings_api(texts)
+
+        assert mock_call.call_count == 3
+        assert result == [[float(i)] for i in range(count)]
+
+    @patch("app.api.embedding.embedding_service.time.sleep")
+    @patch.object(VectorEmbeddingService, "_call_jina_api_with_retry")
+    def test_long_texts_split_to_fit_token_budget(
+        self,
+        mock_call: MagicMock,
+        _mock_sleep: MagicMock,
+        service: VectorEmbeddingService,
+    ) -> None:
+        mock_call.side_effect = lambda batch, _prompt: [[0.0] for _ in batch]
+        texts = [f"{i:04d}" + "x" * 9000 for i in range(100)]
+
+        result = service._generate_embeddings_api(texts)
+
+        batches = [c[0][0] for c in mock_call.call_args_list]
+        assert len(result) == 100
+        assert sum(len(b) for b in batches) == 100
+        assert len(batches) == 3
+        for batch in batches:
+            assert sum(len(t) for t in batch) / 4 <= 100000 * 0.8
+
+    @patch("app.api.embedding.embedding_service.time.sleep")
+    @patch.object(VectorEmbeddingService, "_call_jina_api_with_retry")
+    def test_batch_failure_propagates(
+        self,
+        mock_call: MagicMock,
+        _mock_sleep: MagicMock,
+        service: VectorEmbeddingService,
+    ) -> None:
+        mock_call.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            service._generate_embeddings_api([f"text-{i}" for i in range(40)])
+
+    @patch("app.api.embedding.embedding_service.time.sleep")
+    @patch.object(VectorEmbeddingService, "_call_jina_api_with_retry")
+    def test_duplicate_texts_embedded_once(
+        self,
+        mock_call: MagicMock,
+        _mock_sleep: MagicMock,
+        service: VectorEmbeddingService,
+    ) -> None:
+        mock_call.side_effect = lambda batch, _prompt: [[float(len(t))] for t in batch]
+
+        result = service._generate_embeddings_api(["", "ab", "", "  ab  ", "abc"])
+
+        sent = mock_call.call_args[0][0]
+        assert sent == ["Empty content", "ab", "abc"]
+        assert result == [[13.0], [2.0], [13.0], [2.0], [3.0]]
+
+
 # ===================================================================
 # 3. Text cleaning
 # ===================================================================
@@ -134,6 +337,18 @@ class TestCleanTextForEmbedding:
         assert "Line1" in result
         assert "Line2" in result
 
+    def test_strips_controls_and_format_chars(self, service: VectorEmbeddingService) -> None:
+        text = "a\x00b\x7fc\x85d soft\u00adhyphen private\ue000use"
+        assert service._clean_text_for_embedding(text) == "abcd softhyphen privateuse"
+
+    def test_repeated_text_is_served_from_cache(self, service: VectorEmbeddingService) -> None:
+        text = "## Summary\n\nCloses #\u200b123 (template body)"
+        first = service._clean_text_for_embedding(text)
+        hits_before = VectorEmbeddingService._clean_text_for_embedding.cache_info().hits
+
+        assert service._clean_text_for_embedding(text) == first
+        assert VectorEmbeddingService._clean_text_for_embedding.cache_info().hits == hits_before + 1
+
 
 # ===================================================================
 # 4. Embedding dimension normalization
@@ -164,6 +379,116 @@ class TestNormalizeEmbeddingDimension:
         assert result == [0.1, 0.2, 0.3]
 
 
+class TestNormalizeEmbeddingMatrix:
+    @patch("app.api.embedding.embedding_service.settings")
+    def test_pads_and_keeps_rows(self, mock_settings: MagicMock, service: VectorEmbeddingService) -> None:
+        mock_settings.EMBEDDING_DIMENSION = 4
+        result = service._normalize_embedding_matrix([[0.5, 0.25], [1.0, -1.0]])
+        assert result == [[0.5, 0.25, 0.0, 0.0], [1.0, -1.0, 0.0, 0.0]]
+
+    @patch("app.api.embedding.embedding_service.settings")
+    def test_truncates_columns(self, mock_settings: MagicMock, service: VectorEmbeddingService) -> None:
+        mock_settings.EMBEDDING_DIMENSION = 2
+        result = service._normalize_embedding_matrix([[0.5, 0.25, 0.125]])
+        assert result == [[0.5, 0.25]]
+
+    def test_empty_batch(self, service: VectorEmbeddingService) -> None:
+        assert service._normalize_embedding_matrix([]) == []
+
+    @patch("app.api.embedding.embedding_service.settings")
+    def test_accepts_float32_matrix(self, mock_settings: MagicMock, service: VectorEmbeddingService) -> None:
+        mock_settings.EMBEDDING_DIMENSION = 3
+        result = service._normalize_embedding_matrix(np.array([[0.5, 0.25]], dtype=np.float32))
+        assert result == [[0.5, 0.25, 0.0]]
+        assert service._normalize_embedding_matrix(np.empty((0, 2), dtype=np.float32)) == []
+
+
+class TestGenerateEmbeddingsLocal:
+    def test_encodes_cleaned_texts_in_fixed_batches(self, service: VectorEmbeddingService) -> None:
+        service.model = MagicMock()
+        matrix = np.array([[0.1], [0.2]], dtype=np.float32)
+        service.model.encode.return_value = matrix
+
+        result = service._generate_embeddings_local(["a\u200bb", "x" * 20000])
+
+        assert result is matrix
+        args, kwargs = service.model.encode.call_args
+        assert kwargs["convert_to_numpy"] is True
+        assert args[0][0] == "ab"
+        assert len(args[0][1]) < 20000
+        assert kwargs["batch_size"] == embedding_service_module.LOCAL_ENCODE_BATCH_SIZE
+
+    def test_model_loaded_once_per_name(self) -> None:
+        fake_module = MagicMock()
+        with patch.dict("sys.modules", {"sentence_transformers": fake_module}), \
+                patch.dict(embedding_service_module._local_models, clear=True):
+            first = embedding_service_module._get_local_model("some-model")
+            second = embedding_service_module._get_local_model("some-model")
+
+        assert first is second
+        fake_module.SentenceTransformer.assert_called_once_with("some-model")
+
+
+class TestEmbedQuery:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Any:
+        embedding_service_module._query_embedding_cache.clear()
+        yield
+        embedding_service_module._query_embedding_cache.clear()
+
+    @patch.object(VectorEmbeddingService, "generate_embeddings")
+    def test_repeated_query_hits_cache(
+        self, mock_gen: MagicMock, service: VectorEmbeddingService
+    ) -> None:
+        mock_gen.return_value = [[0.1, 0.2]]
+
+        first = service.embed_query("fix login bug", prompt_name="nl2code_query")
+        second = service.embed_query("fix login bug", prompt_name="nl2code_query")
+
+        assert first == second == [0.1, 0.2]
+        mock_gen.assert_called_once_with(["fix login bug"], prompt_name="nl2code_query")
+
+    @patch.object(VectorEmbeddingService, "generate_embeddings")
+    def test_prompt_name_is_part_of_key(
+        self, mock_gen: MagicMock, service: VectorEmbeddingService
+    ) -> None:
+        mock_gen.return_value = [[0.1]]
+
+        service.embed_query("q", prompt_name="nl2code_query")
+        service.embed_query("q", prompt_name="nl2code_document")
+
+        assert mock_gen.call_count == 2
+
+    @patch.object(VectorEmbeddingService, "generate_embeddings")
+    def test_evicts_least_recently_used(
+        self, mock_gen: MagicMock, service: VectorEmbeddingService
+    ) -> None:
+        mock_gen.return_value = [[0.1]]
+
+        with patch.object(embedding_service_module, "QUERY_EMBEDDING_CACHE_SIZE", 2):
+            service.embed_query("a")
+            service.embed_query("b")
+            service.embed_query("a")
+            service.embed_query("c")
+
+        cached_texts = [key[2] for key in embedding_service_module._query_embedding_cache]
+        assert cached_texts == ["a", "c"]
+
+    @patch.object(VectorEmbeddingService, "generate_embeddings")
+    def test_batch_embeds_only_misses_in_one_call(
+        self, mock_gen: MagicMock, service: VectorEmbeddingService
+    ) -> None:
+        mock_gen.return_value = [[0.1]]
+        service.embed_query("a")
+        mock_gen.return_value = [[0.2], [0.3]]
+
+        result = service.embed_queries(["b", "a", "c", "b"])
+
+        assert result == [[0.2], [0.1], [0.3], [0.2]]
+        assert mock_gen.call_count == 2
+        mock_gen.assert_called_with(["b", "c"], prompt_name=None)
+
+
 # ===================================================================
 # 5. Store PR contexts pipeline
 # ===================================================================
@@ -201,22 +526,44 @@ class TestStorePrContexts:
         author.login = "alice"
         pr = self._make_pr_content(pr_id=100)
 
-        # Simulate PR already exists in DB
-        service.db.query.return_value.filter.return_value.all.return_value = [("100",)]
+        # Simulate PR already exists in DB with the same context
+        ctx_hash = hashlib.sha256(b"ctx").hexdigest()
+        service.db.query.return_value.filter.return_value.all.return_value = [("100", ctx_hash)]
 
         result = service.store_pr_contexts(author, [pr])
 
         mock_gen.assert_not_called()
         assert result == 1  # skipped count
 
-    @patch("app.api.embedding.embedding_service.GitHubPRVector")
-    @patch.object(VectorEmbeddingService, "_normalize_embedding_dimension", side_effect=lambda self, x: x)
+    @patch.object(VectorEmbeddingService, "generate_embeddings")
+    def test_reembeds_prs_with_changed_context(
+        self,
+        mock_gen: MagicMock,
+        service: VectorEmbeddingService,
+    ) -> None:
+        author = MagicMock()
+        author.login = "alice"
+        unchanged = self._make_pr_content(pr_id=100, context="same")
+        changed = self._make_pr_content(pr_id=101, context="edited description")
+
+        service.db.query.return_value.filter.return_value.all.return_value = [
+            ("100", hashlib.sha256(b"same").hexdigest()),
+            ("101", hashlib.sha256(b"old description").hexdigest()),
+        ]
+        mock_gen.return_value = [[0.1]]
+
+        result = service.store_pr_contexts(author, [unchanged, changed])
+
+        assert mock_gen.call_args[0][0] == ["edited description"]
+        rows = service.db.execute.call_args[0][1]
+        assert [r["pr_id"] for r in rows] == ["101"]
+        assert rows[0]["context_hash"] == hashlib.sha256(b"edited description").hexdigest()
+        assert result == 2
+
     @patch.object(VectorEmbeddingService, "generate_embeddings")
     def test_stores_new_pr_vectors(
         self,
         mock_gen: MagicMock,
-        mock_normalize: MagicMock,
-        mock_vector_cls: MagicMock,
         service: VectorEmbeddingService,
     ) -> None:
         author = MagicMock()
@@ -230,10 +577,71 @@ class TestStorePrContexts:
         result = service.store_pr_contexts(author, [pr])
 
         mock_gen.assert_called_once()
-        service.db.add.assert_called()
+        service.db.execute.assert_called_once()
+        rows = service.db.execute.call_args[0][1]
+        assert rows[0]["pr_id"] == "200"
+        assert rows[0]["embedding"] == [0.1, 0.2, 0.3]
         service.db.commit.assert_called()
         assert result >= 1
 
+    def test_bulk_insert_vectors_chunks_rows(
+        self, service: VectorEmbeddingService
+    ) -> None:
+        rows = [{"pr_id": str(i), "embedding": [0.0]} for i in range(2500)]
+
+        with patch(
+            "app.api.embedding.embedding_service.VECTOR_INSERT_BATCH_SIZE", 1000
+        ):
+            count = service.bulk_insert_vectors(GitHubPRVector, rows, "pr_id")
+
+        assert count == 2500
+        batch_sizes = [len(c[0][1]) for c in service.db.execute.call_args_list]
+        assert batch_sizes == [1000, 1000, 500]
+
+    def test_bulk_insert_vectors_copies_large_loads(
+        self, service: VectorEmbeddingService
+    ) -> None:
+        rows = [
+            {"pr_id": str(i), "embedding": [0.5, 0.25], "metadata_json": {"labels": []}}
+            for i in range(3)
+        ]
+        cursor = service.db.connection.return_value.connection.driver_connection.cursor.return_value.__enter__.return_value
+        copy = cursor.copy.return_value.__enter__.return_value
+
+        with patch("app.api.embedding.embedding_service.VECTOR_COPY_MIN_ROWS", 3):
+            count = service.bulk_insert_vectors(GitHubPRVector, rows, "pr_id")
+
+        assert count == 3
+        service.db.execute.assert_not_called()
+        assert copy.write_row.call_args_list[0][0][0] == ["0", "[0.5,0.25]", '{"labels": []}']
+        statements = [c[0][0] for c in cursor.execute.call_args_list]
+        assert "ON CONFLICT (pr_id) DO UPDATE" in statements[1]
+        assert "embedding = EXCLUDED.embedding" in statements[1]
+
+    def test_failed_batch_retries_rows_in_savepoints(
+        self, service: VectorEmbeddingService
+    ) -> None:
+        service.db.begin_nested.return_value.__exit__.return_value = False
+        rows = [{"pr_id": str(i), "embedding": [0.0]} for i in range(3)]
+
+        def execute(_stmt: Any, params: list[dict[str, Any]]) -> None:
+            if len(params) > 1 or params[0]["pr_id"] == "1":
+                raise RuntimeError("constraint violation")
+
+        service.db.execute.side_effect = execute
+
+        stored = service.upsert_vectors_isolating_failures(GitHubPRVector, rows, "pr_id")
+
+        assert stored == 2
+        assert service.db.begin_nested.call_count == 4
+        service.db.rollback.assert_not_called()
+
+    def test_bulk_insert_vectors_empty_is_noop(
+        self, service: VectorEmbeddingService
+    ) -> None:
+        assert service.bulk_insert_vectors(GitHubPRVector, [], "pr_id") == 0
+        service.db.execute.assert_not_called()
+
 
 # ===================================================================
 # 6. Store all authors PR contexts
@@ -256,13 +664,108 @@ class TestStoreAllAuthorsPrContexts:
 
         mock_store.return_value = 1
 
-        service.store_all_authors_pr_contexts({"alice": [pr1], "bob": [pr2]})
+        session_factory = MagicMock()
+        with patch.object(embedding_service_module.settings, "JINA_API_KEY", "test-key"):
+            result = service.store_all_authors_pr_contexts(
+                {"alice": [pr1], "bob": [pr2]}, session_factory=session_factory
+            )
 
+        assert result == (2, [])
         assert mock_store.call_count == 2
+        assert session_factory.call_count == 2
+
+    @patch.object(VectorEmbeddingService, "store_pr_contexts")
+    def test_one_author_failing_is_reported_without_stopping_others(
+        self, mock_store: MagicMock, service: VectorEmbeddingService
+    ) -> None:
+        from app.api.integrations.GitHub.github_schema import GitHubUser
+
+        prs = {}
+        for i, login in enumerate(["alice", "bob", "carol"]):
+            pr = MagicMock()
+            pr.author = GitHubUser(login=login, id=i)
+            prs[login] = [pr]
+
+        def store(author: GitHubUser, _prs: list[Any]) -> int:
+            if author.login == "bob":
+                raise RuntimeError("db down")
+            return 1
+
+        mock_store.side_effect = store
+
+        with patch.object(embedding_service_module.settings, "JINA_API_KEY", "test-key"):
+            stored, failures = service.store_all_authors_pr_contexts(
+                prs, session_factory=MagicMock()
+            )
+
+        assert mock_store.call_count == 3
+        assert stored == 2
+        assert failures == ["bob: db down"]
+
+    def test_workers_use_their_own_session(
+        self, service: VectorEmbeddingService
+    ) -> None:
+        from app.api.integrations.GitHub.github_schema import GitHubUser
+
+        prs = {}
+        for i, login in enumerate(["alice", "bob"]):
+            pr = MagicMock()
+            pr.author = GitHubUser(login=login, id=i)
+            prs[login] = [pr]
+        session = MagicMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__enter__.return_value = session
+        workers: list[VectorEmbeddingService] = []
+
+        def store(self: VectorEmbeddingService, _author: Any, _prs: Any) -> int:
+            workers.append(self)
+            return 1
+
+        with (
+            patch.object(VectorEmbeddingService, "store_pr_contexts", store),
+            patch.object(embedding_service_module.settings, "JINA_API_KEY", "test-key"),
+        ):
+            service.store_all_authors_pr_contexts(prs, session_factory=session_factory)
+
+        assert len(workers) == 2
+        assert all(w is not service and w.db is session for w in workers)
+
+    @patch.object(VectorEmbeddingService, "store_pr_contexts")
+    def test_single_author_uses_own_session(
+        self, mock_store: MagicMock, service: VectorEmbeddingService
+    ) -> None:
+        from app.api.integrations.GitHub.github_schema import GitHubUser
+
+        pr = MagicMock()
+        pr.author = GitHubUser(login="alice", id=1)
+        session_factory = MagicMock()
+
+        result = service.store_all_authors_pr_contexts(
+            {"alice": [pr]}, session_factory=session_factory
+        )
+
+        assert result == (mock_store.return_value, [])
+        mock_store.assert_called_once_with(pr.author, [pr])
+        session_factory.assert_not_called()
+
+    @patch.object(VectorEmbeddingService, "store_pr_contexts")
+    def test_single_author_failure_is_reported(
+        self, mock_store: MagicMock, service: VectorEmbeddingService
+    ) -> None:
+        from app.api.integrations.GitHub.github_schema import GitHubUser
+
+        pr = MagicMock()
+        pr.author = GitHubUser(login="alice", id=1)
+        mock_store.side_effect = RuntimeError("jina down")
+
+        assert service.store_all_authors_pr_contexts({"alice": [pr]}) == (
+            0,
+            ["alice: jina down"],
+        )
 
     @patch.object(VectorEmbeddingService, "store_pr_contexts")
     def test_skips_empty_pr_lists(
         self, mock_store: MagicMock, service: VectorEmbeddingService
     ) -> None:
-        service.store_all_authors_pr_contexts({"alice": [], "bob": []})
+        assert service.store_all_authors_pr_contexts({"alice": [], "bob": []}) == (0, [])
         mock_store.assert_not_called()
@@ -0,0 +1,96 @@
+"""Unit tests for the combined GitHub + Jira embedding sync workflow.
+
+The per-source sync helpers are mocked so these tests only cover how the
+two branches are scheduled and how their outcomes are merged.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from app.api.embedding.embedding_sync_service import (
+    SyncAllRequest,
+    run_sync_all_vectors,
+)
+from app.api.integrations.Jira.jira_schema import JiraSyncResponse
+
+MODULE = "app.api.embedding.embedding_sync_service"
+
+
+def _jira_response(**overrides: object) -> JiraSyncResponse:
+    data: dict[str, object] = {
+        "status": "completed",
+        "projects_synced": ["PROJ"],
+        "issues_synced": 4,
+        "issues_updated": 0,
+        "issues_created": 4,
+        "embeddings_generated": 4,
+        "errors": [],
+        "sync_duration_seconds": 1.5,
+    }
+    data.update(overrides)
+    return JiraSyncResponse.model_validate(data)
+
+
+class TestRunSyncAllVectors:
+    @patch(f"{MODULE}._sync_jira")
+    @patch(f"{MODULE}._sync_github")
+    def test_merges_both_sources(
+        self, mock_github: MagicMock, mock_jira: MagicMock
+    ) -> None:
+        mock_github.return_value = {"total_authors": 2, "total_prs": 3}
+        mock_jira.return_value = _jira_response()
+
+        result = run_sync_all_vectors(MagicMock(), SyncAllRequest())
+
+        assert result.status == "completed"
+        assert result.total_embeddings == 7
+        assert result.github == {"total_authors": 2, "total_prs": 3}
+        assert result.jira is not None
+        assert result.jira["issues_synced"] == 4
+
+    @patch(f"{MODULE}._sync_jira")
+    @patch(f"{MODULE}._sync_github")
+    def test_one_source_failing_keeps_the_other(
+        self, mock_github: MagicMock, mock_jira: MagicMock
+    ) -> None:
+        mock_github.side_effect = RuntimeError("rate limited")
+        mock_jira.return_value = _jira_response(errors=["PROJ: partial"])
+
+        result = run_sync_all_vectors(MagicMock(), SyncAllRequest())
+
+        assert result.status == "completed_with_errors"
+        assert result.github is None
+        assert result.total_embeddings == 4
+        assert result.errors == ["GitHub sync failed: rate limited", "PROJ: partial"]
+
+    @patch(f"{MODULE}._sync_jira")
+    @patch(f"{MODULE}._sync_github")
+    def test_disabled_source_is_not_run(
+        self, mock_github: MagicMock, mock_jira: MagicMock
+    ) -> None:
+        mock_github.return_value = {"total_prs": 1}
+        progress: list[int] = []
+
+        result = run_sync_all_vectors(
+            MagicMock(),
+            SyncAllRequest(sync_jira=False),
+            progress_callback=lambda p, _msg: progress.append(p),
+        )
+
+        mock_jira.assert_not_called()
+        assert result.status == "completed"
+        assert result.jira is None
+        assert progress[-1] == 100
+
+
+class TestSyncAllRequest:
+    def test_project_keys_are_deduplicated_in_order(self) -> None:
+        request = SyncAllRequest(jira_project_keys=["B", "A", "B", "A", "C"])
+
+        assert request.jira_project_keys == ["B", "A", "C"]
+
+    def test_rejects_oversized_project_key_list(self) -> None:
+        with pytest.raises(ValidationError):
+            SyncAllRequest(jira_project_keys=[f"P{i}" for i in range(201)])
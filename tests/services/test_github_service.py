@@ -4,12 +4,15 @@ All external I/O (database, GitHub API, PyGithub SDK) is mocked so
 these tests run without network or database access.
 """
 
+import time
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
+from pydantic import ValidationError
 
+from app.api.integrations.GitHub import github_service as github_service_module
 from app.api.integrations.GitHub.github_schema import (
     GitHubUser,
     PullRequestContent,
@@ -35,6 +38,7 @@ def service(mock_db: MagicMock) -> GithubIntegrationService:
         svc.db = mock_db
         svc.use_jina_api = False
         svc._vector_service = None
+        svc._organization = None
         svc.credentials = None
         return svc
 
@@ -116,11 +120,60 @@ def _make_mock_pr(
         cm = MagicMock()
         cm.commit.message = msg
         commit_mocks.append(cm)
-    pr.get_commits.return_value = commit_mocks
+    pr.get_commits.return_value = _make_paginated(commit_mocks)
 
     return pr
 
 
+def _make_pr_node(
+    pr_id: int = 100,
+    number: int = 1,
+    title: str = "Fix auth flow",
+    body: str | None = "Resolved the login redirect bug",
+    author_login: str | None = "alice",
+    author_id: int = 42,
+    labels: list[str] | None = None,
+    files: list[dict[str, str]] | None = None,
+    commits: list[str] | None = None,
+) -> dict[str, Any]:
+    """Build a GraphQL pullRequests node as returned by _CLOSED_PRS_QUERY."""
+    return {
+        "databaseId": pr_id,
+        "number": number,
+        "title": title,
+        "body": body,
+        "url": f"https://github.com/test-org/repo/pull/{number}",
+        "baseRefName": "main",
+        "headRefName": "feature",
+        "author": (
+            {"login": author_login, "databaseId": author_id} if author_login else None
+        ),
+        "baseRepository": {
+            "databaseId": 999,
+            "name": "repo",
+            "defaultBranchRef": {"name": "main"},
+        },
+        "labels": {"nodes": [{"name": name} for name in (labels or [])]},
+        "files": {
+            "nodes": files or [{"path": "src/auth.py", "changeType": "MODIFIED"}]
+        },
+        "commits": {
+            "nodes": [
+                {"commit": {"message": msg}}
+                for msg in (commits or ["fix: resolve redirect loop"])
+            ]
+        },
+    }
+
+
+def _make_paginated(items: list[Any], page_size: int = 100) -> MagicMock:
+    """Mimic a PyGithub PaginatedList: iterable, with zero-based get_page()."""
+    paginated = MagicMock()
+    paginated.__iter__.side_effect = lambda: iter(items)
+    paginated.get_page.side_effect = lambda n: items[n * page_size : (n + 1) * page_size]
+    return paginated
+
+
 def _make_mock_repo(
     name: str = "repo",
     full_name: str = "test-org/repo",
@@ -144,10 +197,7 @@ def _make_mock_repo(
     repo.updated_at = datetime(2025, 1, 1)
     repo.pushed_at = datetime(2025, 1, 2)
 
-    if prs is not None:
-        repo.get_pulls.return_value = prs
-    else:
-        repo.get_pulls.return_value = []
+    repo.get_pulls.return_value = _make_paginated(prs or [])
 
     if contributors is not None:
         contrib_mocks = []
@@ -196,6 +246,7 @@ def _make_mock_github_client(
 
     org.get_repo = get_repo
     gh.get_organization.return_value = org
+    gh.get_rate_limit.return_value.core.remaining = 5000
     return gh
 
 
@@ -204,6 +255,12 @@ def _make_mock_github_client(
 # ===================================================================
 
 class TestGetGithubClient:
+    @pytest.fixture(autouse=True)
+    def _clear_auth_cache(self) -> Any:
+        github_service_module._installation_auth_cache.clear()
+        yield
+        github_service_module._installation_auth_cache.clear()
+
     def test_raises_without_credentials(self, service: GithubIntegrationService) -> None:
         with pytest.raises(Exception, match="credentials not found"):
             service.get_github_client()
@@ -246,6 +303,81 @@ class TestGetGithubClient:
         )
         mock_app_auth.get_installation_auth.assert_called_once_with(12345)
         assert result is mock_client
+        _, kwargs = mock_github_cls.call_args
+        assert kwargs["per_page"] == 100
+
+    @patch("app.api.integrations.GitHub.github_service.Github")
+    @patch("app.api.integrations.GitHub.github_service.Auth")
+    @patch("app.api.integrations.GitHub.github_service.settings")
+    def test_reuses_installation_auth_across_clients(
+        self,
+        mock_settings: MagicMock,
+        mock_auth: MagicMock,
+        mock_github_cls: MagicMock,
+        service_with_creds: GithubIntegrationService,
+    ) -> None:
+        mock_settings.GITHUB_APP_ID = 123456
+        mock_settings.GITHUB_PRIVATE_KEY = "fake-private-key"
+
+        service_with_creds.get_github_client()
+        service_with_creds.get_github_client()
+
+        mock_auth.AppAuth.assert_called_once()
+        first_auth = mock_github_cls.call_args_list[0][1]["auth"]
+        assert mock_github_cls.call_args_list[1][1]["auth"] is first_auth
+
+
+class TestGetOrganization:
+    @patch.object(GithubIntegrationService, "get_github_client")
+    def test_fetches_organization_once(
+        self,
+        mock_get_client: MagicMock,
+        service_with_creds: GithubIntegrationService,
+    ) -> None:
+        gh = _make_mock_github_client()
+        mock_get_client.return_value = gh
+
+        first = service_with_creds.get_organization()
+        second = service_with_creds.get_organization()
+
+        assert first is second
+        gh.get_organization.assert_called_once_with("test-org")
+
+
+class TestEnsureRateLimit:
+    def _gh(self, remaining: int, reset_in: float) -> MagicMock:
+        gh = MagicMock()
+        gh.get_rate_limit.return_value.core.remaining = remaining
+        gh.get_rate_limit.return_value.core.reset = datetime.utcfromtimestamp(
+            time.time() + reset_in
+        )
+        return gh
+
+    @patch("app.api.integrations.GitHub.github_service.time.sleep")
+    def test_enough_budget_does_not_wait(
+        self, mock_sleep: MagicMock, service: GithubIntegrationService
+    ) -> None:
+        service._ensure_rate_limit(self._gh(remaining=500, reset_in=3000), needed=10)
+
+        mock_sleep.assert_not_called()
+
+    @patch("app.api.integrations.GitHub.github_service.time.sleep")
+    def test_waits_for_imminent_reset(
+        self, mock_sleep: MagicMock, service: GithubIntegrationService
+    ) -> None:
+        service._ensure_rate_limit(self._gh(remaining=2, reset_in=20), needed=10)
+
+        mock_sleep.assert_called_once()
+        assert 20 <= mock_sleep.call_args[0][0] <= 22
+
+    @patch("app.api.integrations.GitHub.github_service.time.sleep")
+    def test_fails_fast_when_reset_is_far(
+        self, mock_sleep: MagicMock, service: GithubIntegrationService
+    ) -> None:
+        with pytest.raises(Exception, match="rate limit too low"):
+            service._ensure_rate_limit(self._gh(remaining=2, reset_in=1800), needed=10)
+
+        mock_sleep.assert_not_called()
 
 
 class TestProperties:
@@ -263,6 +395,16 @@ class TestProperties:
         with pytest.raises(Exception, match="credentials not found"):
             _ = service.installation_id
 
+    def test_names_do_not_reload_credentials(self, service_with_creds: GithubIntegrationService) -> None:
+        # After a commit the row's attributes expire; reading them would
+        # lazy-load through the session from whichever thread asked.
+        creds = cast(MagicMock, service_with_creds.credentials)
+        type(creds).org_name = PropertyMock(side_effect=AssertionError("reloaded"))
+        type(creds).github_install_id = PropertyMock(side_effect=AssertionError("reloaded"))
+
+        assert service_with_creds.organization_name == "test-org"
+        assert service_with_creds.installation_id == "12345"
+
 
 # ===================================================================
 # 2. Repository methods
@@ -414,6 +556,12 @@ class TestGeneratePrContext:
         assert "<!-- This is a comment -->" not in result.body
         assert "Actual description here" in result.body
 
+    def test_returned_context_is_frozen(self, service: GithubIntegrationService) -> None:
+        result = service.generate_pr_context(_make_mock_pr())
+
+        with pytest.raises(ValidationError):
+            result.context = "changed"
+
     def test_handles_none_body(self, service: GithubIntegrationService) -> None:
         pr = _make_mock_pr(body=None)
 
@@ -432,6 +580,14 @@ class TestGeneratePrContext:
         # "fix" has only 1 word so should be skipped; the second commit should appear
         assert "feat: add proper authentication" in result.context
 
+    def test_reads_only_first_commit_page(self, service: GithubIntegrationService) -> None:
+        pr = _make_mock_pr(commits=["feat: add proper authentication module for users"])
+
+        service.generate_pr_context(pr)
+
+        pr.get_commits.return_value.get_page.assert_called_once_with(0)
+        pr.get_commits.return_value.__iter__.assert_not_called()
+
     def test_changed_files_list(self, service: GithubIntegrationService) -> None:
         pr = _make_mock_pr(
             files=[
@@ -462,12 +618,43 @@ class TestGeneratePrContext:
 # ===================================================================
 
 class TestGetAllOrgMembers:
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    @patch.object(GithubIntegrationService, "_graphql")
+    def test_reads_members_via_graphql(
+        self,
+        mock_graphql: MagicMock,
+        _mock_org: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        mock_graphql.side_effect = [
+            {"organization": {"membersWithRole": {
+                "pageInfo": {"hasNextPage": True, "endCursor": "m1"},
+                "nodes": [{"login": "alice", "databaseId": 1, "email": "alice@test.com", "name": "Alice",
+                           "avatarUrl": "https://a.com/a.png", "url": "https://github.com/alice"}],
+            }}},
+            {"organization": {"membersWithRole": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [{"login": "bob", "databaseId": 2, "email": "", "name": None,
+                           "avatarUrl": None, "url": "https://github.com/bob"}],
+            }}},
+        ]
+
+        result = service.get_all_org_members()
+
+        assert [m.login for m in result] == ["alice", "bob"]
+        assert result[0].email == "alice@test.com"
+        assert result[1].email is None
+        assert result[1].avatar_url is None
+        assert mock_graphql.call_args_list[1][0][1]["cursor"] == "m1"
+
+    @patch.object(GithubIntegrationService, "_iter_org_member_nodes", side_effect=Exception("forbidden"))
     @patch.object(GithubIntegrationService, "get_github_client")
     @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
-    def test_returns_member_list(
+    def test_falls_back_to_rest_member_list(
         self,
         _mock_org: MagicMock,
         mock_get_client: MagicMock,
+        _mock_nodes: MagicMock,
         service: GithubIntegrationService,
     ) -> None:
         gh = _make_mock_github_client(
@@ -485,12 +672,14 @@ class TestGetAllOrgMembers:
         assert result[0].email == "alice@test.com"
         assert result[1].login == "bob"
 
+    @patch.object(GithubIntegrationService, "_iter_org_member_nodes", side_effect=Exception("forbidden"))
     @patch.object(GithubIntegrationService, "get_github_client")
     @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
     def test_handles_member_without_avatar(
         self,
         _mock_org: MagicMock,
         mock_get_client: MagicMock,
+        _mock_nodes: MagicMock,
         service: GithubIntegrationService,
     ) -> None:
         gh = _make_mock_github_client(
@@ -504,6 +693,51 @@ class TestGetAllOrgMembers:
         assert result[0].avatar_url is None
 
 
+class TestGetOrgMembersByLogin:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Any:
+        github_service_module._org_members_cache.clear()
+        yield
+        github_service_module._org_members_cache.clear()
+
+    @patch.object(GithubIntegrationService, "get_all_org_members")
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    def test_keys_members_by_login_and_caches(
+        self,
+        _mock_org: MagicMock,
+        mock_members: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        mock_members.return_value = [
+            GitHubUser(login="alice", id=1),
+            GitHubUser(login="bob", id=2),
+        ]
+
+        first = service.get_org_members_by_login()
+        second = service.get_org_members_by_login()
+
+        assert set(first) == {"alice", "bob"}
+        assert second is first
+        mock_members.assert_called_once()
+
+    @patch.object(GithubIntegrationService, "get_all_org_members")
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    def test_refetches_after_ttl(
+        self,
+        _mock_org: MagicMock,
+        mock_members: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        mock_members.return_value = [GitHubUser(login="alice", id=1)]
+        service.get_org_members_by_login()
+
+        expired = time.monotonic() - github_service_module.ORG_MEMBERS_CACHE_TTL_SECONDS - 1
+        github_service_module._org_members_cache["test-org"] = (expired, {})
+
+        assert "alice" in service.get_org_members_by_login()
+        assert mock_members.call_count == 2
+
+
 # ===================================================================
 # 5. Sync PRs
 # ===================================================================
@@ -534,6 +768,7 @@ class TestSyncRepoPrs:
         mock_gen_ctx.return_value = pr_content
 
         mock_vs = MagicMock()
+        mock_vs.store_all_authors_pr_contexts.return_value = (1, [])
         mock_vector_svc.return_value = mock_vs
 
         result = service.sync_repo_prs(
@@ -547,6 +782,36 @@ class TestSyncRepoPrs:
         assert result.prs_synced == 1
         assert result.embeddings_generated == 1
 
+    @patch.object(GithubIntegrationService, "vector_service", new_callable=PropertyMock)
+    @patch.object(GithubIntegrationService, "generate_pr_context")
+    @patch.object(GithubIntegrationService, "get_github_client")
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    def test_sync_reports_embedding_store_failures(
+        self,
+        _mock_org: MagicMock,
+        mock_get_client: MagicMock,
+        mock_gen_ctx: MagicMock,
+        mock_vector_svc: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        repo = _make_mock_repo(name="my-repo", prs=[_make_mock_pr()])
+        mock_get_client.return_value = _make_mock_github_client(repos=[repo])
+        mock_gen_ctx.return_value = PullRequestContent(
+            id=100, number=1, title="Fix", html_url="https://github.com/test/pull/1",
+            author=GitHubUser(login="alice", id=42), repo_id=999, repo_name="my-repo",
+            context="test context",
+        )
+
+        mock_vs = MagicMock()
+        mock_vs.store_all_authors_pr_contexts.return_value = (0, ["alice: db down"])
+        mock_vector_svc.return_value = mock_vs
+
+        result = service.sync_repo_prs(repo_names=["my-repo"], generate_embeddings=True)
+
+        assert result.status == "completed_with_errors"
+        assert result.embeddings_generated == 0
+        assert any("alice: db down" in e for e in result.errors)
+
     @patch.object(GithubIntegrationService, "generate_pr_context")
     @patch.object(GithubIntegrationService, "get_github_client")
     @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
@@ -577,6 +842,28 @@ class TestSyncRepoPrs:
         assert result.prs_synced == 1
         assert result.embeddings_generated == 0
 
+    @patch.object(GithubIntegrationService, "_fetch_prs_graphql")
+    @patch.object(GithubIntegrationService, "get_github_client")
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    def test_sync_without_embeddings_skips_pr_details(
+        self,
+        _mock_org: MagicMock,
+        mock_get_client: MagicMock,
+        mock_fetch_graphql: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        pr = _make_mock_pr(labels=["bug"])
+        mock_get_client.return_value = _make_mock_github_client(
+            repos=[_make_mock_repo(name="my-repo", prs=[pr])]
+        )
+
+        result = service.sync_repo_prs(repo_names=["my-repo"], generate_embeddings=False)
+
+        assert result.prs_synced == 1
+        mock_fetch_graphql.assert_not_called()
+        pr.get_files.assert_not_called()
+        pr.get_commits.assert_not_called()
+
     @patch.object(GithubIntegrationService, "get_github_client")
     @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
     def test_sync_discovers_repos_when_none_provided(
@@ -597,6 +884,47 @@ class TestSyncRepoPrs:
 
         assert set(result.repos_synced) == {"repo-a", "repo-b"}
 
+    @patch.object(GithubIntegrationService, "generate_pr_contexts")
+    @patch.object(GithubIntegrationService, "get_github_client")
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    def test_repos_scanned_concurrently_keep_order(
+        self,
+        _mock_org: MagicMock,
+        mock_get_client: MagicMock,
+        mock_gen_ctxs: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        repos = [
+            _make_mock_repo(name=f"repo-{i}", prs=[_make_mock_pr(pr_id=i)]) for i in range(4)
+        ]
+        gh = _make_mock_github_client(repos=repos)
+        mock_get_client.return_value = gh
+
+        def build(prs: list[MagicMock], **_kwargs: Any) -> list[PullRequestContent]:
+            # Earlier repos finish last.
+            time.sleep(0.01 * (4 - prs[0].id))
+            return [
+                PullRequestContent(
+                    id=pr.id, number=1, title="t", html_url="https://github.com/test/pull/1",
+                    author=GitHubUser(login="alice", id=42), repo_id=999,
+                )
+                for pr in prs
+            ]
+
+        mock_gen_ctxs.side_effect = build
+        gh.get_organization.return_value.get_repo = MagicMock()
+
+        result = service.sync_repo_prs(repo_names=None, generate_embeddings=False)
+
+        assert result.prs_synced == 4
+        assert result.repos_synced == [f"repo-{i}" for i in range(4)]
+        # Without embeddings, contexts are built from the PR listing alone.
+        assert all(
+            c.kwargs["include_details"] is False for c in mock_gen_ctxs.call_args_list
+        )
+        # Discovered repos are reused rather than fetched again by name.
+        gh.get_organization.return_value.get_repo.assert_not_called()
+
     @patch.object(GithubIntegrationService, "get_github_client")
     @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
     def test_sync_handles_repo_error_gracefully(
@@ -657,76 +985,117 @@ class TestSyncRepoPrs:
 # ===================================================================
 
 class TestGetOrgClosedPrsContextByAuthor:
-    @patch.object(GithubIntegrationService, "generate_pr_context")
-    @patch.object(GithubIntegrationService, "get_github_client")
     @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
-    def test_filters_by_author_id(
+    @patch.object(GithubIntegrationService, "_graphql")
+    def test_searches_author_prs_server_side(
         self,
+        mock_graphql: MagicMock,
         _mock_org: MagicMock,
-        mock_get_client: MagicMock,
-        mock_gen_ctx: MagicMock,
         service: GithubIntegrationService,
     ) -> None:
-        alice_pr = _make_mock_pr(author_login="alice", author_id=42)
-        bob_pr = _make_mock_pr(author_login="bob", author_id=99, pr_id=200, number=2)
-        repo = _make_mock_repo(name="repo", prs=[alice_pr, bob_pr])
-        gh = _make_mock_github_client(repos=[repo])
-        mock_get_client.return_value = gh
+        mock_graphql.return_value = {"search": {
+            "pageInfo": {"hasNextPage": True, "endCursor": "s1"},
+            "nodes": [
+                _make_pr_node(pr_id=i, number=i, author_id=42) for i in range(3)
+            ] + [{}],
+        }}
 
-        pr_content = PullRequestContent(
-            id=100, number=1, title="Fix", html_url="https://github.com/test/pull/1",
-            author=GitHubUser(login="alice", id=42), repo_id=999,
-        )
-        mock_gen_ctx.return_value = pr_content
+        author = GitHubUser(login="alice", id=42)
+        result = service.get_org_closed_prs_context_by_author(author, max_prs=2)
+
+        assert [pr.id for pr in result] == [0, 1]
+        mock_graphql.assert_called_once()
+        variables = mock_graphql.call_args[0][1]
+        assert variables["search"] == "is:pr is:closed author:alice org:test-org sort:updated-desc"
 
+    @patch.object(GithubIntegrationService, "_scan_org_closed_prs_by_author")
+    @patch.object(GithubIntegrationService, "_iter_author_closed_pr_nodes", side_effect=Exception("rate limited"))
+    def test_falls_back_to_repo_scan(
+        self,
+        _mock_search: MagicMock,
+        mock_scan: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        mock_scan.return_value = []
         author = GitHubUser(login="alice", id=42)
-        result = service.get_org_closed_prs_context_by_author(author)
 
-        assert len(result) == 1
-        mock_gen_ctx.assert_called_once_with(alice_pr)
+        service.get_org_closed_prs_context_by_author(author, max_prs=7)
 
-    @patch.object(GithubIntegrationService, "generate_pr_context")
-    @patch.object(GithubIntegrationService, "get_github_client")
-    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
-    def test_respects_max_prs(
+        mock_scan.assert_called_once_with(author, 7)
+
+    @patch.object(GithubIntegrationService, "_iter_closed_pr_nodes")
+    @patch.object(GithubIntegrationService, "_list_closed_pr_repo_names")
+    def test_filters_by_author_id(
         self,
-        _mock_org: MagicMock,
-        mock_get_client: MagicMock,
-        mock_gen_ctx: MagicMock,
+        mock_repo_names: MagicMock,
+        mock_iter_nodes: MagicMock,
         service: GithubIntegrationService,
     ) -> None:
-        prs = [_make_mock_pr(pr_id=i, number=i, author_id=42) for i in range(5)]
-        repo = _make_mock_repo(name="repo", prs=prs)
-        gh = _make_mock_github_client(repos=[repo])
-        mock_get_client.return_value = gh
+        alice_pr = _make_pr_node(author_login="alice", author_id=42)
+        bob_pr = _make_pr_node(author_login="bob", author_id=99, pr_id=200, number=2)
+        mock_repo_names.return_value = ["repo"]
+        mock_iter_nodes.return_value = iter([alice_pr, bob_pr])
 
-        pr_content = PullRequestContent(
-            id=100, number=1, title="Fix", html_url="https://github.com/test/pull/1",
-            author=GitHubUser(login="alice", id=42), repo_id=999,
+        author = GitHubUser(login="alice", id=42)
+        result = service._scan_org_closed_prs_by_author(author, 100)
+
+        assert [pr.id for pr in result] == [100]
+        mock_iter_nodes.assert_called_once_with("repo")
+
+    @patch.object(GithubIntegrationService, "_iter_closed_pr_nodes")
+    @patch.object(GithubIntegrationService, "_list_closed_pr_repo_names")
+    def test_respects_max_prs(
+        self,
+        mock_repo_names: MagicMock,
+        mock_iter_nodes: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        mock_repo_names.return_value = ["repo"]
+        mock_iter_nodes.return_value = iter(
+            [_make_pr_node(pr_id=i, number=i, author_id=42) for i in range(5)]
         )
-        mock_gen_ctx.return_value = pr_content
 
         author = GitHubUser(login="alice", id=42)
-        result = service.get_org_closed_prs_context_by_author(author, max_prs=2)
+        result = service._scan_org_closed_prs_by_author(author, max_prs=2)
 
         assert len(result) == 2
 
-    @patch.object(GithubIntegrationService, "get_github_client")
-    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    @patch.object(GithubIntegrationService, "_iter_closed_pr_nodes")
+    @patch.object(GithubIntegrationService, "_list_closed_pr_repo_names")
+    def test_scans_repos_concurrently_and_keeps_repo_order(
+        self,
+        mock_repo_names: MagicMock,
+        mock_iter_nodes: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        mock_repo_names.return_value = [f"repo-{r}" for r in range(4)]
+        mock_iter_nodes.side_effect = lambda repo_name: iter(
+            [
+                _make_pr_node(pr_id=int(repo_name[-1]) * 10 + i, number=i + 1, author_id=42)
+                for i in range(3)
+            ]
+        )
+
+        author = GitHubUser(login="alice", id=42)
+        all_prs = service._scan_org_closed_prs_by_author(author, 100)
+        capped = service._scan_org_closed_prs_by_author(author, max_prs=5)
+
+        assert [pr.id for pr in all_prs] == [r * 10 + i for r in range(4) for i in range(3)]
+        assert len(capped) == 5
+
+    @patch.object(GithubIntegrationService, "_iter_closed_pr_nodes")
+    @patch.object(GithubIntegrationService, "_list_closed_pr_repo_names")
     def test_skips_prs_without_user(
         self,
-        _mock_org: MagicMock,
-        mock_get_client: MagicMock,
+        mock_repo_names: MagicMock,
+        mock_iter_nodes: MagicMock,
         service: GithubIntegrationService,
     ) -> None:
-        pr = _make_mock_pr()
-        pr.user = None
-        repo = _make_mock_repo(name="repo", prs=[pr])
-        gh = _make_mock_github_client(repos=[repo])
-        mock_get_client.return_value = gh
+        mock_repo_names.return_value = ["repo"]
+        mock_iter_nodes.return_value = iter([_make_pr_node(author_login=None)])
 
         author = GitHubUser(login="alice", id=42)
-        result = service.get_org_closed_prs_context_by_author(author)
+        result = service._scan_org_closed_prs_by_author(author, 100)
 
         assert len(result) == 0
 
@@ -736,30 +1105,21 @@ class TestGetOrgClosedPrsContextByAuthor:
 # ===================================================================
 
 class TestGetOrgClosedPrsContextAllAuthors:
-    @patch.object(GithubIntegrationService, "generate_pr_context")
-    @patch.object(GithubIntegrationService, "get_github_client")
-    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    @patch.object(GithubIntegrationService, "_iter_closed_pr_nodes")
+    @patch.object(GithubIntegrationService, "_list_closed_pr_repo_names")
     def test_groups_by_author(
         self,
-        _mock_org: MagicMock,
-        mock_get_client: MagicMock,
-        mock_gen_ctx: MagicMock,
+        mock_repo_names: MagicMock,
+        mock_iter_nodes: MagicMock,
         service: GithubIntegrationService,
     ) -> None:
-        alice_pr = _make_mock_pr(author_login="alice", author_id=42)
-        bob_pr = _make_mock_pr(author_login="bob", author_id=99, pr_id=200, number=2)
-        repo = _make_mock_repo(name="repo", prs=[alice_pr, bob_pr])
-        gh = _make_mock_github_client(repos=[repo])
-        mock_get_client.return_value = gh
-
-        def gen_ctx(pr: Any) -> PullRequestContent:
-            return PullRequestContent(
-                id=pr.id, number=pr.number, title=pr.title,
-                html_url=pr.html_url,
-                author=GitHubUser(login=pr.user.login, id=pr.user.id),
-                repo_id=999,
-            )
-        mock_gen_ctx.side_effect = gen_ctx
+        mock_repo_names.return_value = ["repo"]
+        mock_iter_nodes.return_value = iter(
+            [
+                _make_pr_node(author_login="alice", author_id=42),
+                _make_pr_node(author_login="bob", author_id=99, pr_id=200, number=2),
+            ]
+        )
 
         result = service.get_org_closed_prs_context_all_authors()
 
@@ -768,30 +1128,186 @@ class TestGetOrgClosedPrsContextAllAuthors:
         assert len(result["alice"]) == 1
         assert len(result["bob"]) == 1
 
-    @patch.object(GithubIntegrationService, "generate_pr_context")
-    @patch.object(GithubIntegrationService, "get_github_client")
-    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    @patch.object(GithubIntegrationService, "_iter_closed_pr_nodes")
+    @patch.object(GithubIntegrationService, "_list_closed_pr_repo_names")
     def test_respects_max_prs_per_author(
         self,
-        _mock_org: MagicMock,
-        mock_get_client: MagicMock,
-        mock_gen_ctx: MagicMock,
+        mock_repo_names: MagicMock,
+        mock_iter_nodes: MagicMock,
         service: GithubIntegrationService,
     ) -> None:
-        prs = [_make_mock_pr(pr_id=i, number=i, author_login="alice", author_id=42) for i in range(5)]
-        repo = _make_mock_repo(name="repo", prs=prs)
-        gh = _make_mock_github_client(repos=[repo])
-        mock_get_client.return_value = gh
+        mock_repo_names.return_value = ["repo"]
+        mock_iter_nodes.return_value = iter(
+            [_make_pr_node(pr_id=i, number=i + 1, author_login="alice", author_id=42) for i in range(5)]
+        )
 
-        mock_gen_ctx.side_effect = lambda pr: PullRequestContent(
-            id=pr.id, number=pr.number, title=pr.title,
-            html_url=pr.html_url,
-            author=GitHubUser(login="alice", id=42), repo_id=999,
+        result = service.get_org_closed_prs_context_all_authors(max_prs_per_author=2)
+
+        assert len(result["alice"]) == 2
+
+    @patch.object(GithubIntegrationService, "generate_pr_context_from_node", autospec=True)
+    @patch.object(GithubIntegrationService, "_iter_closed_pr_nodes")
+    @patch.object(GithubIntegrationService, "_list_closed_pr_repo_names")
+    def test_builds_contexts_only_for_kept_prs(
+        self,
+        mock_repo_names: MagicMock,
+        mock_iter_nodes: MagicMock,
+        mock_from_node: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        mock_repo_names.return_value = ["repo-a", "repo-b"]
+        mock_iter_nodes.side_effect = lambda _name: iter(
+            [_make_pr_node(pr_id=i, number=i + 1, author_login="alice", author_id=42) for i in range(5)]
         )
+        mock_from_node.return_value = MagicMock()
 
         result = service.get_org_closed_prs_context_all_authors(max_prs_per_author=2)
 
         assert len(result["alice"]) == 2
+        assert mock_from_node.call_count == 2
+
+
+class TestClosedPrNodes:
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    @patch.object(GithubIntegrationService, "_graphql")
+    def test_follows_cursor_until_last_page(
+        self,
+        mock_graphql: MagicMock,
+        _mock_org: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        mock_graphql.side_effect = [
+            {"repository": {"pullRequests": {
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                "nodes": [_make_pr_node(pr_id=1)],
+            }}},
+            {"repository": {"pullRequests": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [_make_pr_node(pr_id=2)],
+            }}},
+        ]
+
+        nodes = list(service._iter_closed_pr_nodes("repo"))
+
+        assert [n["databaseId"] for n in nodes] == [1, 2]
+        second_vars = mock_graphql.call_args_list[1][0][1]
+        assert second_vars == {"owner": "test-org", "name": "repo", "first": 50, "cursor": "c1"}
+
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    @patch.object(GithubIntegrationService, "_graphql")
+    def test_lists_only_repos_with_closed_prs(
+        self,
+        mock_graphql: MagicMock,
+        _mock_org: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        def repo(name: str, closed: int) -> dict[str, Any]:
+            return {"name": name, "pullRequests": {"totalCount": closed}}
+
+        mock_graphql.side_effect = [
+            {"organization": {"repositories": {
+                "pageInfo": {"hasNextPage": True, "endCursor": "r1"},
+                "nodes": [repo("api", 12), repo("empty", 0)],
+            }}},
+            {"organization": {"repositories": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [repo("web", 3)],
+            }}},
+        ]
+
+        assert service._list_closed_pr_repo_names() == ["api", "web"]
+        second_vars = mock_graphql.call_args_list[1][0][1]
+        assert second_vars == {"org": "test-org", "first": 100, "cursor": "r1"}
+
+    def test_node_context_matches_rest_context(self, service: GithubIntegrationService) -> None:
+        commits = ["feat: add Redis cache helper for responses", "wip"]
+        rest_pr = _make_mock_pr(
+            body="<!-- template -->Adds caching",
+            labels=["enhancement"],
+            files=[
+                {"filename": "src/cache.py", "status": "added"},
+                {"filename": "src/old.py", "status": "removed"},
+            ],
+            commits=commits,
+        )
+        node = _make_pr_node(
+            body="<!-- template -->Adds caching",
+            labels=["enhancement"],
+            files=[
+                {"path": "src/cache.py", "changeType": "ADDED"},
+                {"path": "src/old.py", "changeType": "DELETED"},
+            ],
+            commits=commits,
+        )
+
+        from_rest = service.generate_pr_context(rest_pr)
+        from_node = service.generate_pr_context_from_node(node)
+
+        assert from_node.context == from_rest.context
+        assert from_node.changed_files == from_rest.changed_files
+        assert from_node.author == GitHubUser(login="alice", id=42)
+
+
+class TestGeneratePrContexts:
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    @patch.object(GithubIntegrationService, "_graphql")
+    def test_batches_prs_into_one_query_per_repo(
+        self,
+        mock_graphql: MagicMock,
+        _mock_org: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        prs = [_make_mock_pr(pr_id=1, number=7), _make_mock_pr(pr_id=2, number=9)]
+        mock_graphql.return_value = {"repository": {
+            "pr0": _make_pr_node(pr_id=1, number=7),
+            "pr1": None,
+        }}
+
+        contexts = service.generate_pr_contexts(prs)
+
+        assert [c.id for c in contexts] == [1, 2]
+        mock_graphql.assert_called_once()
+        query, variables = mock_graphql.call_args[0]
+        assert "pr0: pullRequest(number: 7)" in query
+        assert "pr1: pullRequest(number: 9)" in query
+        assert variables == {"owner": "test-org", "name": "repo"}
+        # Only the PR missing from the response is read over REST.
+        prs[0].get_files.assert_not_called()
+        prs[1].get_files.assert_called_once()
+
+    @patch.object(GithubIntegrationService, "_graphql", side_effect=Exception("boom"))
+    def test_failed_batch_falls_back_to_rest(
+        self, _mock_graphql: MagicMock, service: GithubIntegrationService
+    ) -> None:
+        prs = [_make_mock_pr(pr_id=1), _make_mock_pr(pr_id=2)]
+
+        contexts = service.generate_pr_contexts(prs)
+
+        assert [c.id for c in contexts] == [1, 2]
+        assert all(pr.get_files.called for pr in prs)
+
+
+class TestPrefetchedPages:
+    def test_yields_all_pages_and_stops_after_short_page(self) -> None:
+        paginated = _make_paginated(list(range(5)), page_size=2)
+
+        items = list(github_service_module._iter_prefetched(paginated, page_size=2))
+
+        assert items == [0, 1, 2, 3, 4]
+        # Page 2 is short, so page 3 is never requested.
+        assert [c.args[0] for c in paginated.get_page.call_args_list] == [0, 1, 2]
+
+    def test_next_page_requested_before_current_is_consumed(self) -> None:
+        paginated = _make_paginated(list(range(4)), page_size=2)
+
+        items = github_service_module._iter_prefetched(paginated, page_size=2)
+        assert next(items) == 0
+        deadline = time.monotonic() + 1
+        while paginated.get_page.call_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert paginated.get_page.call_count == 2
+        items.close()
 
 
 # ===================================================================
@@ -857,13 +1373,18 @@ class TestSyncAllAuthorsPrsToVectors:
         mock_gen_ctx.side_effect = gen_ctx
 
         mock_vs = MagicMock()
-        mock_vs.store_pr_contexts.return_value = 1
+        mock_vs.store_pr_contexts_batch.return_value = 2
         mock_vector_svc.return_value = mock_vs
 
         result = service.sync_all_authors_prs_to_vectors(max_prs_per_author=100)
 
         assert result["total_authors"] == 2
         assert result["total_prs"] == 2
+        # Both authors' PRs from the repo are embedded in one call.
+        mock_vs.store_pr_contexts_batch.assert_called_once()
+        (stored,), kwargs = mock_vs.store_pr_contexts_batch.call_args
+        assert {pr.author.login for pr in stored} == {"alice", "bob"}
+        assert kwargs["label"] == "repo"
 
     @patch.object(GithubIntegrationService, "get_github_client")
     @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
@@ -909,9 +1430,55 @@ class TestSyncAllAuthorsPrsToVectors:
         )
 
         mock_vs = MagicMock()
-        mock_vs.store_pr_contexts.return_value = 3
+        mock_vs.store_pr_contexts_batch.return_value = 3
         mock_vector_svc.return_value = mock_vs
 
         result = service.sync_all_authors_prs_to_vectors(max_prs_per_author=3)
 
         assert mock_gen_ctx.call_count == 3
+
+    @patch.object(GithubIntegrationService, "vector_service", new_callable=PropertyMock)
+    @patch.object(GithubIntegrationService, "generate_pr_context")
+    @patch.object(GithubIntegrationService, "get_github_client")
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    def test_store_failure_does_not_stop_other_repos(
+        self,
+        _mock_org: MagicMock,
+        mock_get_client: MagicMock,
+        mock_gen_ctx: MagicMock,
+        mock_vector_svc: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        repos = [
+            _make_mock_repo(name=f"repo-{i}", prs=[_make_mock_pr(pr_id=i, number=i, author_id=42)])
+            for i in range(3)
+        ]
+        mock_get_client.return_value = _make_mock_github_client(repos=repos)
+        mock_gen_ctx.side_effect = lambda pr: PullRequestContent(
+            id=pr.id, number=pr.number, title=pr.title,
+            html_url=pr.html_url,
+            author=GitHubUser(login="alice", id=42), repo_id=999,
+        )
+        mock_vs = MagicMock()
+        mock_vs.store_pr_contexts_batch.side_effect = [1, RuntimeError("db down"), 1]
+        mock_vector_svc.return_value = mock_vs
+
+        result = service.sync_all_authors_prs_to_vectors()
+
+        assert mock_vs.store_pr_contexts_batch.call_count == 3
+        assert result == {"total_authors": 1, "total_prs": 2}
+
+    @patch.object(GithubIntegrationService, "get_github_client")
+    @patch.object(GithubIntegrationService, "organization_name", new_callable=PropertyMock, return_value="test-org")
+    def test_repo_listing_failure_is_raised(
+        self,
+        _mock_org: MagicMock,
+        mock_get_client: MagicMock,
+        service: GithubIntegrationService,
+    ) -> None:
+        gh = _make_mock_github_client()
+        gh.get_organization.return_value.get_repos.side_effect = Exception("Bad credentials")
+        mock_get_client.return_value = gh
+
+        with pytest.raises(Exception, match="Bad credentials"):
+            service.sync_all_authors_prs_to_vectors()
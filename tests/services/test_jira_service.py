@@ -5,7 +5,7 @@ run without any network or database access.
 """
 
 import time
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from unittest.mock import MagicMock, PropertyMock, patch
 
@@ -18,7 +18,12 @@ from app.api.integrations.Jira.jira_schema import (
     JiraIssueContent,
     JiraUser,
 )
-from app.api.integrations.Jira.jira_service import JiraIntegrationService
+from app.api.integrations.Jira.jira_service import (
+    JiraIntegrationService,
+    _parse_jira_timestamp,
+    clear_jira_directory_cache,
+    clear_jira_workload_cache,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -33,6 +38,16 @@ def mock_db() -> MagicMock:
     return db
 
 
+@pytest.fixture(autouse=True)
+def _clear_service_caches() -> Any:
+    """Keep cached listings and workload counts from leaking between tests."""
+    clear_jira_directory_cache()
+    clear_jira_workload_cache()
+    yield
+    clear_jira_directory_cache()
+    clear_jira_workload_cache()
+
+
 @pytest.fixture()
 def service(mock_db: MagicMock) -> JiraIntegrationService:
     """Build service with mocked DB and Jina disabled."""
@@ -42,6 +57,7 @@ def service(mock_db: MagicMock) -> JiraIntegrationService:
         svc.use_jina_api = False
         svc._vector_service = None
         svc._client = None
+        svc._active_token = None
         svc.integration = None
         return svc
 
@@ -167,6 +183,32 @@ class TestDetectTerminalStatuses:
         assert set(result) == {"Done", "Closed", "Resolved", "Complete", "Completed"}
 
 
+class TestParseJiraTimestamp:
+    def test_parses_jira_offset_format(self) -> None:
+        result = _parse_jira_timestamp("2025-01-15T10:30:00.000-0530")
+        assert result == datetime(
+            2025, 1, 15, 10, 30, tzinfo=timezone(-timedelta(hours=5, minutes=30))
+        )
+
+    def test_parses_utc_offset_without_colon(self) -> None:
+        result = _parse_jira_timestamp("2025-01-15T10:30:00.000+0000")
+        assert result == datetime(2025, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+    def test_parses_offset_with_colon(self) -> None:
+        result = _parse_jira_timestamp("2025-01-15T10:30:00+05:30")
+        assert result == datetime(
+            2025, 1, 15, 10, 30, tzinfo=timezone(timedelta(hours=5, minutes=30))
+        )
+
+    def test_parses_zulu_suffix(self) -> None:
+        result = _parse_jira_timestamp("2025-01-01T00:00:00Z")
+        assert result == datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def test_missing_value_returns_none(self) -> None:
+        assert _parse_jira_timestamp(None) is None
+        assert _parse_jira_timestamp("") is None
+
+
 class TestMatchesSelectedStatus:
     def test_matches_when_status_in_selected(self) -> None:
         issue = _make_issue_content(issue_type="Bug", status="Done")
@@ -288,11 +330,32 @@ class TestStateTokens:
         tampered = state[:-4] + "XXXX"
         assert service._verify_state(tampered) is False
 
+    @patch("app.api.integrations.Jira.jira_service.settings")
+    def test_extended_ttl_with_original_signature_fails(
+        self, mock_settings: MagicMock, service: JiraIntegrationService
+    ) -> None:
+        mock_settings.SECRET_KEY = "test-secret-key"
+
+        issued_at, _ttl, nonce, sig = service._generate_state(ttl_seconds=60).split(":")
+        forged = f"{issued_at}:999999:{nonce}:{sig}"
+        assert service._verify_state(forged) is False
+
     def test_malformed_state_fails(self, service: JiraIntegrationService) -> None:
         assert service._verify_state("garbage") is False
         assert service._verify_state("") is False
         assert service._verify_state("a:b") is False
 
+    @patch("app.api.integrations.Jira.jira_service.settings")
+    def test_correctly_signed_malformed_body_fails(
+        self, mock_settings: MagicMock, service: JiraIntegrationService
+    ) -> None:
+        mock_settings.SECRET_KEY = "test-secret-key"
+
+        # Signature checks pass, so rejection comes from parsing the body
+        for body in ("no-separator", "abc:300:nonce", "1700000000"):
+            state = f"{body}:{service._sign_state(body)}"
+            assert service._verify_state(state) is False
+
 
 # ===================================================================
 # 4. OAuth flow
@@ -371,7 +434,7 @@ class TestExchangeCodeForToken:
 
     @patch.object(JiraIntegrationService, "_store_token")
     @patch.object(JiraIntegrationService, "_fetch_accessible_resources")
-    @patch("app.api.integrations.Jira.jira_service.httpx")
+    @patch("app.api.integrations.Jira.jira_service._http_client")
     @patch("app.api.integrations.Jira.jira_service.settings")
     def test_successful_token_exchange(
         self,
@@ -412,7 +475,7 @@ class TestExchangeCodeForToken:
         mock_store.assert_called_once()
         assert result == stored_token
 
-    @patch("app.api.integrations.Jira.jira_service.httpx")
+    @patch("app.api.integrations.Jira.jira_service._http_client")
     @patch("app.api.integrations.Jira.jira_service.settings")
     def test_token_exchange_failure(
         self,
@@ -599,7 +662,7 @@ class TestParseIssue:
 
 
 class TestGetAllProjects:
-    @patch("app.api.integrations.Jira.jira_service.httpx")
+    @patch("app.api.integrations.Jira.jira_service._http_client")
     @patch.object(JiraIntegrationService, "get_jira_client")
     def test_returns_project_list(
         self,
@@ -626,7 +689,7 @@ class TestGetAllProjects:
         assert result[0]["key"] == "PROJ"
         assert result[1]["name"] == "Test Project"
 
-    @patch("app.api.integrations.Jira.jira_service.httpx.get")
+    @patch("app.api.integrations.Jira.jira_service._http_client.get")
     @patch.object(JiraIntegrationService, "get_jira_client")
     def test_raises_on_401(
         self,
@@ -659,9 +722,70 @@ class TestGetAllProjects:
         with pytest.raises(ValueError, match="No Authorization header"):
             service.get_all_projects()
 
+    @patch("app.api.integrations.Jira.jira_service._http_client")
+    @patch.object(JiraIntegrationService, "get_jira_client")
+    def test_caches_projects_until_cleared(
+        self,
+        mock_get_client: MagicMock,
+        mock_httpx: MagicMock,
+        service: JiraIntegrationService,
+    ) -> None:
+        mock_client = MagicMock()
+        mock_client._session.headers = {"Authorization": "Bearer token"}
+        mock_client._options = {"server": "https://api.atlassian.com/ex/jira/cloud-123"}
+        mock_get_client.return_value = mock_client
+
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.json.return_value = [{"key": "PROJ", "name": "Project One", "id": "1"}]
+        mock_httpx.get.return_value = resp
+
+        first = service.get_all_projects()
+        second = service.get_all_projects()
+
+        assert first == second
+        assert mock_httpx.get.call_count == 1
+
+        clear_jira_directory_cache()
+        service.get_all_projects()
+
+        assert mock_httpx.get.call_count == 2
+
+    @patch("app.api.integrations.Jira.jira_service.time.monotonic")
+    @patch("app.api.integrations.Jira.jira_service._http_client")
+    @patch.object(JiraIntegrationService, "get_jira_client")
+    def test_projects_outlive_directory_ttl(
+        self,
+        mock_get_client: MagicMock,
+        mock_httpx: MagicMock,
+        mock_monotonic: MagicMock,
+        service: JiraIntegrationService,
+    ) -> None:
+        mock_client = MagicMock()
+        mock_client._session.headers = {"Authorization": "Bearer token"}
+        mock_client._options = {"server": "https://api.atlassian.com/ex/jira/cloud-123"}
+        mock_get_client.return_value = mock_client
+
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.json.return_value = [{"key": "PROJ", "name": "Project One", "id": "1"}]
+        mock_httpx.get.return_value = resp
+
+        mock_monotonic.return_value = 1000.0
+        service.get_all_projects()
+        mock_monotonic.return_value = 1120.0
+        service.get_all_projects()
+
+        assert mock_httpx.get.call_count == 1
+
+        mock_monotonic.return_value = 1400.0
+        service.get_all_projects()
+
+        assert mock_httpx.get.call_count == 2
+
 
 class TestGetAllJiraUsers:
-    @patch("app.api.integrations.Jira.jira_service.httpx")
+    @patch("app.api.integrations.Jira.jira_service._http_client")
     @patch.object(JiraIntegrationService, "get_jira_client")
     def test_filters_to_atlassian_users(
         self,
@@ -702,7 +826,7 @@ class TestGetAllJiraUsers:
 
 
 class TestFetchIssueTypes:
-    @patch("app.api.integrations.Jira.jira_service.httpx")
+    @patch("app.api.integrations.Jira.jira_service._http_client")
     @patch.object(JiraIntegrationService, "get_jira_client")
     def test_excludes_subtasks(
         self,
@@ -734,7 +858,7 @@ class TestFetchIssueTypes:
 
 
 class TestFetchStatusesForProject:
-    @patch("app.api.integrations.Jira.jira_service.httpx")
+    @patch("app.api.integrations.Jira.jira_service._http_client")
     @patch.object(JiraIntegrationService, "get_jira_client")
     def test_returns_statuses_grouped_by_type(
         self,
@@ -812,7 +936,7 @@ class TestFetchIssues:
 
 
 class TestGetIssue:
-    @patch("app.api.integrations.Jira.jira_service.httpx.get")
+    @patch("app.api.integrations.Jira.jira_service._http_client.get")
     @patch.object(
         JiraIntegrationService,
         "jira_url",
@@ -853,7 +977,7 @@ class TestGetIssue:
         assert result.assigned_to == "Alice"
         assert result.status == "In Progress"
 
-    @patch("app.api.integrations.Jira.jira_service.httpx.get")
+    @patch("app.api.integrations.Jira.jira_service._http_client.get")
     @patch.object(JiraIntegrationService, "get_jira_client")
     def test_raises_on_404(
         self,
@@ -880,7 +1004,7 @@ class TestGetIssue:
 
 
 class TestCreateIssue:
-    @patch("app.api.integrations.Jira.jira_service.httpx.post")
+    @patch("app.api.integrations.Jira.jira_service._http_client.post")
     @patch.object(
         JiraIntegrationService,
         "jira_url",
@@ -918,7 +1042,7 @@ class TestCreateIssue:
         assert result.summary == "New feature"
         assert result.assigned_to is None
 
-    @patch("app.api.integrations.Jira.jira_service.httpx.post")
+    @patch("app.api.integrations.Jira.jira_service._http_client.post")
     @patch.object(
         JiraIntegrationService,
         "jira_url",
@@ -955,7 +1079,7 @@ class TestCreateIssue:
 
 
 class TestAssignIssue:
-    @patch("app.api.integrations.Jira.jira_service.httpx")
+    @patch("app.api.integrations.Jira.jira_service._http_client")
     @patch.object(JiraIntegrationService, "get_jira_client")
     def test_assign_issue_success(
         self,
@@ -1172,12 +1296,58 @@ class TestSyncIssues:
         assert set(result.projects_synced) == {"PROJ1", "PROJ2"}
         mock_get_projects.assert_called_once()
 
+    @patch.object(JiraIntegrationService, "_update_resource_profiles_from_vectors")
+    @patch.object(JiraIntegrationService, "get_all_projects")
+    @patch.object(JiraIntegrationService, "fetch_issues")
+    @patch.object(JiraIntegrationService, "_build_embedding_status_map")
+    def test_sync_uses_stored_project_keys(
+        self,
+        mock_status_map: MagicMock,
+        mock_fetch: MagicMock,
+        mock_get_projects: MagicMock,
+        mock_update_profiles: MagicMock,
+        service: JiraIntegrationService,
+        mock_db: MagicMock,
+    ) -> None:
+        mock_status_map.return_value = {}
+        mock_fetch.return_value = []
+        service.integration = MagicMock(project_keys=["PROJ1", "PROJ2"])
+
+        result = service.sync_issues(project_keys=None, generate_embeddings=False)
+
+        assert result.projects_synced == ["PROJ1", "PROJ2"]
+        mock_get_projects.assert_not_called()
+
 
 # ===================================================================
 # 13. Jira URL property
 # ===================================================================
 
 
+class TestUpdateResourceProfilesFromVectors:
+    def test_loads_all_assignee_profiles_in_one_query(
+        self, service: JiraIntegrationService, mock_db: MagicMock
+    ) -> None:
+        profile = MagicMock(jira_account_id="user-1")
+        mock_db.query.return_value.filter.return_value.all.return_value = [profile]
+        issues = [
+            _make_issue_content(),
+            _make_issue_content(issue_id="10002", assignee=JiraUser(account_id="user-3", display_name="Cara")),
+            _make_issue_content(issue_id="10003", assignee=None),
+        ]
+
+        service._update_resource_profiles_from_vectors(issues)
+
+        mock_db.query.assert_called_once()
+        assert profile.jira_display_name == "Alice"
+
+    def test_no_assignees_skips_query(
+        self, service: JiraIntegrationService, mock_db: MagicMock
+    ) -> None:
+        service._update_resource_profiles_from_vectors([_make_issue_content(assignee=None)])
+        mock_db.query.assert_not_called()
+
+
 class TestJiraUrlProperty:
     @patch("app.api.integrations.Jira.jira_service.settings")
     def test_uses_client_header_first(
@@ -1219,9 +1389,41 @@ class TestJiraUrlProperty:
 # ===================================================================
 
 
+class TestGetActiveToken:
+    def test_reuses_token_within_instance(
+        self, service: JiraIntegrationService, mock_db: MagicMock
+    ) -> None:
+        token = MagicMock()
+        token.expires_at = datetime.utcnow() + timedelta(hours=1)
+        mock_db.query.return_value.order_by.return_value.first.return_value = token
+
+        assert service._get_active_token() is token
+        assert service._get_active_token() is token
+
+        assert mock_db.query.call_count == 1
+
+    @patch.object(JiraIntegrationService, "_refresh_access_token")
+    def test_refreshes_cached_token_near_expiry(
+        self,
+        mock_refresh: MagicMock,
+        service: JiraIntegrationService,
+        mock_db: MagicMock,
+    ) -> None:
+        stale = MagicMock()
+        stale.expires_at = datetime.utcnow() + timedelta(seconds=30)
+        stale.refresh_token = "rt"
+        service._active_token = stale
+        mock_db.query.return_value.order_by.return_value.first.return_value = stale
+        refreshed = MagicMock()
+        mock_refresh.return_value = refreshed
+
+        assert service._get_active_token() is refreshed
+        mock_refresh.assert_called_once_with(stale)
+
+
 class TestRefreshAccessToken:
     @patch.object(JiraIntegrationService, "_store_token")
-    @patch("app.api.integrations.Jira.jira_service.httpx")
+    @patch("app.api.integrations.Jira.jira_service._http_client")
     @patch("app.api.integrations.Jira.jira_service.settings")
     def test_successful_refresh(
         self,
@@ -1268,7 +1470,7 @@ class TestRefreshAccessToken:
         with pytest.raises(ValueError, match="No refresh token"):
             service._refresh_access_token(token)
 
-    @patch("app.api.integrations.Jira.jira_service.httpx")
+    @patch("app.api.integrations.Jira.jira_service._http_client")
     @patch("app.api.integrations.Jira.jira_service.settings")
     def test_raises_on_http_failure(
         self,
@@ -1411,3 +1613,102 @@ class TestGetDeveloperStats:
         calls = mock_client.search_issues.call_args_list
         assert 'assignee = "user-123"' in calls[0][0][0]
         assert "issuetype = Bug" in calls[1][0][0]
+
+
+# ===================================================================
+# 12. Live Assignee Workload
+# ===================================================================
+
+
+class _ResultPage(list[Any]):
+    """List of issues carrying the ``total`` Jira reports alongside a page."""
+
+    def __init__(self, issues: list[Any], total: int) -> None:
+        super().__init__(issues)
+        self.total = total
+
+
+def _assigned_issue(account_id: str) -> MagicMock:
+    issue = MagicMock()
+    issue.fields.assignee.accountId = account_id
+    return issue
+
+
+class TestGetLiveAssigneeWorkloadMap:
+    @patch.object(JiraIntegrationService, "get_jira_client")
+    def test_fetches_remaining_pages_from_first_page_total(
+        self, mock_get_client: MagicMock, service: JiraIntegrationService
+    ) -> None:
+        pages = {
+            0: _ResultPage([_assigned_issue("user-1")] * 100, total=250),
+            100: _ResultPage([_assigned_issue("user-2")] * 100, total=250),
+            200: _ResultPage(
+                [_assigned_issue("user-1")] * 40 + [_assigned_issue("other")] * 10,
+                total=250,
+            ),
+        }
+        mock_client = MagicMock()
+        mock_client.search_issues.side_effect = lambda *_a, startAt, **_kw: pages[
+            startAt
+        ]
+        mock_get_client.return_value = mock_client
+
+        result = service.get_live_assignee_workload_map(["user-1", "user-2"])
+
+        assert result == {"user-1": 140, "user-2": 100}
+        offsets = sorted(
+            c.kwargs["startAt"] for c in mock_client.search_issues.call_args_list
+        )
+        assert offsets == [0, 100, 200]
+
+    @patch.object(JiraIntegrationService, "get_jira_client")
+    def test_single_page_makes_one_call(
+        self, mock_get_client: MagicMock, service: JiraIntegrationService
+    ) -> None:
+        mock_client = MagicMock()
+        mock_client.search_issues.return_value = _ResultPage(
+            [_assigned_issue("user-1")], total=1
+        )
+        mock_get_client.return_value = mock_client
+
+        result = service.get_live_assignee_workload_map(["user-1"])
+
+        assert result == {"user-1": 1}
+        assert mock_client.search_issues.call_count == 1
+
+    @patch.object(JiraIntegrationService, "get_jira_client")
+    def test_search_is_limited_to_tracked_assignees(
+        self, mock_get_client: MagicMock, service: JiraIntegrationService
+    ) -> None:
+        mock_client = MagicMock()
+        mock_client.search_issues.return_value = _ResultPage([], total=0)
+        mock_get_client.return_value = mock_client
+
+        result = service.get_live_assignee_workload_map(["user-2", "user-1", ""])
+
+        assert result == {"user-1": 0, "user-2": 0}
+        jql = mock_client.search_issues.call_args[0][0]
+        assert jql == 'statusCategory != Done AND assignee in ("user-1", "user-2")'
+
+    @patch.object(JiraIntegrationService, "get_jira_client")
+    def test_repeat_lookup_served_from_cache_until_cleared(
+        self, mock_get_client: MagicMock, service: JiraIntegrationService
+    ) -> None:
+        mock_client = MagicMock()
+        mock_client._options = {"server": "https://api.atlassian.com/ex/jira/cloud-123"}
+        mock_client.search_issues.return_value = _ResultPage(
+            [_assigned_issue("user-1")], total=1
+        )
+        mock_get_client.return_value = mock_client
+
+        first = service.get_live_assignee_workload_map(["user-1"])
+        first["user-1"] = 99
+        second = service.get_live_assignee_workload_map(["user-1"])
+
+        assert second == {"user-1": 1}
+        assert mock_client.search_issues.call_count == 1
+
+        clear_jira_workload_cache()
+        service.get_live_assignee_workload_map(["user-1"])
+
+        assert mock_client.search_issues.call_count == 2
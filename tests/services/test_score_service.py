@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from pgvector import HalfVector  # type: ignore[import-untyped]
 
 from app.api.score.score_schema import BestFitInput, PrScoreInfo
 from app.api.score.score_service import ScoreService
@@ -240,6 +241,24 @@ class TestCalculateDeveloperGithubScore:
 
         assert len(prs) <= 3
 
+    def test_fetches_only_scored_columns(
+        self, service: ScoreService, mock_db: MagicMock
+    ) -> None:
+        mock_db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = []
+
+        service._calculate_developer_github_score(
+            github_id=42, task_embedding=[0.1, 0.2], threshold=50
+        )
+
+        columns = [column.key for column in mock_db.query.call_args[0]]
+        assert columns == ["pr_id", "pr_title", "pr_url", "pr_description", "embedding"]
+
+    def test_embedding_tensor_widens_halfvec(self) -> None:
+        tensor = ScoreService._embedding_tensor(HalfVector([0.5, 0.25, -1.0]))
+
+        assert str(tensor.dtype) == "torch.float32"
+        assert tensor.tolist() == [0.5, 0.25, -1.0]
+
 
 # ===================================================================
 # 4. Get best fits
@@ -275,7 +294,7 @@ class TestGetBestFits:
         mock_db.query.return_value.all.return_value = profiles
 
         mock_embed = MagicMock()
-        mock_embed.generate_embeddings.return_value = [[0.1, 0.2, 0.3]]
+        mock_embed.embed_query.return_value = [0.1, 0.2, 0.3]
         mock_embed_cls.return_value = mock_embed
 
         mock_db.execute.return_value.scalar.return_value = "Test User"
@@ -312,7 +331,7 @@ class TestGetBestFits:
         mock_db.query.return_value.all.return_value = profiles
 
         mock_embed = MagicMock()
-        mock_embed.generate_embeddings.return_value = [[0.1, 0.2]]
+        mock_embed.embed_query.return_value = [0.1, 0.2]
         mock_embed_cls.return_value = mock_embed
 
         mock_db.execute.return_value.scalar.return_value = "User"
@@ -336,7 +355,7 @@ class TestGetBestFits:
         mock_db.query.return_value.all.return_value = profiles
 
         mock_embed = MagicMock()
-        mock_embed.generate_embeddings.return_value = [[0.1, 0.2]]
+        mock_embed.embed_query.return_value = [0.1, 0.2]
         mock_embed_cls.return_value = mock_embed
 
         mock_db.execute.return_value.scalar.return_value = "User"
@@ -362,7 +381,7 @@ class TestGetBestFits:
         mock_db.query.return_value.all.return_value = profiles
 
         mock_embed = MagicMock()
-        mock_embed.generate_embeddings.return_value = [[0.1, 0.2]]
+        mock_embed.embed_query.return_value = [0.1, 0.2]
         mock_embed_cls.return_value = mock_embed
 
         mock_db.execute.return_value.scalar.return_value = "User"
@@ -390,7 +409,7 @@ class TestGetBestFits:
         mock_db.query.return_value.all.return_value = profiles
 
         mock_embed = MagicMock()
-        mock_embed.generate_embeddings.return_value = [[0.1]]
+        mock_embed.embed_query.return_value = [0.1]
         mock_embed_cls.return_value = mock_embed
 
         mock_db.execute.return_value.scalar.return_value = "Alice"
@@ -428,7 +447,7 @@ class TestGetBestFits:
         mock_db.query.return_value.all.return_value = profiles
 
         mock_embed = MagicMock()
-        mock_embed.generate_embeddings.return_value = [[0.1]]
+        mock_embed.embed_query.return_value = [0.1]
         mock_embed_cls.return_value = mock_embed
 
         mock_db.execute.return_value.scalar.return_value = "Alice"
@@ -464,7 +483,7 @@ class TestGetBestFits:
         mock_db.query.return_value.all.return_value = profiles
 
         mock_embed = MagicMock()
-        mock_embed.generate_embeddings.return_value = [[0.1]]
+        mock_embed.embed_query.return_value = [0.1]
         mock_embed_cls.return_value = mock_embed
 
         mock_db.execute.return_value.scalar.return_value = "Alice"
@@ -500,7 +519,7 @@ class TestGetBestFits:
         mock_db.query.return_value.all.return_value = profiles
 
         mock_embed = MagicMock()
-        mock_embed.generate_embeddings.return_value = [[0.1]]
+        mock_embed.embed_query.return_value = [0.1]
         mock_embed_cls.return_value = mock_embed
 
         mock_db.execute.return_value.scalar.return_value = "Alice"
@@ -537,7 +556,7 @@ class TestGetBestFits:
         mock_db.query.return_value.all.return_value = profiles
 
         mock_embed = MagicMock()
-        mock_embed.generate_embeddings.return_value = [[0.1]]
+        mock_embed.embed_query.return_value = [0.1]
         mock_embed_cls.return_value = mock_embed
         mock_db.execute.return_value.scalar.return_value = "Dev"
         mock_calc_score.return_value = (0.0, [])
@@ -0,0 +1,105 @@
+"""Unit tests for SimilaritySearchService.
+
+The session is mocked; tests inspect the SQL compiled for Postgres.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import app.db.base  # noqa: F401  # register all mappers before compiling
+from app.api.embedding.similarity_search_service import SimilaritySearchService
+
+
+@pytest.fixture()
+def service() -> SimilaritySearchService:
+    return SimilaritySearchService(MagicMock())
+
+
+def _compiled_sql(service: SimilaritySearchService) -> str:
+    query = service.db.execute.call_args[0][0]  # type: ignore[attr-defined]
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+class TestUnifiedSearch:
+    def test_single_union_query_across_sources(
+        self, service: SimilaritySearchService
+    ) -> None:
+        service.db.execute.return_value.mappings.return_value = [  # type: ignore[attr-defined]
+            {"source": "jira", "id": "10001", "distance": 0.1},
+            {"source": "github", "id": "42", "distance": 0.2},
+        ]
+
+        results = service.unified_search([0.1, 0.2, 0.3], 5)
+
+        assert [r["id"] for r in results] == ["10001", "42"]
+        service.db.execute.assert_called_once()  # type: ignore[attr-defined]
+        sql = _compiled_sql(service)
+        assert "UNION ALL" in sql
+        assert "FROM github_pr_vectors" in sql
+        assert "FROM jira_issue_vectors" in sql
+        assert ") AS matches ORDER BY matches.distance" in sql
+
+    def test_filters_apply_to_their_source(
+        self, service: SimilaritySearchService
+    ) -> None:
+        service.unified_search(
+            [0.1],
+            3,
+            github_author_login="alice",
+            jira_project_key="PROJ",
+            jira_assignee_id="acc-1",
+        )
+
+        sql = _compiled_sql(service)
+        assert "github_pr_vectors.author_login = " in sql
+        assert "jira_issue_vectors.project_key = " in sql
+        assert "jira_issue_vectors.assignee_account_id = " in sql
+
+    def test_single_source_skips_other_table(
+        self, service: SimilaritySearchService
+    ) -> None:
+        service.unified_search([0.1], 3, search_jira=False)
+
+        sql = _compiled_sql(service)
+        assert "github_pr_vectors" in sql
+        assert "jira_issue_vectors" not in sql
+
+    def test_no_sources_returns_empty(self, service: SimilaritySearchService) -> None:
+        assert service.unified_search([0.1], 3, search_github=False, search_jira=False) == []
+        service.db.execute.assert_not_called()  # type: ignore[attr-defined]
+
+
+class TestUnifiedSearchBatch:
+    def test_one_query_for_all_embeddings(
+        self, service: SimilaritySearchService
+    ) -> None:
+        service.db.execute.return_value.mappings.return_value = [  # type: ignore[attr-defined]
+            {"source": "jira", "id": "10001", "distance": 0.1, "query_index": 0},
+            {"source": "github", "id": "42", "distance": 0.3, "query_index": 0},
+            {"source": "github", "id": "7", "distance": 0.2, "query_index": 2},
+        ]
+
+        results = service.unified_search_batch([[0.1], [0.2], [0.3]], 2)
+
+        assert [[r["id"] for r in matches] for matches in results] == [
+            ["10001", "42"],
+            [],
+            ["7"],
+        ]
+        assert "query_index" not in results[0][0]
+        service.db.execute.assert_called_once()  # type: ignore[attr-defined]
+        sql = _compiled_sql(service)
+        assert sql.count("FROM jira_issue_vectors") == 3
+        assert "ORDER BY batch.query_index, batch.distance" in sql
+
+    def test_no_sources_returns_empty_per_query(
+        self, service: SimilaritySearchService
+    ) -> None:
+        results = service.unified_search_batch(
+            [[0.1], [0.2]], 3, search_github=False, search_jira=False
+        )
+
+        assert results == [[], []]
+        service.db.execute.assert_not_called()  # type: ignore[attr-defined]